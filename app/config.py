@@ -19,10 +19,50 @@ class Settings(BaseSettings):
 
     embedding_provider: str = "local"
     openai_api_key: str | None = None
+    openai_base_url: str | None = None
+    openai_max_concurrency: int = 4
+    openai_requests_per_minute: int = 3000
+    openai_tokens_per_minute: int = 1_000_000
+    openai_batch_max_tokens: int = 100_000
+    openai_max_retries: int = 5
     embedding_model: str = "sentence-transformers/all-MiniLM-L6-v2"
+    embedding_model_file: str | None = None
+    embedding_dimensions: int | None = None
+    embedding_workers: int = 0
+    embedder_ready_timeout: float = 60.0
+
+    embedding_server_url: str = "http://localhost:8200"
+    embedding_server_socket: str | None = None
+    embedding_server_provider: str = "local"
+    embedding_server_max_batch_size: int = 64
+    embedding_server_max_wait_ms: int = 5
+    embedding_threads_per_worker: int = 1
 
     chunk_size: int = 1000
     chunk_overlap: int = 150
+    chunk_max_tokens: int = 256
+    chunk_overlap_tokens: int = 32
+
+    text_cache_enabled: bool = True
+
+    ingestion_events_poll_interval: float = 5.0
+    cancellation_poll_interval: float = 2.0
+    ingestion_progress_batch_size: int = 50
+    ingestion_progress_max_lag: float = 2.0
+
+    log_retention_info_days: int = 30
+    log_retention_warning_days: int = 90
+    log_retention_error_days: int = 365
+    log_retention_high_volume_days: int = 7
+    logs_timeseries_enabled: bool = False
+    log_rollup_enabled: bool = True
+    log_rollup_interval: float = 3600.0
+    query_plan_check_enabled: bool = True
+
+    metrics_enabled: bool = True
+    tracing_enabled: bool = False
+    tracing_exporter: str = "console"
+    tracing_service_name: str = "cetec-assistant"
 
     model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8")
 
@@ -35,6 +75,116 @@ class Settings(BaseSettings):
             raise ValueError("max_file_size cannot exceed 1GB")
         return v
 
+    @field_validator("embedding_provider")
+    @classmethod
+    def validate_embedding_provider(cls, v: str) -> str:
+        allowed = {"local", "onnx", "openvino", "openai", "remote"}
+        if v not in allowed:
+            raise ValueError(f"embedding_provider must be one of: {', '.join(sorted(allowed))}")
+        return v
+
+    @field_validator(
+        "openai_max_concurrency",
+        "openai_requests_per_minute",
+        "openai_tokens_per_minute",
+        "openai_batch_max_tokens"
+    )
+    @classmethod
+    def validate_openai_limits(cls, v: int) -> int:
+        if v <= 0:
+            raise ValueError("OpenAI concurrency and rate limits must be positive")
+        return v
+
+    @field_validator("openai_max_retries")
+    @classmethod
+    def validate_openai_max_retries(cls, v: int) -> int:
+        if v < 0:
+            raise ValueError("openai_max_retries cannot be negative")
+        return v
+
+    @field_validator("embedding_server_provider")
+    @classmethod
+    def validate_embedding_server_provider(cls, v: str) -> str:
+        allowed = {"local", "onnx", "openvino", "openai"}
+        if v not in allowed:
+            raise ValueError(f"embedding_server_provider must be one of: {', '.join(sorted(allowed))}")
+        return v
+
+    @field_validator("embedding_server_max_batch_size")
+    @classmethod
+    def validate_embedding_server_max_batch_size(cls, v: int) -> int:
+        if v <= 0:
+            raise ValueError("embedding_server_max_batch_size must be positive")
+        return v
+
+    @field_validator("embedding_server_max_wait_ms")
+    @classmethod
+    def validate_embedding_server_max_wait_ms(cls, v: int) -> int:
+        if v < 0:
+            raise ValueError("embedding_server_max_wait_ms cannot be negative")
+        return v
+
+    @field_validator("embedding_dimensions")
+    @classmethod
+    def validate_embedding_dimensions(cls, v: int | None) -> int | None:
+        if v is not None and v <= 0:
+            raise ValueError("embedding_dimensions must be positive")
+        return v
+
+    @field_validator("embedding_workers")
+    @classmethod
+    def validate_embedding_workers(cls, v: int) -> int:
+        if v < 0:
+            raise ValueError("embedding_workers cannot be negative")
+        return v
+
+    @field_validator("embedding_threads_per_worker")
+    @classmethod
+    def validate_embedding_threads_per_worker(cls, v: int) -> int:
+        if v <= 0:
+            raise ValueError("embedding_threads_per_worker must be positive")
+        return v
+
+    @field_validator("ingestion_progress_batch_size")
+    @classmethod
+    def validate_ingestion_progress_batch_size(cls, v: int) -> int:
+        if v <= 0:
+            raise ValueError("ingestion_progress_batch_size must be positive")
+        return v
+
+    @field_validator("ingestion_progress_max_lag")
+    @classmethod
+    def validate_ingestion_progress_max_lag(cls, v: float) -> float:
+        if v < 0:
+            raise ValueError("ingestion_progress_max_lag cannot be negative")
+        return v
+
+    @field_validator(
+        "log_retention_info_days",
+        "log_retention_warning_days",
+        "log_retention_error_days",
+        "log_retention_high_volume_days"
+    )
+    @classmethod
+    def validate_log_retention_days(cls, v: int) -> int:
+        if v <= 0:
+            raise ValueError("Log retention must be a positive number of days")
+        return v
+
+    @field_validator("log_rollup_interval")
+    @classmethod
+    def validate_log_rollup_interval(cls, v: float) -> float:
+        if v <= 0:
+            raise ValueError("log_rollup_interval must be positive")
+        return v
+
+    @field_validator("ingestion_events_poll_interval", "cancellation_poll_interval")
+    @classmethod
+    def validate_poll_interval(cls, v: float) -> float:
+        if v <= 0:
+            raise ValueError("Poll intervals must be positive")
+        return v
+
     @field_validator("chunk_size")
     @classmethod
     def validate_chunk_size(cls, v: int) -> int:
@@ -51,12 +201,39 @@ class Settings(BaseSettings):
             raise ValueError("chunk_overlap cannot be negative")
         return v
 
+    @field_validator("chunk_max_tokens")
+    @classmethod
+    def validate_chunk_max_tokens(cls, v: int) -> int:
+        if v <= 0:
+            raise ValueError("chunk_max_tokens must be positive")
+        return v
+
+    @field_validator("chunk_overlap_tokens")
+    @classmethod
+    def validate_chunk_overlap_tokens(cls, v: int) -> int:
+        if v < 0:
+            raise ValueError("chunk_overlap_tokens cannot be negative")
+        return v
+
+    @field_validator("tracing_exporter")
+    @classmethod
+    def validate_tracing_exporter(cls, v: str) -> str:
+        allowed = {"console", "otlp"}
+        if v not in allowed:
+            raise ValueError(f"tracing_exporter must be one of: {', '.join(sorted(allowed))}")
+        return v
+
     def model_post_init(self, __context) -> None:
         """Validate relationships between fields after all fields are set"""
         if self.chunk_overlap >= self.chunk_size:
             raise ValueError(
                 f"chunk_overlap ({self.chunk_overlap}) must be less than chunk_size ({self.chunk_size})"
             )
+        if self.chunk_overlap_tokens >= self.chunk_max_tokens:
+            raise ValueError(
+                f"chunk_overlap_tokens ({self.chunk_overlap_tokens}) must be less than "
+                f"chunk_max_tokens ({self.chunk_max_tokens})"
+            )
 
 
 def load_settings() -> Settings:
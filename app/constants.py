@@ -5,3 +5,22 @@ Shared constants used across the application.
 # Regex pattern for validating course codes
 # Course codes should be 2-20 characters, containing only uppercase letters, numbers, and hyphens
 COURSE_CODE_PATTERN = r"^[A-Z0-9\-]{2,20}$"
+
+# Page sizes for the paginated list endpoints (limit query parameter)
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+LIMIT_DESCRIPTION = (
+    f"Maximum items to return; defaults to {DEFAULT_PAGE_SIZE}, or to all remaining "
+    "items when streaming NDJSON (Accept: application/x-ndjson)"
+)
+
+# Routine log events written on almost every request; they are rolled up into
+# hourly counts in log_rollups and their raw entries expire early
+HIGH_VOLUME_LOG_EVENTS = [
+    "auth_success",
+    "documents_listed",
+    "document_accessed",
+    "ingestion_list_viewed",
+    "ingestion_status_viewed",
+    "ingestion_status_streamed",
+]
@@ -1,16 +1,59 @@
-from pymongo import MongoClient
+import logging
+
+from pymongo import ASCENDING, DESCENDING, MongoClient
 from pymongo.database import Database
+from pymongo.errors import OperationFailure, PyMongoError
 
 from app.config import settings
+from app.constants import HIGH_VOLUME_LOG_EVENTS
+from app.metrics import MongoCommandMetrics
+from app.models.ingestion import IngestionStatus
+from app.tracing import configure_tracing
+
+logger = logging.getLogger(__name__)
+
 
+# Registers the pymongo tracing listener, which only applies to clients created afterwards
+configure_tracing()
 
 _client = MongoClient(
     settings.mongodb_uri,
     maxPoolSize=10,
     minPoolSize=1,
     serverSelectionTimeoutMS=5000,
+    event_listeners=[MongoCommandMetrics()] if settings.metrics_enabled else [],
 )
 
+# MongoDB error code for dropping an index that does not exist
+INDEX_NOT_FOUND = 27
+
+SECONDS_PER_DAY = 86400
+
+# Indexes of earlier versions that no query needs any more and that only slow
+# down writes, dropped at startup. The course_code indexes are prefixes of the
+# compound indexes that replaced them.
+OBSOLETE_INDEXES = {
+    "documents": ["course_code_1"],
+    "ingestion_jobs": ["course_code_1", "created_at_-1", "active_jobs"],
+    "log_rollups": ["event_type_1_hour_-1"],
+}
+
+# The query shapes the indexes are built for, checked with explain() at startup:
+# (collection, filter, sort). Filter values are placeholders; only the shape matters.
+CANONICAL_QUERIES = [
+    ("users", {"email": ""}, None),
+    ("courses", {"code": ""}, None),
+    ("documents", {"document_id": ""}, None),
+    ("documents", {"course_code": "", "status": ""}, None),
+    ("documents", {"course_code": ""}, [("upload_timestamp", ASCENDING), ("document_id", ASCENDING)]),
+    ("ingestion_jobs", {"job_id": "", "status": IngestionStatus.QUEUED.value}, None),
+    ("ingestion_jobs", {"course_code": ""}, [("created_at", DESCENDING), ("job_id", DESCENDING)]),
+    ("logs", {}, [("timestamp", DESCENDING)]),
+    ("log_rollups", {}, [("hour", DESCENDING)]),
+    ("profiles", {"job_id": "", "status": ""}, None),
+    ("profiles", {}, [("created_at", DESCENDING), ("profile_id", DESCENDING)]),
+]
+
 
 def get_database() -> Database:
     return _client[settings.mongodb_database]
@@ -19,10 +62,181 @@ def get_database() -> Database:
 def ensure_indexes() -> None:
     db = get_database()
     db.users.create_index("email", unique=True)
-    db.logs.create_index([("timestamp", -1)])
     db.courses.create_index("code", unique=True)
+
     db.documents.create_index("document_id", unique=True)
-    db.documents.create_index("course_code")
+    # Documents to ingest: {course_code, status}
+    db.documents.create_index([("course_code", ASCENDING), ("status", ASCENDING)])
+    # Document listing: {course_code} in upload order
+    db.documents.create_index([("course_code", ASCENDING), ("upload_timestamp", ASCENDING), ("document_id", ASCENDING)])
+
+    # Also serves the claim, {job_id, status}: job_id alone identifies the job
     db.ingestion_jobs.create_index("job_id", unique=True)
-    db.ingestion_jobs.create_index("course_code")
-    db.ingestion_jobs.create_index([("created_at", -1)])
+    # Job listing: {course_code} newest first
+    db.ingestion_jobs.create_index([("course_code", ASCENDING), ("created_at", DESCENDING), ("job_id", DESCENDING)])
+
+    timeseries = _ensure_logs_collection(db)
+    db.logs.create_index([("timestamp", DESCENDING)])
+    _ensure_log_retention(db, timeseries)
+
+    # The rollup's $merge key, also serving its lookup of the latest rolled-up hour
+    db.log_rollups.create_index(
+        [("hour", ASCENDING), ("event_type", ASCENDING), ("level", ASCENDING)],
+        unique=True
+    )
+
+    db.profiles.create_index("profile_id", unique=True)
+    # Arming lookup, {job_id, status}, and a job's profiles newest first
+    db.profiles.create_index([("job_id", ASCENDING), ("created_at", DESCENDING), ("profile_id", DESCENDING)])
+    # All profiles newest first
+    db.profiles.create_index([("created_at", DESCENDING), ("profile_id", DESCENDING)])
+
+    _drop_obsolete_indexes(db)
+
+
+def _drop_obsolete_indexes(db: Database) -> None:
+    for collection, names in OBSOLETE_INDEXES.items():
+        existing = db[collection].index_information()
+        for name in names:
+            if name not in existing:
+                continue
+            try:
+                db[collection].drop_index(name)
+            except OperationFailure as e:
+                # Another worker starting at the same time dropped it first
+                if e.code != INDEX_NOT_FOUND:
+                    raise
+
+
+def _log_retention_by_level() -> dict[str, int]:
+    return {
+        "info": settings.log_retention_info_days,
+        "warning": settings.log_retention_warning_days,
+        "error": settings.log_retention_error_days,
+    }
+
+
+def _ensure_logs_collection(db: Database) -> bool:
+    """
+    Create logs as a time-series collection when enabled and it does not exist
+    yet. Returns whether logs is a time-series collection.
+    """
+    existing = list(db.list_collections(filter={"name": "logs"}))
+    if existing:
+        timeseries = existing[0].get("type") == "timeseries"
+        if settings.logs_timeseries_enabled and not timeseries:
+            logger.warning(
+                "LOGS_TIMESERIES_ENABLED is set but logs is a regular collection; "
+                "existing collections cannot be converted"
+            )
+        return timeseries
+
+    if not settings.logs_timeseries_enabled:
+        return False
+
+    db.create_collection(
+        "logs",
+        timeseries={"timeField": "timestamp", "metaField": "level", "granularity": "seconds"},
+        # Upper bound; levels with shorter retention expire through partial TTL indexes
+        expireAfterSeconds=max(_log_retention_by_level().values()) * SECONDS_PER_DAY
+    )
+    return True
+
+
+def _ensure_log_retention(db: Database, timeseries: bool) -> None:
+    """
+    Expire log entries per level with partial TTL indexes, and routine
+    high-volume events sooner once they have been rolled up into hourly counts.
+    An entry expires as soon as any index covering it says so.
+    """
+    # Superseded by the per-level indexes below
+    if "timestamp_ttl" in db.logs.index_information():
+        db.logs.drop_index("timestamp_ttl")
+
+    for level, days in _log_retention_by_level().items():
+        _ensure_ttl_index(db, "logs", f"timestamp_ttl_{level}", days * SECONDS_PER_DAY, {"level": level})
+
+    if timeseries:
+        # Time-series TTL filters may only use the metaField (level)
+        return
+    _ensure_ttl_index(
+        db,
+        "logs",
+        "timestamp_ttl_high_volume",
+        settings.log_retention_high_volume_days * SECONDS_PER_DAY,
+        {"event_type": {"$in": HIGH_VOLUME_LOG_EVENTS}}
+    )
+
+
+def _ensure_ttl_index(
+    db: Database,
+    collection: str,
+    name: str,
+    expire_after_seconds: int,
+    partial_filter: dict
+) -> None:
+    """
+    Create a partial TTL index on timestamp. An existing index with a different
+    expiry is updated in place with collMod; one with a different key or filter
+    (e.g. after HIGH_VOLUME_LOG_EVENTS changed) is dropped and recreated.
+    """
+    existing = db[collection].index_information().get(name)
+    if existing is not None and (
+        existing["key"] != [("timestamp", ASCENDING)]
+        or existing.get("partialFilterExpression") != partial_filter
+    ):
+        try:
+            db[collection].drop_index(name)
+        except OperationFailure as e:
+            # Another worker starting at the same time dropped it first
+            if e.code != INDEX_NOT_FOUND:
+                raise
+        existing = None
+
+    if existing is None:
+        db[collection].create_index(
+            "timestamp",
+            name=name,
+            expireAfterSeconds=expire_after_seconds,
+            partialFilterExpression=partial_filter
+        )
+    elif existing.get("expireAfterSeconds") != expire_after_seconds:
+        db.command("collMod", collection, index={"name": name, "expireAfterSeconds": expire_after_seconds})
+
+
+def check_query_plans() -> list[str]:
+    """
+    Explain each canonical query and warn about those the planner would answer
+    with a collection scan, e.g. because an index is missing or was dropped.
+    Returns the offending queries.
+    """
+    db = get_database()
+    collection_scans = []
+    for collection, query, sort in CANONICAL_QUERIES:
+        command = {"find": collection, "filter": query, "limit": 1}
+        if sort:
+            command["sort"] = dict(sort)
+        try:
+            explanation = db.command("explain", command, verbosity="queryPlanner")
+        except PyMongoError as e:
+            logger.warning(f"Could not explain query on {collection} {query}: {str(e)}")
+            continue
+
+        if _has_stage(explanation["queryPlanner"]["winningPlan"], "COLLSCAN"):
+            description = f"{collection} {query}" + (f" sorted by {sort}" if sort else "")
+            logger.warning(f"Query uses a collection scan: {description}")
+            collection_scans.append(description)
+    return collection_scans
+
+
+def _has_stage(plan: dict | list, stage: str) -> bool:
+    # Plans nest input stages under inputStage/inputStages (and queryPlan on newer servers)
+    if isinstance(plan, list):
+        return any(_has_stage(item, stage) for item in plan)
+    if plan.get("stage") == stage:
+        return True
+    return any(
+        _has_stage(value, stage)
+        for value in plan.values()
+        if isinstance(value, (dict, list))
+    )
@@ -3,8 +3,8 @@ from typing import TYPE_CHECKING
 from fastapi import Depends, Request
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from pymongo.database import Database
-from qdrant_client import QdrantClient
 
+from app.config import settings
 from app.database import get_database
 from app.exceptions import AuthenticationError, UnregisteredUserError, ForbiddenError
 from app.models.user import UserResponse
@@ -13,18 +13,22 @@ from app.services.user import get_user_by_email
 from app.services.log import log_event
 
 if TYPE_CHECKING:
+    from qdrant_client import QdrantClient
     from app.services.embedder import BaseEmbedder
 
 
 security = HTTPBearer()
 
 
-def get_embedder(request: Request) -> "BaseEmbedder":
-    """Dependency to get the embedder instance from app state."""
-    return request.app.state.embedder
+async def get_embedder(request: Request) -> "BaseEmbedder":
+    """
+    Dependency to get the embedder instance from app state, waiting for the
+    background model load to finish if needed.
+    """
+    return await request.app.state.embedder_loader.wait(settings.embedder_ready_timeout)
 
 
-def get_qdrant_client(request: Request) -> QdrantClient:
+def get_qdrant_client(request: Request) -> "QdrantClient":
     """Dependency to get the Qdrant client instance from app state."""
     return request.app.state.qdrant_client
 
@@ -0,0 +1,142 @@
+"""
+Standalone embedding server.
+
+Hosts one copy of the embedding model that every API worker shares through
+RemoteEmbedder (EMBEDDING_PROVIDER=remote), instead of each uvicorn worker
+loading its own. Run it on a Unix socket or a local port:
+
+    uvicorn app.embedding_server:app --uds /tmp/cetec-embeddings.sock
+    uvicorn app.embedding_server:app --port 8200
+
+Concurrent requests are coalesced into shared model batches of up to
+EMBEDDING_SERVER_MAX_BATCH_SIZE texts, waiting at most
+EMBEDDING_SERVER_MAX_WAIT_MS for more requests to arrive.
+"""
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING
+
+from fastapi import FastAPI, Request, Response
+
+from app.config import settings
+from app.handlers import register_exception_handlers
+from app.metrics import EMBEDDING_SERVER_QUEUE_DEPTH, MetricsMiddleware, track_embedding_batch
+from app.models.embedding import EmbedRequest, EmbedderInfo
+from app.routers import metrics
+from app.services.embedder import BaseEmbedder, create_embedder
+
+if TYPE_CHECKING:
+    import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class DynamicBatcher:
+    """Queues embedding requests and runs them through the model in shared batches."""
+
+    def __init__(self, embedder: BaseEmbedder, max_batch_size: int, max_wait: float):
+        self.embedder = embedder
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.queue: asyncio.Queue = asyncio.Queue()
+
+    async def embed(self, texts: list[str]) -> "np.ndarray":
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((texts, future))
+        EMBEDDING_SERVER_QUEUE_DEPTH.set(self.queue.qsize())
+        return await future
+
+    async def run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self.queue.get()]
+            total = len(batch[0][0])
+            deadline = loop.time() + self.max_wait
+
+            while total < self.max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self.queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                batch.append(item)
+                total += len(item[0])
+
+            EMBEDDING_SERVER_QUEUE_DEPTH.set(self.queue.qsize())
+            texts = [text for item_texts, _ in batch for text in item_texts]
+            try:
+                with track_embedding_batch(len(texts)):
+                    vectors = await asyncio.to_thread(self.embedder.embed_batch, texts)
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            offset = 0
+            for item_texts, future in batch:
+                if not future.done():
+                    future.set_result(vectors[offset:offset + len(item_texts)])
+                offset += len(item_texts)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    logger.info("Loading embedding model...")
+    embedder = create_embedder(provider=settings.embedding_server_provider)
+    app.state.embedder = embedder
+    logger.info(f"Embedder initialized (dimension: {embedder.get_dimension()})")
+
+    batcher = DynamicBatcher(
+        embedder,
+        max_batch_size=settings.embedding_server_max_batch_size,
+        max_wait=settings.embedding_server_max_wait_ms / 1000
+    )
+    app.state.batcher = batcher
+    batcher_task = asyncio.create_task(batcher.run())
+
+    yield
+
+    batcher_task.cancel()
+    embedder.close()
+
+
+app = FastAPI(lifespan=lifespan)
+
+if settings.metrics_enabled:
+    app.add_middleware(MetricsMiddleware)
+
+register_exception_handlers(app)
+
+if settings.metrics_enabled:
+    app.include_router(metrics.router)
+
+
+@app.get("/health")
+async def health_check() -> dict[str, str]:
+    return {"status": "healthy"}
+
+
+@app.get("/info")
+async def get_info(request: Request) -> EmbedderInfo:
+    embedder = request.app.state.embedder
+    return EmbedderInfo(
+        model=settings.embedding_model,
+        dimension=embedder.get_dimension(),
+        max_tokens=embedder.get_max_tokens(),
+        tokenizer=embedder.get_tokenizer_name()
+    )
+
+
+@app.post("/embed")
+async def embed(embed_request: EmbedRequest, request: Request) -> Response:
+    """Returns the embeddings as raw little-endian float32 bytes, row-major."""
+    vectors = await request.app.state.batcher.embed(embed_request.texts)
+    return Response(
+        content=vectors.astype("<f4", copy=False).tobytes(),
+        media_type="application/octet-stream",
+        headers={"X-Embedding-Shape": f"{vectors.shape[0]},{vectors.shape[1]}"}
+    )
@@ -46,6 +46,11 @@ class FileTooLargeError(Exception):
     pass
 
 
+class InvalidCursorError(Exception):
+    """Exception for pagination cursors that do not match an item."""
+    pass
+
+
 class IngestionJobNotFoundError(Exception):
     pass
 
@@ -54,6 +59,20 @@ class IngestionJobError(Exception):
     pass
 
 
+class ProfileNotFoundError(Exception):
+    pass
+
+
+class ProfilerBusyError(Exception):
+    """Exception for a profile requested while this worker is already running one."""
+    pass
+
+
+class ProfileJobNotRunnableError(Exception):
+    """Exception for a job profile armed for a job that will not run again."""
+    pass
+
+
 class PDFExtractionError(Exception):
     pass
 
@@ -62,6 +81,11 @@ class EmbeddingError(Exception):
     pass
 
 
+class EmbedderNotReadyError(Exception):
+    """Exception for requests that need the embedder while the model is still loading."""
+    pass
+
+
 class VectorStoreError(Exception):
     pass
 
@@ -14,10 +14,15 @@ from app.exceptions import (
     DocumentUploadError,
     DocumentDeleteError,
     FileTooLargeError,
+    InvalidCursorError,
     IngestionJobNotFoundError,
     IngestionJobError,
+    ProfileNotFoundError,
+    ProfilerBusyError,
+    ProfileJobNotRunnableError,
     PDFExtractionError,
     EmbeddingError,
+    EmbedderNotReadyError,
     VectorStoreError,
     StorageUploadError,
     StorageDownloadError,
@@ -49,9 +54,14 @@ EXCEPTION_HANDLERS = {
     DocumentUploadError: 500,
     DocumentDeleteError: 500,
     FileTooLargeError: 413,
+    InvalidCursorError: 400,
     IngestionJobError: 500,
+    ProfileNotFoundError: 404,
+    ProfilerBusyError: 409,
+    ProfileJobNotRunnableError: 409,
     PDFExtractionError: 500,
     EmbeddingError: 500,
+    EmbedderNotReadyError: 503,
     VectorStoreError: 500,
     StorageUploadError: 500,
     StorageDownloadError: 500,
@@ -1,16 +1,24 @@
+import asyncio
 import logging
 import sys
 from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.config import settings
-from app.database import ensure_indexes, get_database
+from app.database import check_query_plans, ensure_indexes, get_database
 from app.handlers import register_exception_handlers
-from app.routers import health, users, courses, documents, ingestions
-from app.services.embedder import create_embedder
+from app.metrics import MetricsMiddleware
+from app.routers import health, metrics, users, courses, documents, ingestions, profiles
+from app.services.embedder import BaseEmbedder, EmbedderLoader, create_embedder
+from app.services.log_rollup import run_log_rollups
 from app.services.qdrant import create_qdrant_client, ensure_collection_exists
+from app.tracing import instrument_app
+
+if TYPE_CHECKING:
+    from qdrant_client import QdrantClient
 
 logger = logging.getLogger(__name__)
 
@@ -51,6 +59,20 @@ def validate_startup_config() -> None:
     logger.info("Startup validation passed")
 
 
+def load_embedder(qdrant_client: "QdrantClient") -> BaseEmbedder:
+    """Create the embedder and make sure the Qdrant collection matches its dimension."""
+    try:
+        embedder = create_embedder()
+        logger.info(f"Embedder initialized (dimension: {embedder.get_dimension()})")
+
+        ensure_collection_exists(qdrant_client, embedder.get_dimension())
+        logger.info("Qdrant collection ready")
+    except Exception as e:
+        logger.error(f"Embedding model failed to load: {str(e)}")
+        raise
+    return embedder
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
@@ -60,29 +82,36 @@ async def lifespan(app: FastAPI):
 
     validate_startup_config()
     ensure_indexes()
-
-    logger.info("Loading embedding model...")
-    embedder = create_embedder()
-    app.state.embedder = embedder
-    logger.info(f"Embedder initialized (dimension: {embedder.get_dimension()})")
+    if settings.query_plan_check_enabled:
+        check_query_plans()
 
     logger.info("Connecting to Qdrant...")
     qdrant_client = create_qdrant_client()
     app.state.qdrant_client = qdrant_client
     logger.info("Qdrant client initialized")
 
-    ensure_collection_exists(qdrant_client, embedder.get_dimension())
-    logger.info("Qdrant collection ready")
+    logger.info("Loading embedding model in the background...")
+    embedder_loader = EmbedderLoader(lambda: load_embedder(qdrant_client))
+    embedder_loader.start()
+    app.state.embedder_loader = embedder_loader
+
+    log_rollup_task = None
+    if settings.log_rollup_enabled:
+        log_rollup_task = asyncio.create_task(run_log_rollups(get_database(), settings.log_rollup_interval))
 
     logger.info("Application startup complete")
 
     yield
 
     logger.info("Shutting down application...")
+    if log_rollup_task is not None:
+        log_rollup_task.cancel()
+    await embedder_loader.close()
     logger.info("Application shutdown complete")
 
 
 app = FastAPI(lifespan=lifespan)
+instrument_app(app)
 
 app.add_middleware(
     CORSMiddleware,
@@ -92,11 +121,17 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+if settings.metrics_enabled:
+    app.add_middleware(MetricsMiddleware)
+
 register_exception_handlers(app)
 
 app.include_router(health.router)
+if settings.metrics_enabled:
+    app.include_router(metrics.router)
 app.include_router(users.router)
 app.include_router(courses.router)
 app.include_router(documents.router)
 app.include_router(ingestions.router)
+app.include_router(profiles.router)
 
@@ -0,0 +1,179 @@
+"""
+Prometheus metrics for the API and the embedding server, served at GET /metrics
+when METRICS_ENABLED is set.
+
+Rates are derived at query time, e.g. embedding throughput in chunks/sec:
+
+    rate(embedded_chunks_total[5m]) / rate(embedding_batch_duration_seconds_sum[5m])
+
+With several uvicorn workers, set PROMETHEUS_MULTIPROC_DIR to an empty directory
+shared by the workers so that /metrics aggregates all of them.
+"""
+import os
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+)
+from pymongo import monitoring
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.tracing import span
+
+METRICS_CONTENT_TYPE = CONTENT_TYPE_LATEST
+
+# Requests that match no route share one label, so scanners cannot grow the series count
+UNMATCHED_ROUTE = "unmatched"
+
+HTTP_REQUEST_SECONDS = Histogram(
+    "http_request_duration_seconds",
+    "Time from receiving a request to sending the last byte of its response",
+    ["method", "route", "status"]
+)
+
+DEPENDENCY_CALL_SECONDS = Histogram(
+    "dependency_call_duration_seconds",
+    "Latency of MongoDB, Qdrant and S3 calls",
+    ["service", "operation"]
+)
+DEPENDENCY_CALL_ERRORS = Counter(
+    "dependency_call_errors_total",
+    "MongoDB, Qdrant and S3 calls that raised",
+    ["service", "operation"]
+)
+
+TOKEN_VERIFICATION_SECONDS = Histogram(
+    "token_verification_duration_seconds",
+    "Google ID token verification time",
+    ["outcome"]
+)
+
+EMBEDDING_BATCH_SIZE = Histogram(
+    "embedding_batch_size",
+    "Texts per embedding batch",
+    buckets=(1, 4, 16, 32, 64, 128, 256, 512, 1024, 2048, 4096)
+)
+EMBEDDING_BATCH_SECONDS = Histogram(
+    "embedding_batch_duration_seconds",
+    "Time to embed one batch"
+)
+EMBEDDED_CHUNKS = Counter("embedded_chunks_total", "Texts embedded")
+
+PDF_EXTRACTION_SECONDS = Histogram(
+    "pdf_extraction_duration_seconds",
+    "Time to extract the text of one PDF",
+    buckets=(0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120)
+)
+PDF_PAGES = Counter("pdf_pages_extracted_total", "PDF pages extracted")
+
+INGESTION_JOBS_IN_PROGRESS = Gauge(
+    "ingestion_jobs_in_progress",
+    "Ingestion jobs being processed",
+    multiprocess_mode="livesum"
+)
+INGESTION_DOCUMENTS_PENDING = Gauge(
+    "ingestion_documents_pending",
+    "Documents of in-progress jobs not processed yet",
+    multiprocess_mode="livesum"
+)
+INGESTION_JOB_SECONDS = Histogram(
+    "ingestion_job_duration_seconds",
+    "Time from claiming an ingestion job to its final status",
+    ["status"],
+    buckets=(1, 5, 15, 30, 60, 120, 300, 600, 1800, 3600, 7200)
+)
+
+EMBEDDING_SERVER_QUEUE_DEPTH = Gauge(
+    "embedding_server_queue_depth",
+    "Embedding requests waiting for a model batch"
+)
+
+
+@contextmanager
+def track_call(service: str, operation: str) -> Iterator[None]:
+    """Time a dependency call as a metric and a span, counting an error if it raises."""
+    start = time.perf_counter()
+    try:
+        with span(f"{service}.{operation}"):
+            yield
+    except Exception:
+        DEPENDENCY_CALL_ERRORS.labels(service, operation).inc()
+        raise
+    finally:
+        DEPENDENCY_CALL_SECONDS.labels(service, operation).observe(time.perf_counter() - start)
+
+
+@contextmanager
+def track_embedding_batch(batch_size: int) -> Iterator[None]:
+    start = time.perf_counter()
+    yield
+    EMBEDDING_BATCH_SECONDS.observe(time.perf_counter() - start)
+    EMBEDDING_BATCH_SIZE.observe(batch_size)
+    EMBEDDED_CHUNKS.inc(batch_size)
+
+
+class MongoCommandMetrics(monitoring.CommandListener):
+    """Records every MongoDB command; pass it to MongoClient(event_listeners=...)."""
+
+    def started(self, event: monitoring.CommandStartedEvent) -> None:
+        pass
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent) -> None:
+        DEPENDENCY_CALL_SECONDS.labels("mongodb", event.command_name).observe(event.duration_micros / 1e6)
+
+    def failed(self, event: monitoring.CommandFailedEvent) -> None:
+        DEPENDENCY_CALL_SECONDS.labels("mongodb", event.command_name).observe(event.duration_micros / 1e6)
+        DEPENDENCY_CALL_ERRORS.labels("mongodb", event.command_name).inc()
+
+
+class MetricsMiddleware:
+    """
+    Records request latency per route template (/courses/{course_code}, not the
+    concrete path). Streaming responses are timed until their last chunk is sent.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            # The router stores the matched route in the scope it was given
+            route = scope.get("route")
+            HTTP_REQUEST_SECONDS.labels(
+                scope["method"],
+                route.path if route is not None else UNMATCHED_ROUTE,
+                str(status)
+            ).observe(time.perf_counter() - start)
+
+
+def render_metrics() -> bytes:
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        from prometheus_client import multiprocess
+
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry)
+    return generate_latest(REGISTRY)
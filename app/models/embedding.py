@@ -0,0 +1,23 @@
+from pydantic import BaseModel, field_validator
+
+
+# Texts accepted by one /embed request of the embedding server
+MAX_EMBED_REQUEST_TEXTS = 10000
+
+
+class EmbedRequest(BaseModel):
+    texts: list[str]
+
+    @field_validator("texts")
+    @classmethod
+    def validate_texts(cls, v: list[str]) -> list[str]:
+        if len(v) > MAX_EMBED_REQUEST_TEXTS:
+            raise ValueError(f"Cannot embed more than {MAX_EMBED_REQUEST_TEXTS} texts in a single request")
+        return v
+
+
+class EmbedderInfo(BaseModel):
+    model: str
+    dimension: int
+    max_tokens: int | None = None
+    tokenizer: str | None = None
@@ -86,6 +86,23 @@ class IngestionJobRetry(BaseModel):
         return v.strip()
 
 
+class IngestionJobStats(BaseModel):
+    """
+    Totals over the documents a job has processed, failed ones included, for
+    finding the slow stage. Download covers reading the extracted text cache
+    when it hits; bytes_downloaded and extraction only count PDFs that were
+    downloaded and parsed.
+    """
+    download_seconds: float = 0.0
+    extraction_seconds: float = 0.0
+    chunking_seconds: float = 0.0
+    embedding_seconds: float = 0.0
+    upsert_seconds: float = 0.0
+    bytes_downloaded: int = 0
+    pages: int = 0
+    chunks: int = 0
+
+
 class IngestionJobResponse(BaseModel):
     job_id: str
     course_code: str
@@ -100,3 +117,4 @@ class IngestionJobResponse(BaseModel):
     error_message: str | None = None
     retry_count: int = 0
     max_retries: int = 3
+    stats: IngestionJobStats = IngestionJobStats()
@@ -0,0 +1,71 @@
+import re
+from datetime import datetime
+from enum import Enum
+from pydantic import BaseModel, field_validator
+
+
+class ProfileKind(str, Enum):
+    WINDOW = "WINDOW"
+    JOB = "JOB"
+
+
+class ProfileStatus(str, Enum):
+    ARMED = "ARMED"
+    RUNNING = "RUNNING"
+    COMPLETED = "COMPLETED"
+
+
+class ProfileWindowCreate(BaseModel):
+    duration_seconds: float = 30.0
+    interval_ms: int = 10
+
+    @field_validator("duration_seconds")
+    @classmethod
+    def validate_duration_seconds(cls, v: float) -> float:
+        if v <= 0:
+            raise ValueError("duration_seconds must be positive")
+        if v > 600:
+            raise ValueError("duration_seconds cannot exceed 600")
+        return v
+
+    @field_validator("interval_ms")
+    @classmethod
+    def validate_interval_ms(cls, v: int) -> int:
+        if v < 1 or v > 1000:
+            raise ValueError("interval_ms must be between 1 and 1000")
+        return v
+
+
+class ProfileJobCreate(BaseModel):
+    job_id: str
+    interval_ms: int = 10
+
+    @field_validator("job_id")
+    @classmethod
+    def validate_job_id(cls, v: str) -> str:
+        if not v or not v.strip():
+            raise ValueError("Job ID cannot be empty")
+        if not re.match(r"^[a-f0-9\-]{36}$", v.lower()):
+            raise ValueError("Job ID must be a valid UUID")
+        return v.strip()
+
+    @field_validator("interval_ms")
+    @classmethod
+    def validate_interval_ms(cls, v: int) -> int:
+        if v < 1 or v > 1000:
+            raise ValueError("interval_ms must be between 1 and 1000")
+        return v
+
+
+class ProfileResponse(BaseModel):
+    profile_id: str
+    kind: ProfileKind
+    status: ProfileStatus
+    job_id: str | None = None
+    interval_ms: int
+    duration_seconds: float | None = None
+    requested_by: str
+    created_at: datetime
+    started_at: datetime | None = None
+    ended_at: datetime | None = None
+    samples: int = 0
@@ -1,7 +1,9 @@
-from fastapi import APIRouter, Depends
+from typing import TYPE_CHECKING
+
+from fastapi import APIRouter, Depends, Query
 from pymongo.database import Database
-from qdrant_client import QdrantClient
 
+from app.constants import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
 from app.database import get_database
 from app.dependencies import require_student, require_professor, get_qdrant_client
 from app.exceptions import CourseNotFoundError
@@ -10,6 +12,9 @@ from app.models.course import CourseResponse, CourseCreate, CourseUpdate, Course
 from app.services import course as course_service
 from app.services.log import log_event
 
+if TYPE_CHECKING:
+    from qdrant_client import QdrantClient
+
 
 router = APIRouter(prefix="/courses")
 
@@ -17,6 +22,8 @@ router = APIRouter(prefix="/courses")
 @router.get("")
 async def get_courses(
     code: str | None = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    after: str | None = Query(None, description="Code of the last course of the previous page"),
     current_user: UserResponse = Depends(require_student),
     db: Database = Depends(get_database)
 ) -> list[CourseResponse]:
@@ -25,7 +32,7 @@ async def get_courses(
         if course is None:
             raise CourseNotFoundError(f"Course with code {code} not found")
         return [course]
-    return course_service.get_all_courses(db)
+    return course_service.get_all_courses(db, limit, after)
 
 
 @router.post("")
@@ -75,7 +82,7 @@ async def delete_course(
     course_data: CourseDelete,
     current_user: UserResponse = Depends(require_professor),
     db: Database = Depends(get_database),
-    qdrant_client: QdrantClient = Depends(get_qdrant_client)
+    qdrant_client: "QdrantClient" = Depends(get_qdrant_client)
 ) -> dict[str, str]:
     course_service.delete_course(course_data.code, db, qdrant_client)
     log_event(
@@ -1,8 +1,11 @@
-from fastapi import APIRouter, Depends, UploadFile, File, Form, Query
+from typing import TYPE_CHECKING
+
+from fastapi import APIRouter, Depends, UploadFile, File, Form, Query, Request
+from fastapi.responses import StreamingResponse
 from pymongo.database import Database
-from qdrant_client import QdrantClient
 
 from app.config import settings
+from app.constants import DEFAULT_PAGE_SIZE, LIMIT_DESCRIPTION, MAX_PAGE_SIZE
 from app.database import get_database
 from app.dependencies import require_professor, get_qdrant_client
 from app.models.user import UserResponse
@@ -11,17 +14,34 @@ from app.services import document as document_service
 from app.services import course as course_service
 from app.services.log import log_event
 from app.exceptions import DocumentNotFoundError, FileTooLargeError, CourseNotFoundError
+from app.streaming import ndjson_response, wants_ndjson
+
+if TYPE_CHECKING:
+    from qdrant_client import QdrantClient
 
 router = APIRouter(prefix="/documents")
 
 
-@router.get("/course")
+@router.get("/course", response_model=list[DocumentResponse])
 async def list_documents(
+    request: Request,
     course_code: str = Query(..., description="Course code to filter documents"),
+    limit: int | None = Query(None, ge=1, le=MAX_PAGE_SIZE, description=LIMIT_DESCRIPTION),
+    after: str | None = Query(None, description="Document ID of the last document of the previous page"),
     current_user: UserResponse = Depends(require_professor),
     db: Database = Depends(get_database)
-) -> list[DocumentResponse]:
-    documents = document_service.get_documents_by_course(course_code, db)
+) -> list[DocumentResponse] | StreamingResponse:
+    if wants_ndjson(request):
+        rows = document_service.iter_documents_by_course(course_code, db, limit, after)
+        log_event(
+            "documents_listed",
+            level="info",
+            user_email=current_user.email,
+            details={"course_code": course_code, "format": "ndjson"}
+        )
+        return ndjson_response(rows)
+
+    documents = document_service.get_documents_by_course(course_code, db, limit or DEFAULT_PAGE_SIZE, after)
     log_event(
         "documents_listed",
         level="info",
@@ -110,7 +130,7 @@ async def delete_document(
     document_data: DocumentDelete,
     current_user: UserResponse = Depends(require_professor),
     db: Database = Depends(get_database),
-    qdrant_client: QdrantClient = Depends(get_qdrant_client)
+    qdrant_client: "QdrantClient" = Depends(get_qdrant_client)
 ) -> dict[str, str]:
     document = document_service.get_document_by_id(document_data.document_id, db)
     if document is None:
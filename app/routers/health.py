@@ -1,20 +1,25 @@
-from fastapi import APIRouter, Depends, status
+from typing import TYPE_CHECKING
+
+from fastapi import APIRouter, Depends, Request, status
 from fastapi.responses import JSONResponse
 from pymongo.database import Database
-from qdrant_client import QdrantClient
 
 from app.config import settings
 from app.database import get_database
 from app.dependencies import get_qdrant_client
 
+if TYPE_CHECKING:
+    from qdrant_client import QdrantClient
+
 
 router = APIRouter()
 
 
 @router.get("/health")
 async def health_check(
+    request: Request,
     db: Database = Depends(get_database),
-    qdrant_client: QdrantClient = Depends(get_qdrant_client)
+    qdrant_client: "QdrantClient" = Depends(get_qdrant_client)
 ) -> JSONResponse:
     """
     Comprehensive health check for all critical services.
@@ -40,17 +45,10 @@ async def health_check(
         health_status["services"]["vector_store"] = "disconnected"
         is_healthy = False
 
-    try:
-        if settings.embedding_provider == "openai":
-            if settings.openai_api_key:
-                health_status["services"]["embeddings"] = "configured"
-            else:
-                health_status["services"]["embeddings"] = "misconfigured"
-                is_healthy = False
-        else:
-            health_status["services"]["embeddings"] = "configured"
-    except Exception as e:
-        health_status["services"]["embeddings"] = "error"
+    # A loading model does not make the API unhealthy: only ingestion waits for it
+    embedder_status = request.app.state.embedder_loader.status
+    health_status["services"]["embeddings"] = embedder_status
+    if embedder_status == "failed":
         is_healthy = False
 
     if settings.aws_access_key_id and settings.aws_secret_access_key and settings.s3_bucket_name:
@@ -1,7 +1,10 @@
-from fastapi import APIRouter, BackgroundTasks, Depends, Query, status
+from typing import TYPE_CHECKING
+
+from fastapi import APIRouter, BackgroundTasks, Depends, Query, Request, status
+from fastapi.responses import StreamingResponse
 from pymongo.database import Database
-from qdrant_client import QdrantClient
 
+from app.constants import DEFAULT_PAGE_SIZE, LIMIT_DESCRIPTION, MAX_PAGE_SIZE
 from app.database import get_database
 from app.dependencies import require_professor, require_student, get_embedder, get_qdrant_client
 from app.models.user import UserResponse
@@ -11,11 +14,17 @@ from app.services.ingestion import (
     create_ingestion_job,
     get_ingestion_job,
     list_ingestion_jobs,
+    iter_ingestion_jobs,
     cancel_ingestion_job,
     retry_ingestion_job,
-    process_ingestion_job
+    process_ingestion_job,
+    stream_ingestion_job
 )
 from app.services.log import log_event
+from app.streaming import ndjson_response, wants_ndjson
+
+if TYPE_CHECKING:
+    from qdrant_client import QdrantClient
 
 router = APIRouter(prefix="/ingestions")
 
@@ -31,7 +40,7 @@ async def start_ingestion(
     current_user: UserResponse = Depends(require_professor),
     db: Database = Depends(get_database),
     embedder: BaseEmbedder = Depends(get_embedder),
-    qdrant_client: QdrantClient = Depends(get_qdrant_client)
+    qdrant_client: "QdrantClient" = Depends(get_qdrant_client)
 ) -> IngestionJobResponse:
     job = create_ingestion_job(
         course_code=job_request.course_code,
@@ -47,11 +56,17 @@ async def start_ingestion(
 
 @router.get("/list", response_model=list[IngestionJobResponse])
 async def list_course_ingestions(
+    request: Request,
     course_code: str = Query(...),
+    limit: int | None = Query(None, ge=1, le=MAX_PAGE_SIZE, description=LIMIT_DESCRIPTION),
+    after: str | None = Query(None, description="Job ID of the last job of the previous page"),
     current_user: UserResponse = Depends(require_student),
     db: Database = Depends(get_database)
-) -> list[IngestionJobResponse]:
-    jobs = list_ingestion_jobs(course_code, db)
+) -> list[IngestionJobResponse] | StreamingResponse:
+    if wants_ndjson(request):
+        jobs = ndjson_response(iter_ingestion_jobs(course_code, db, limit, after))
+    else:
+        jobs = list_ingestion_jobs(course_code, db, limit or DEFAULT_PAGE_SIZE, after)
 
     log_event(
         "ingestion_list_viewed",
@@ -81,6 +96,33 @@ async def get_ingestion_status(
     return job
 
 
+@router.get("/events")
+async def stream_ingestion_status(
+    request: Request,
+    job_id: str = Query(...),
+    current_user: UserResponse = Depends(require_student),
+    db: Database = Depends(get_database)
+) -> StreamingResponse:
+    """
+    Stream job status as Server-Sent Events until the job finishes, instead of
+    polling /status. Authentication and logging happen once per stream.
+    """
+    job = get_ingestion_job(job_id, db)
+
+    log_event(
+        "ingestion_status_streamed",
+        level="info",
+        user_email=current_user.email,
+        details={"job_id": job_id}
+    )
+
+    return StreamingResponse(
+        stream_ingestion_job(job, db, request.is_disconnected),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
 @router.post("/cancel", response_model=IngestionJobResponse)
 async def cancel_ingestion(
     cancel_request: IngestionJobCancel,
@@ -99,7 +141,7 @@ async def retry_ingestion(
     current_user: UserResponse = Depends(require_professor),
     db: Database = Depends(get_database),
     embedder: BaseEmbedder = Depends(get_embedder),
-    qdrant_client: QdrantClient = Depends(get_qdrant_client)
+    qdrant_client: "QdrantClient" = Depends(get_qdrant_client)
 ) -> IngestionJobResponse:
     job = retry_ingestion_job(retry_request.job_id, db)
 
@@ -0,0 +1,12 @@
+from fastapi import APIRouter, Response
+
+from app.metrics import METRICS_CONTENT_TYPE, render_metrics
+
+
+router = APIRouter()
+
+
+@router.get("/metrics", include_in_schema=False)
+def get_metrics() -> Response:
+    """Prometheus scrape endpoint."""
+    return Response(content=render_metrics(), media_type=METRICS_CONTENT_TYPE)
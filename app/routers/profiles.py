@@ -0,0 +1,74 @@
+from fastapi import APIRouter, Depends, Query, status
+from fastapi.responses import PlainTextResponse
+from pymongo.database import Database
+
+from app.constants import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from app.database import get_database
+from app.dependencies import require_admin
+from app.models.profile import ProfileJobCreate, ProfileResponse, ProfileWindowCreate
+from app.models.user import UserResponse
+from app.services.log import log_event
+from app.services.profiler import get_profile_output, list_profiles, profiler
+
+
+router = APIRouter(prefix="/profiles")
+
+
+@router.post("/window", status_code=status.HTTP_202_ACCEPTED)
+async def start_profile_window(
+    window_request: ProfileWindowCreate,
+    current_user: UserResponse = Depends(require_admin),
+    db: Database = Depends(get_database)
+) -> ProfileResponse:
+    """Sample every thread of the worker handling this request for duration_seconds."""
+    profile = profiler.start_window(
+        window_request.duration_seconds,
+        window_request.interval_ms,
+        current_user.email,
+        db
+    )
+    log_event(
+        "profile_started",
+        level="info",
+        user_email=current_user.email,
+        details={"profile_id": profile.profile_id, "duration_seconds": window_request.duration_seconds}
+    )
+    return profile
+
+
+@router.post("/job", status_code=status.HTTP_202_ACCEPTED)
+async def arm_job_profile(
+    job_request: ProfileJobCreate,
+    current_user: UserResponse = Depends(require_admin),
+    db: Database = Depends(get_database)
+) -> ProfileResponse:
+    """Profile the next run of an ingestion job (start or retry it afterwards)."""
+    profile = profiler.arm_job(job_request.job_id, job_request.interval_ms, current_user.email, db)
+    log_event(
+        "profile_armed",
+        level="info",
+        user_email=current_user.email,
+        details={"profile_id": profile.profile_id, "job_id": job_request.job_id}
+    )
+    return profile
+
+
+@router.get("/list")
+async def get_profiles(
+    job_id: str | None = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="Maximum profiles to return"),
+    after: str | None = Query(None, description="Profile ID of the last profile of the previous page"),
+    current_user: UserResponse = Depends(require_admin),
+    db: Database = Depends(get_database)
+) -> list[ProfileResponse]:
+    return list_profiles(db, job_id, limit, after)
+
+
+@router.get("/folded", response_class=PlainTextResponse)
+async def get_profile_folded(
+    profile_id: str = Query(...),
+    current_user: UserResponse = Depends(require_admin),
+    db: Database = Depends(get_database)
+) -> PlainTextResponse:
+    """Folded stacks of a completed profile, for flamegraph.pl or speedscope."""
+    return PlainTextResponse(get_profile_output(profile_id, db))
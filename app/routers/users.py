@@ -1,12 +1,15 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import StreamingResponse
 from pymongo.database import Database
 
+from app.constants import DEFAULT_PAGE_SIZE, LIMIT_DESCRIPTION, MAX_PAGE_SIZE
 from app.database import get_database
 from app.dependencies import get_current_user, require_admin
 from app.exceptions import UserNotFoundError, CannotDeleteSelfError
 from app.models.user import UserResponse, UserCreate, UserUpdate, UserDelete
 from app.services import user as user_service
 from app.services.log import log_event
+from app.streaming import ndjson_response, wants_ndjson
 
 
 router = APIRouter(prefix="/users")
@@ -17,18 +20,23 @@ async def get_me(current_user: UserResponse = Depends(get_current_user)) -> User
     return current_user
 
 
-@router.get("")
+@router.get("", response_model=list[UserResponse])
 async def get_users(
+    request: Request,
     email: str | None = None,
+    limit: int | None = Query(None, ge=1, le=MAX_PAGE_SIZE, description=LIMIT_DESCRIPTION),
+    after: str | None = Query(None, description="Email of the last user of the previous page"),
     current_user: UserResponse = Depends(require_admin),
     db: Database = Depends(get_database)
-) -> list[UserResponse]:
+) -> list[UserResponse] | StreamingResponse:
     if email:
         user = user_service.get_user_by_email(email, db)
         if user is None:
             raise UserNotFoundError(f"User with email {email} not found")
         return [user]
-    return user_service.get_all_users(db)
+    if wants_ndjson(request):
+        return ndjson_response(user_service.iter_users(db, limit, after))
+    return user_service.get_all_users(db, limit or DEFAULT_PAGE_SIZE, after)
 
 
 @router.post("")
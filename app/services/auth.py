@@ -1,21 +1,31 @@
-from google.auth.transport import requests
-from google.oauth2 import id_token
+import time
 
 from app.config import settings
 from app.exceptions import AuthenticationError
+from app.metrics import TOKEN_VERIFICATION_SECONDS
+from app.tracing import span
 
 
 def verify_google_token(token: str) -> str:
+    from google.auth.transport import requests
+    from google.oauth2 import id_token
+
+    start = time.perf_counter()
+    outcome = "failure"
     try:
-        id_info = id_token.verify_oauth2_token(
-            token,
-            requests.Request(),
-            settings.google_client_id
-        )
+        with span("verify_google_token"):
+            id_info = id_token.verify_oauth2_token(
+                token,
+                requests.Request(),
+                settings.google_client_id
+            )
         email = id_info.get("email")
         if not email:
             raise AuthenticationError("Email not found in token")
+        outcome = "success"
         return email
     except Exception as e:
         raise AuthenticationError(f"Token verification failed: {str(e)}")
+    finally:
+        TOKEN_VERIFICATION_SECONDS.labels(outcome).observe(time.perf_counter() - start)
 
@@ -0,0 +1,87 @@
+import threading
+
+from pymongo.errors import PyMongoError
+
+from app.config import settings
+from app.database import get_database
+from app.models.ingestion import IngestionStatus
+from app.services.log import log_event
+
+
+class CancellationToken:
+    """Cancellation flag of a running ingestion job, cheap to check on the hot path."""
+
+    def __init__(self, job_id: str):
+        self.job_id = job_id
+        self._canceled = threading.Event()
+
+    @property
+    def canceled(self) -> bool:
+        return self._canceled.is_set()
+
+    def cancel(self) -> None:
+        self._canceled.set()
+
+
+class CancellationWatcher:
+    """
+    Holds the cancellation tokens of the jobs running in this process and keeps
+    them up to date with a single batched query for all of them every
+    poll_interval seconds, from a background thread that only runs while there
+    are jobs to watch. Cancellations requested through this process take effect
+    immediately.
+    """
+
+    def __init__(self, poll_interval: float):
+        self.poll_interval = poll_interval
+        self._tokens: dict[str, CancellationToken] = {}
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+
+    def register(self, job_id: str) -> CancellationToken:
+        with self._lock:
+            token = self._tokens.setdefault(job_id, CancellationToken(job_id))
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="cancellation-watcher", daemon=True)
+                self._thread.start()
+        return token
+
+    def unregister(self, job_id: str) -> None:
+        with self._lock:
+            self._tokens.pop(job_id, None)
+
+    def cancel(self, job_id: str) -> None:
+        with self._lock:
+            token = self._tokens.get(job_id)
+        if token is not None:
+            token.cancel()
+
+    def _run(self) -> None:
+        idle = threading.Event()
+        while True:
+            idle.wait(self.poll_interval)
+            with self._lock:
+                job_ids = [job_id for job_id, token in self._tokens.items() if not token.canceled]
+                if not self._tokens:
+                    self._thread = None
+                    return
+            if job_ids:
+                self._poll(job_ids)
+
+    def _poll(self, job_ids: list[str]) -> None:
+        try:
+            canceled_jobs = get_database().ingestion_jobs.find(
+                {"job_id": {"$in": job_ids}, "status": IngestionStatus.CANCELED.value},
+                {"_id": 0, "job_id": 1}
+            )
+            for job in canceled_jobs:
+                self.cancel(job["job_id"])
+        except PyMongoError as e:
+            log_event(
+                "cancellation_poll_failed",
+                level="warning",
+                details={"job_ids": job_ids, "error": str(e)}
+            )
+
+
+cancellation_watcher = CancellationWatcher(settings.cancellation_poll_interval)
@@ -0,0 +1,202 @@
+import bisect
+import re
+from dataclasses import dataclass
+from typing import Callable
+
+from app.exceptions import PDFExtractionError
+
+
+# Pages are joined with a blank line so that a page break is also a paragraph break
+PAGE_SEPARATOR = "\n\n"
+
+_PARAGRAPH_BREAK = re.compile(r"\n\s*\n")
+_SENTENCE_BREAK = re.compile(r"(?<=[.!?])\s+")
+_WORD = re.compile(r"\S+")
+
+# Upper bound of the characters a token covers, for cutting windows out of unbroken text
+_MAX_CHARS_PER_TOKEN = 16
+
+
+@dataclass(frozen=True)
+class TextChunk:
+    """
+    A chunk of document text with its location in the source.
+
+    char_start/char_end are offsets into the document text (pages joined with
+    PAGE_SEPARATOR); page_start/page_end are 1-based page numbers.
+    """
+    text: str
+    char_start: int
+    char_end: int
+    page_start: int
+    page_end: int
+
+
+def join_pages(pages: list[str]) -> tuple[str, list[int]]:
+    """Join page texts into a single document text and return each page's start offset."""
+    page_starts = []
+    offset = 0
+    for page in pages:
+        page_starts.append(offset)
+        offset += len(page) + len(PAGE_SEPARATOR)
+    return PAGE_SEPARATOR.join(pages), page_starts
+
+
+def chunk_pages(
+    pages: list[str],
+    chunk_size: int = 1000,
+    overlap: int = 150,
+    length_function: Callable[[str], int] | None = None
+) -> list[TextChunk]:
+    """
+    Split page texts into chunks of at most chunk_size units, preferring paragraph
+    and then sentence boundaries, and falling back to words only for sentences that
+    do not fit on their own.
+
+    Units are characters unless length_function is given (e.g. a tokenizer's token
+    counter), in which case chunk_size and overlap are measured with it.
+    """
+    # Validate parameters to prevent infinite loop
+    if chunk_size <= 0:
+        raise PDFExtractionError(f"chunk_size must be positive, got {chunk_size}")
+
+    if overlap < 0:
+        raise PDFExtractionError(f"overlap cannot be negative, got {overlap}")
+
+    if overlap >= chunk_size:
+        raise PDFExtractionError(
+            f"overlap ({overlap}) must be less than chunk_size ({chunk_size})"
+        )
+
+    measure = length_function or len
+    text, page_starts = join_pages(pages)
+    spans = _split_into_segments(text, chunk_size, measure)
+    if not spans:
+        return []
+
+    # Each segment is costed together with the whitespace preceding it, which makes
+    # the running total an upper bound of the real chunk length
+    costs = []
+    previous_end = spans[0][0]
+    for start, end in spans:
+        costs.append(measure(text[previous_end:end]))
+        previous_end = end
+
+    chunks = []
+    first = 0
+    while first < len(spans):
+        last = first
+        total = costs[first]
+        while last + 1 < len(spans) and total + costs[last + 1] <= chunk_size:
+            last += 1
+            total += costs[last]
+
+        chunks.append(_make_chunk(text, page_starts, spans[first][0], spans[last][1]))
+
+        if last + 1 >= len(spans):
+            break
+
+        # Carry over whole trailing segments that fit in the overlap budget
+        next_first = last + 1
+        carried = 0
+        while next_first - 1 > first and carried + costs[next_first - 1] <= overlap:
+            next_first -= 1
+            carried += costs[next_first]
+        first = next_first
+
+    return chunks
+
+
+def chunk_text(
+    text: str,
+    chunk_size: int = 1000,
+    overlap: int = 150,
+    length_function: Callable[[str], int] | None = None
+) -> list[TextChunk]:
+    if not text:
+        return []
+    return chunk_pages([text], chunk_size, overlap, length_function)
+
+
+def _split_into_segments(
+    text: str,
+    chunk_size: int,
+    measure: Callable[[str], int]
+) -> list[tuple[int, int]]:
+    spans = []
+    for paragraph_start, paragraph_end in _non_empty_spans(text, _PARAGRAPH_BREAK, 0, len(text)):
+        if measure(text[paragraph_start:paragraph_end]) <= chunk_size:
+            spans.append((paragraph_start, paragraph_end))
+            continue
+
+        for sentence_start, sentence_end in _non_empty_spans(
+            text, _SENTENCE_BREAK, paragraph_start, paragraph_end
+        ):
+            if measure(text[sentence_start:sentence_end]) <= chunk_size:
+                spans.append((sentence_start, sentence_end))
+                continue
+
+            for word in _WORD.finditer(text, sentence_start, sentence_end):
+                if measure(word.group()) <= chunk_size:
+                    spans.append(word.span())
+                    continue
+                # A single "word" longer than a chunk (e.g. a URL or a table row
+                # without spaces) is cut into windows of at most chunk_size units
+                spans.extend(_split_into_windows(text, word.start(), word.end(), chunk_size, measure))
+    return spans
+
+
+def _split_into_windows(
+    text: str,
+    start: int,
+    end: int,
+    chunk_size: int,
+    measure: Callable[[str], int]
+) -> list[tuple[int, int]]:
+    if measure is len:
+        return [(window_start, min(window_start + chunk_size, end)) for window_start in range(start, end, chunk_size)]
+
+    # Token-dense text can hold more than one token per character, so each
+    # window is the longest prefix that fits, found by binary search. Windows are
+    # searched within _MAX_CHARS_PER_TOKEN characters per token of budget, which
+    # keeps each probe short on very long runs, and hold at least one character
+    windows = []
+    while start < end:
+        low, high = start + 1, min(end, start + chunk_size * _MAX_CHARS_PER_TOKEN)
+        while low < high:
+            middle = (low + high + 1) // 2
+            if measure(text[start:middle]) <= chunk_size:
+                low = middle
+            else:
+                high = middle - 1
+        windows.append((start, low))
+        start = low
+    return windows
+
+
+def _non_empty_spans(text: str, separator: re.Pattern, start: int, end: int) -> list[tuple[int, int]]:
+    spans = []
+    position = start
+    for match in separator.finditer(text, start, end):
+        spans.extend(_strip_span(text, position, match.start()))
+        position = match.end()
+    spans.extend(_strip_span(text, position, end))
+    return spans
+
+
+def _strip_span(text: str, start: int, end: int) -> list[tuple[int, int]]:
+    while start < end and text[start].isspace():
+        start += 1
+    while end > start and text[end - 1].isspace():
+        end -= 1
+    return [(start, end)] if start < end else []
+
+
+def _make_chunk(text: str, page_starts: list[int], start: int, end: int) -> TextChunk:
+    return TextChunk(
+        text=text[start:end],
+        char_start=start,
+        char_end=end,
+        page_start=bisect.bisect_right(page_starts, start),
+        page_end=bisect.bisect_right(page_starts, end - 1)
+    )
@@ -1,32 +1,33 @@
+from typing import TYPE_CHECKING
+
+from pydantic import TypeAdapter
 from pymongo.database import Database
-from qdrant_client import QdrantClient
 
 from app.exceptions import CourseNotFoundError, CourseAlreadyExistsError, DocumentDeleteError
 from app.models.course import CourseResponse
 from app.services.document import delete_document
 from app.services.log import log_event
+from app.services.pagination import paginate
+
+if TYPE_CHECKING:
+    from qdrant_client import QdrantClient
+
+
+COURSE_RESPONSE_PROJECTION = {"_id": 0, "code": 1, "name": 1, "description": 1}
+
+COURSE_LIST_ADAPTER = TypeAdapter(list[CourseResponse])
 
 
 def get_course_by_code(code: str, db: Database) -> CourseResponse | None:
-    course_doc = db.courses.find_one({"code": code})
+    course_doc = db.courses.find_one({"code": code}, COURSE_RESPONSE_PROJECTION)
     if course_doc is None:
         return None
-    return CourseResponse(
-        code=course_doc["code"],
-        name=course_doc["name"],
-        description=course_doc.get("description")
-    )
+    return CourseResponse.model_validate(course_doc)
 
 
-def get_all_courses(db: Database) -> list[CourseResponse]:
-    courses = []
-    for course_doc in db.courses.find():
-        courses.append(CourseResponse(
-            code=course_doc["code"],
-            name=course_doc["name"],
-            description=course_doc.get("description")
-        ))
-    return courses
+def get_all_courses(db: Database, limit: int, after: str | None = None) -> list[CourseResponse]:
+    courses = paginate(db.courses, {}, [("code", 1)], COURSE_RESPONSE_PROJECTION, limit, after)
+    return COURSE_LIST_ADAPTER.validate_python(list(courses))
 
 
 def create_course(code: str, name: str, description: str | None, db: Database) -> CourseResponse:
@@ -75,7 +76,7 @@ def update_course(
     )
 
 
-def delete_course(code: str, db: Database, qdrant_client: QdrantClient) -> None:
+def delete_course(code: str, db: Database, qdrant_client: "QdrantClient") -> None:
     course = db.courses.find_one({"code": code})
     if course is None:
         raise CourseNotFoundError(f"Course with code {code} not found")
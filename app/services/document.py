@@ -2,10 +2,10 @@ import uuid
 import re
 import os
 from datetime import datetime, timezone
-from typing import BinaryIO
+from typing import TYPE_CHECKING, BinaryIO, Iterator
 
+from pydantic import TypeAdapter
 from pymongo.database import Database
-from qdrant_client import QdrantClient
 
 from pymongo.errors import PyMongoError
 
@@ -19,7 +19,12 @@ from app.exceptions import (
 from app.models.document import DocumentResponse, DocumentStatus
 from app.services.s3 import upload_file_to_s3, delete_file_from_s3, generate_presigned_url
 from app.services.qdrant import delete_document_vectors
+from app.services.text_cache import delete_cached_pages
 from app.services.log import log_event
+from app.services.pagination import paginate
+
+if TYPE_CHECKING:
+    from qdrant_client import QdrantClient
 
 
 WINDOWS_RESERVED_NAMES = {
@@ -28,6 +33,14 @@ WINDOWS_RESERVED_NAMES = {
     "LPT1", "LPT2", "LPT3", "LPT4", "LPT5", "LPT6", "LPT7", "LPT8", "LPT9"
 }
 
+DOCUMENT_RESPONSE_PROJECTION = {"_id": 0, **{field: 1 for field in DocumentResponse.model_fields}}
+
+# Validates a whole page of rows in one call into pydantic-core
+DOCUMENT_LIST_ADAPTER = TypeAdapter(list[DocumentResponse])
+
+# Upload order, with document_id as the unique tie-breaker that `after` refers to
+DOCUMENT_LIST_SORT = [("upload_timestamp", 1), ("document_id", 1)]
+
 
 def sanitize_filename(filename: str) -> str:
     """
@@ -138,42 +151,42 @@ def create_document(
     )
 
 
-def get_documents_by_course(course_code: str, db: Database) -> list[DocumentResponse]:
-    documents = []
-    for doc in db.documents.find({"course_code": course_code}):
-        documents.append(DocumentResponse(
-            document_id=doc["document_id"],
-            course_code=doc["course_code"],
-            filename=doc["filename"],
-            s3_key=doc["s3_key"],
-            upload_timestamp=doc["upload_timestamp"],
-            uploaded_by=doc["uploaded_by"],
-            file_size=doc["file_size"],
-            content_type=doc["content_type"],
-            status=doc.get("status", DocumentStatus.UPLOADED.value)
-        ))
-    return documents
+def iter_documents_by_course(
+    course_code: str,
+    db: Database,
+    limit: int | None = None,
+    after: str | None = None
+) -> Iterator[dict]:
+    """Yield a course's documents as plain dicts with the DocumentResponse fields, in upload order."""
+    cursor = paginate(
+        db.documents,
+        {"course_code": course_code},
+        DOCUMENT_LIST_SORT,
+        DOCUMENT_RESPONSE_PROJECTION,
+        limit,
+        after
+    )
+    return ({"status": DocumentStatus.UPLOADED.value, **doc} for doc in cursor)
+
+
+def get_documents_by_course(
+    course_code: str,
+    db: Database,
+    limit: int,
+    after: str | None = None
+) -> list[DocumentResponse]:
+    return DOCUMENT_LIST_ADAPTER.validate_python(list(iter_documents_by_course(course_code, db, limit, after)))
 
 
 def get_document_by_id(document_id: str, db: Database) -> DocumentResponse | None:
-    doc = db.documents.find_one({"document_id": document_id})
+    doc = db.documents.find_one({"document_id": document_id}, DOCUMENT_RESPONSE_PROJECTION)
     if doc is None:
         return None
 
-    return DocumentResponse(
-        document_id=doc["document_id"],
-        course_code=doc["course_code"],
-        filename=doc["filename"],
-        s3_key=doc["s3_key"],
-        upload_timestamp=doc["upload_timestamp"],
-        uploaded_by=doc["uploaded_by"],
-        file_size=doc["file_size"],
-        content_type=doc["content_type"],
-        status=doc.get("status", DocumentStatus.UPLOADED.value)
-    )
+    return DocumentResponse.model_validate({"status": DocumentStatus.UPLOADED.value, **doc})
 
 
-def delete_document(document_id: str, db: Database, qdrant_client: QdrantClient) -> None:
+def delete_document(document_id: str, db: Database, qdrant_client: "QdrantClient") -> None:
     doc = db.documents.find_one({"document_id": document_id})
     if doc is None:
         raise DocumentNotFoundError(f"Document with ID {document_id} not found")
@@ -185,6 +198,15 @@ def delete_document(document_id: str, db: Database, qdrant_client: QdrantClient)
     except StorageError as e:
         raise DocumentDeleteError(f"Failed to delete document from S3: {str(e)}") from e
 
+    try:
+        delete_cached_pages(s3_key)
+    except StorageError as e:
+        log_event(
+            "text_cache_deletion_failed",
+            level="warning",
+            details={"document_id": document_id, "error": str(e)}
+        )
+
     try:
         delete_document_vectors(qdrant_client, document_id)
     except VectorStoreError as e:
@@ -1,7 +1,45 @@
+import asyncio
+import random
+import threading
 from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Callable
 
 from app.config import settings
-from app.exceptions import EmbeddingError
+from app.exceptions import EmbeddingError, EmbedderNotReadyError
+from app.services.rate_limiter import RateLimiter
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+# Per-input token limit of the OpenAI embedding models
+OPENAI_MAX_INPUT_TOKENS = 8191
+
+# Native output dimension of the OpenAI embedding models
+OPENAI_MODEL_DIMENSIONS = {
+    "text-embedding-3-small": 1536,
+    "text-embedding-3-large": 3072,
+    "text-embedding-ada-002": 1536,
+}
+
+# Maximum number of inputs accepted by a single OpenAI embeddings request
+OPENAI_MAX_BATCH_INPUTS = 2048
+
+# Texts per request to the embedding server, below its MAX_EMBED_REQUEST_TEXTS limit
+REMOTE_MAX_BATCH_TEXTS = 1000
+
+# Upper bound in seconds for the exponential backoff between retries
+OPENAI_MAX_BACKOFF = 30
+
+# Upper bound in seconds for the backoff between attempts to load a model that failed to load
+EMBEDDER_LOAD_MAX_BACKOFF = 60
+
+# EMBEDDING_PROVIDER values served by LocalEmbedder, mapped to the sentence-transformers backend
+LOCAL_BACKENDS = {
+    "local": "torch",
+    "onnx": "onnx",
+    "openvino": "openvino",
+}
 
 
 class BaseEmbedder(ABC):
@@ -10,87 +48,653 @@ class BaseEmbedder(ABC):
         pass
 
     @abstractmethod
-    def embed_batch(self, texts: list[str]) -> list[list[float]]:
+    def embed_batch(self, texts: list[str]) -> "np.ndarray":
+        """Embed texts into a float32 array of shape (len(texts), dimension)."""
         pass
 
     @abstractmethod
     def get_dimension(self) -> int:
         pass
 
+    def embed_batch_as_lists(self, texts: list[str]) -> list[list[float]]:
+        """Compatibility shim for callers that need plain Python lists."""
+        return self.embed_batch(texts).tolist()
+
+    def get_token_counter(self) -> Callable[[str], int] | None:
+        """
+        Return a function counting the model's tokens in a text, or None if the
+        tokenizer is unavailable and chunks should be sized by characters.
+        """
+        return None
+
+    def get_max_tokens(self) -> int | None:
+        """Maximum number of content tokens the model embeds without truncation."""
+        return None
+
+    def get_tokenizer_name(self) -> str | None:
+        """Name or path from which a Hugging Face tokenizer for this model can be loaded."""
+        return None
+
+    def close(self) -> None:
+        """Release resources held by the embedder (worker processes, connections)."""
+        pass
+
 
 class LocalEmbedder(BaseEmbedder):
-    def __init__(self, model_name: str):
+    """
+    sentence-transformers embedder.
+
+    backend selects the inference runtime: "torch" (default), "onnx" (ONNX Runtime)
+    or "openvino". model_file picks a specific exported file for the ONNX/OpenVINO
+    backends, e.g. "onnx/model_qint8_avx512_vnni.onnx" for an int8-quantized model.
+
+    dimensions truncates embeddings to their first N components and renormalizes
+    them, which preserves quality for Matryoshka-trained models.
+    """
+
+    def __init__(
+        self,
+        model_name: str,
+        backend: str = "torch",
+        model_file: str | None = None,
+        dimensions: int | None = None
+    ):
         try:
             from sentence_transformers import SentenceTransformer
-            self.model = SentenceTransformer(model_name)
+            if backend == "torch":
+                self.model = SentenceTransformer(model_name)
+            else:
+                self.model = SentenceTransformer(
+                    model_name,
+                    backend=backend,
+                    model_kwargs={"file_name": model_file} if model_file else None
+                )
+            self.backend = backend
         except Exception as e:
-            raise EmbeddingError(f"Failed to load local embedding model: {str(e)}")
+            raise EmbeddingError(f"Failed to load local embedding model ({backend} backend): {str(e)}")
+
+        native_dimension = self.model.get_sentence_embedding_dimension()
+        if dimensions is not None and not 0 < dimensions <= native_dimension:
+            raise EmbeddingError(
+                f"Embedding dimensions ({dimensions}) must be between 1 and the "
+                f"model's native dimension ({native_dimension})"
+            )
+        self._dimension = dimensions or native_dimension
+        self._truncate = self._dimension < native_dimension
 
     def embed_text(self, text: str) -> list[float]:
         try:
             embedding = self.model.encode(text, convert_to_numpy=True)
+            if self._truncate:
+                embedding = _truncate_and_normalize(embedding.reshape(1, -1), self._dimension)[0]
             return embedding.tolist()
         except Exception as e:
             raise EmbeddingError(f"Failed to generate embedding: {str(e)}")
 
-    def embed_batch(self, texts: list[str]) -> list[list[float]]:
+    def embed_batch(self, texts: list[str]) -> "np.ndarray":
         try:
-            embeddings = self.model.encode(texts, convert_to_numpy=True)
-            return embeddings.tolist()
+            import numpy as np
+            if not texts:
+                return np.empty((0, self._dimension), dtype=np.float32)
+            embeddings = np.asarray(self.model.encode(texts, convert_to_numpy=True), dtype=np.float32)
+            if self._truncate:
+                embeddings = _truncate_and_normalize(embeddings, self._dimension)
+            return embeddings
         except Exception as e:
             raise EmbeddingError(f"Failed to generate batch embeddings: {str(e)}")
 
     def get_dimension(self) -> int:
-        return self.model.get_sentence_embedding_dimension()
+        return self._dimension
+
+    def get_token_counter(self) -> Callable[[str], int] | None:
+        tokenizer = getattr(self.model, "tokenizer", None)
+        if tokenizer is None:
+            return None
+        return _make_token_counter(tokenizer)
+
+    def get_max_tokens(self) -> int | None:
+        tokenizer = getattr(self.model, "tokenizer", None)
+        max_seq_length = getattr(self.model, "max_seq_length", None)
+        if tokenizer is None or not max_seq_length:
+            return None
+        # [CLS]/[SEP]-style special tokens count against the sequence length
+        return max_seq_length - tokenizer.num_special_tokens_to_add(pair=False)
+
+    def get_tokenizer_name(self) -> str | None:
+        tokenizer = getattr(self.model, "tokenizer", None)
+        return getattr(tokenizer, "name_or_path", None)
+
+
+class ProcessPoolEmbedder(BaseEmbedder):
+    """
+    Runs a LocalEmbedder in each of a pool of worker processes so that encoding
+    uses all cores without competing with the API for the GIL.
+
+    A batch is split evenly across the workers; each worker writes its float32
+    result into a shared-memory block that the parent copies out and releases,
+    avoiding pickling of the embeddings.
+    """
+
+    def __init__(
+        self,
+        model_name: str,
+        workers: int,
+        threads_per_worker: int = 1,
+        backend: str = "torch",
+        model_file: str | None = None,
+        dimensions: int | None = None
+    ):
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        self.workers = workers
+        try:
+            self.executor = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_embedding_worker,
+                initargs=(model_name, backend, model_file, dimensions, threads_per_worker)
+            )
+            self._dimension, self._max_tokens, self._tokenizer_name = (
+                self.executor.submit(_describe_worker_model).result()
+            )
+        except Exception as e:
+            raise EmbeddingError(f"Failed to start embedding worker pool: {str(e)}")
+
+        self._tokenizer = _load_tokenizer(self._tokenizer_name)
+
+    def embed_text(self, text: str) -> list[float]:
+        return self.embed_batch([text])[0].tolist()
+
+    def embed_batch(self, texts: list[str]) -> "np.ndarray":
+        import numpy as np
+
+        if not texts:
+            return np.empty((0, self._dimension), dtype=np.float32)
+
+        batch_size = -(-len(texts) // self.workers)
+        try:
+            futures = [
+                self.executor.submit(_embed_in_worker, texts[start:start + batch_size])
+                for start in range(0, len(texts), batch_size)
+            ]
+            return np.concatenate([_take_shared_array(*future.result()) for future in futures])
+        except Exception as e:
+            raise EmbeddingError(f"Failed to generate batch embeddings: {str(e)}")
+
+    def get_dimension(self) -> int:
+        return self._dimension
+
+    def get_token_counter(self) -> Callable[[str], int] | None:
+        if self._tokenizer is None:
+            return None
+        return _make_token_counter(self._tokenizer)
+
+    def get_max_tokens(self) -> int | None:
+        return self._max_tokens if self._tokenizer is not None else None
+
+    def get_tokenizer_name(self) -> str | None:
+        return self._tokenizer_name
+
+    def close(self) -> None:
+        self.executor.shutdown(wait=True, cancel_futures=True)
+
+
+# Model hosted by each ProcessPoolEmbedder worker process
+_worker_embedder: LocalEmbedder | None = None
+
+
+def _init_embedding_worker(
+    model_name: str,
+    backend: str,
+    model_file: str | None,
+    dimensions: int | None,
+    threads: int
+) -> None:
+    global _worker_embedder
+    import os
+    os.environ["OMP_NUM_THREADS"] = str(threads)
+    try:
+        import torch
+        torch.set_num_threads(threads)
+    except ImportError:
+        pass
+    _worker_embedder = LocalEmbedder(model_name, backend=backend, model_file=model_file, dimensions=dimensions)
+
+
+def _describe_worker_model() -> tuple[int, int | None, str | None]:
+    return (
+        _worker_embedder.get_dimension(),
+        _worker_embedder.get_max_tokens(),
+        _worker_embedder.get_tokenizer_name()
+    )
+
+
+def _embed_in_worker(texts: list[str]) -> tuple[str, tuple[int, ...]]:
+    import numpy as np
+    from multiprocessing import shared_memory
+
+    embeddings = _worker_embedder.embed_batch(texts)
+    block = shared_memory.SharedMemory(create=True, size=max(embeddings.nbytes, 1))
+    try:
+        np.ndarray(embeddings.shape, dtype=np.float32, buffer=block.buf)[:] = embeddings
+        return block.name, embeddings.shape
+    finally:
+        block.close()
+
+
+def _take_shared_array(name: str, shape: tuple[int, ...]) -> "np.ndarray":
+    """Copy a worker's result out of shared memory and free the block."""
+    import numpy as np
+    from multiprocessing import shared_memory
+
+    block = shared_memory.SharedMemory(name=name)
+    try:
+        return np.ndarray(shape, dtype=np.float32, buffer=block.buf).copy()
+    finally:
+        block.close()
+        block.unlink()
+
+
+def _truncate_and_normalize(embeddings: "np.ndarray", dimensions: int) -> "np.ndarray":
+    """Keep the first dimensions components of each row and rescale rows to unit length."""
+    import numpy as np
+
+    truncated = np.ascontiguousarray(embeddings[:, :dimensions], dtype=np.float32)
+    norms = np.linalg.norm(truncated, axis=1, keepdims=True)
+    return truncated / np.maximum(norms, np.finfo(np.float32).tiny)
+
+
+def _load_tokenizer(name: str | None):
+    """Load only the tokenizer of a model, for chunk sizing outside the process hosting it."""
+    if not name:
+        return None
+    try:
+        from transformers import AutoTokenizer
+        return AutoTokenizer.from_pretrained(name)
+    except Exception:
+        return None
+
+
+def _make_token_counter(tokenizer) -> Callable[[str], int]:
+    def count_tokens(text: str) -> int:
+        return len(tokenizer.encode(text, add_special_tokens=False))
+
+    return count_tokens
 
 
 class OpenAIEmbedder(BaseEmbedder):
-    def __init__(self, api_key: str, model_name: str = "text-embedding-3-small"):
+    """
+    OpenAI embeddings API client.
+
+    embed_batch splits its input into sub-batches bounded by input count and
+    token budget, sends them concurrently through the async client under a
+    requests/tokens-per-minute limiter, retries transient failures with
+    exponential backoff, and returns the embeddings in input order.
+
+    The async client lives on an event loop in a daemon thread that all calls
+    share, so its connections are reused across batches and max_concurrency
+    bounds the requests in flight across concurrent embed_batch calls.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        model_name: str = "text-embedding-3-small",
+        base_url: str | None = None,
+        max_concurrency: int = 4,
+        requests_per_minute: int = 3000,
+        tokens_per_minute: int = 1_000_000,
+        batch_max_tokens: int = 100_000,
+        max_retries: int = 5,
+        dimensions: int | None = None
+    ):
         try:
             from openai import OpenAI
-            self.client = OpenAI(api_key=api_key)
+            self.client = OpenAI(api_key=api_key, base_url=base_url)
             self.model_name = model_name
-            self._dimension = 1536 if "3-small" in model_name else 3072
         except Exception as e:
             raise EmbeddingError(f"Failed to initialize OpenAI client: {str(e)}")
 
+        native_dimension = OPENAI_MODEL_DIMENSIONS.get(model_name)
+        if dimensions is not None:
+            if not model_name.startswith("text-embedding-3"):
+                raise EmbeddingError(f"Model {model_name} does not support reduced embedding dimensions")
+            if not 0 < dimensions <= (native_dimension or dimensions):
+                raise EmbeddingError(
+                    f"Embedding dimensions ({dimensions}) must be between 1 and the "
+                    f"model's native dimension ({native_dimension})"
+                )
+        self.dimensions = dimensions
+        # Unknown models are probed once instead of guessing their dimension
+        self._dimension = dimensions or native_dimension or len(self.embed_text("dimension probe"))
+
+        try:
+            import tiktoken
+            self._encoding = tiktoken.encoding_for_model(model_name)
+        except Exception:
+            self._encoding = None
+
+        self.max_concurrency = max_concurrency
+        self.batch_max_tokens = batch_max_tokens
+        self.max_retries = max_retries
+        self.rate_limiter = RateLimiter(requests_per_minute, tokens_per_minute)
+
+        from openai import AsyncOpenAI
+
+        # Retries are handled in _embed_sub_batch so they go through the rate limiter
+        self.async_client = AsyncOpenAI(api_key=api_key, base_url=base_url, max_retries=0)
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._loop = asyncio.new_event_loop()
+        self._loop_thread = threading.Thread(target=self._loop.run_forever, name="openai-embedder", daemon=True)
+        self._loop_thread.start()
+
     def embed_text(self, text: str) -> list[float]:
         try:
             response = self.client.embeddings.create(
                 input=text,
-                model=self.model_name
+                model=self.model_name,
+                **self._dimension_options()
             )
             return response.data[0].embedding
         except Exception as e:
             raise EmbeddingError(f"Failed to generate OpenAI embedding: {str(e)}")
 
-    def embed_batch(self, texts: list[str]) -> list[list[float]]:
+    def embed_batch(self, texts: list[str]) -> "np.ndarray":
+        """
+        Blocks until the embeddings are returned; ingestion calls it from a
+        worker thread via asyncio.to_thread.
+        """
+        import numpy as np
+
+        if not texts:
+            return np.empty((0, self._dimension), dtype=np.float32)
+
         try:
-            response = self.client.embeddings.create(
-                input=texts,
-                model=self.model_name
-            )
-            return [item.embedding for item in response.data]
+            embeddings = asyncio.run_coroutine_threadsafe(self._embed_batch_async(texts), self._loop).result()
+            return np.array(embeddings, dtype=np.float32)
+        except EmbeddingError:
+            raise
         except Exception as e:
             raise EmbeddingError(f"Failed to generate OpenAI batch embeddings: {str(e)}")
 
+    async def _embed_batch_async(self, texts: list[str]) -> list[list[float]]:
+        results = await asyncio.gather(*[
+            self._embed_sub_batch(sub_batch, tokens)
+            for sub_batch, tokens in self._split_batches(texts)
+        ])
+        return [embedding for result in results for embedding in result]
+
+    async def _embed_sub_batch(self, texts: list[str], tokens: int) -> list[list[float]]:
+        import openai
+
+        for attempt in range(self.max_retries + 1):
+            async with self._semaphore:
+                await self.rate_limiter.acquire(tokens)
+                try:
+                    response = await self.async_client.embeddings.create(
+                        input=texts,
+                        model=self.model_name,
+                        **self._dimension_options()
+                    )
+                    return [item.embedding for item in sorted(response.data, key=lambda item: item.index)]
+                except (openai.RateLimitError, openai.APIConnectionError, openai.InternalServerError) as e:
+                    if attempt == self.max_retries:
+                        raise EmbeddingError(
+                            f"OpenAI embeddings request failed after {self.max_retries} retries: {str(e)}"
+                        ) from e
+            # Back off without holding a slot, so other sub-batches can use it meanwhile
+            await asyncio.sleep(min(OPENAI_MAX_BACKOFF, 2 ** attempt) * (0.5 + random.random() / 2))
+
+    def _dimension_options(self) -> dict[str, int]:
+        """text-embedding-3 models return Matryoshka-truncated, normalized vectors for "dimensions"."""
+        return {"dimensions": self.dimensions} if self.dimensions is not None else {}
+
+    def _split_batches(self, texts: list[str]) -> list[tuple[list[str], int]]:
+        """Split texts into consecutive sub-batches within the per-request limits."""
+        count_tokens = self.get_token_counter() or _estimate_tokens
+        batches = []
+        batch: list[str] = []
+        batch_tokens = 0
+        for text in texts:
+            tokens = count_tokens(text)
+            if batch and (len(batch) >= OPENAI_MAX_BATCH_INPUTS or batch_tokens + tokens > self.batch_max_tokens):
+                batches.append((batch, batch_tokens))
+                batch, batch_tokens = [], 0
+            batch.append(text)
+            batch_tokens += tokens
+        if batch:
+            batches.append((batch, batch_tokens))
+        return batches
+
+    def get_dimension(self) -> int:
+        return self._dimension
+
+    def get_token_counter(self) -> Callable[[str], int] | None:
+        if self._encoding is None:
+            return None
+
+        encoding = self._encoding
+
+        def count_tokens(text: str) -> int:
+            return len(encoding.encode(text, disallowed_special=()))
+
+        return count_tokens
+
+    def get_max_tokens(self) -> int | None:
+        return OPENAI_MAX_INPUT_TOKENS if self._encoding is not None else None
+
+    def close(self) -> None:
+        asyncio.run_coroutine_threadsafe(self.async_client.close(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._loop_thread.join()
+        self._loop.close()
+        self.client.close()
+
+
+class RemoteEmbedder(BaseEmbedder):
+    """
+    Client for the standalone embedding server (app/embedding_server.py), so that
+    many API workers share one model in memory. Connects over a Unix socket when
+    socket_path is given, otherwise over HTTP to url.
+    """
+
+    def __init__(self, url: str, socket_path: str | None = None, timeout: float = 300.0):
+        try:
+            import httpx
+            transport = httpx.HTTPTransport(uds=socket_path) if socket_path else None
+            self.client = httpx.Client(base_url=url, transport=transport, timeout=timeout)
+            response = self.client.get("/info")
+            response.raise_for_status()
+            info = response.json()
+        except Exception as e:
+            raise EmbeddingError(f"Failed to connect to embedding server: {str(e)}")
+
+        self._dimension = info["dimension"]
+        self._max_tokens = info.get("max_tokens")
+        self._tokenizer_name = info.get("tokenizer")
+        self._tokenizer = _load_tokenizer(self._tokenizer_name)
+
+    def embed_text(self, text: str) -> list[float]:
+        return self.embed_batch([text])[0].tolist()
+
+    def embed_batch(self, texts: list[str]) -> "np.ndarray":
+        import numpy as np
+
+        try:
+            batches = []
+            for start in range(0, len(texts), REMOTE_MAX_BATCH_TEXTS):
+                batch = texts[start:start + REMOTE_MAX_BATCH_TEXTS]
+                response = self.client.post("/embed", json={"texts": batch})
+                response.raise_for_status()
+                batches.append(np.frombuffer(response.content, dtype="<f4").reshape(len(batch), self._dimension))
+        except Exception as e:
+            raise EmbeddingError(f"Failed to generate remote embeddings: {str(e)}")
+        if not batches:
+            return np.empty((0, self._dimension), dtype=np.float32)
+        return np.concatenate(batches) if len(batches) > 1 else batches[0]
+
     def get_dimension(self) -> int:
         return self._dimension
 
+    def get_token_counter(self) -> Callable[[str], int] | None:
+        if self._tokenizer is None:
+            return None
+        return _make_token_counter(self._tokenizer)
+
+    def get_max_tokens(self) -> int | None:
+        return self._max_tokens if self._tokenizer is not None else None
+
+    def get_tokenizer_name(self) -> str | None:
+        return self._tokenizer_name
+
+    def close(self) -> None:
+        self.client.close()
+
+
+def _estimate_tokens(text: str) -> int:
+    """Rough token count for English text when tiktoken is not installed."""
+    return len(text) // 4 + 1
 
-def create_embedder() -> BaseEmbedder:
+
+def create_embedder(provider: str | None = None) -> BaseEmbedder:
     """
     Factory function to create an embedder instance based on settings.
 
     This function should be called once during application startup
     and the instance should be managed via dependency injection.
+    provider overrides settings.embedding_provider (used by the embedding server).
     """
-    if settings.embedding_provider == "openai":
+    provider = provider or settings.embedding_provider
+
+    if provider == "remote":
+        return RemoteEmbedder(
+            url=settings.embedding_server_url,
+            socket_path=settings.embedding_server_socket
+        )
+    elif provider == "openai":
         if not settings.openai_api_key:
             raise EmbeddingError("OpenAI API key is required for OpenAI embeddings")
         return OpenAIEmbedder(
             api_key=settings.openai_api_key,
-            model_name=settings.embedding_model
+            model_name=settings.embedding_model,
+            base_url=settings.openai_base_url,
+            max_concurrency=settings.openai_max_concurrency,
+            requests_per_minute=settings.openai_requests_per_minute,
+            tokens_per_minute=settings.openai_tokens_per_minute,
+            batch_max_tokens=settings.openai_batch_max_tokens,
+            max_retries=settings.openai_max_retries,
+            dimensions=settings.embedding_dimensions
+        )
+    elif provider in LOCAL_BACKENDS and settings.embedding_workers > 0:
+        return ProcessPoolEmbedder(
+            model_name=settings.embedding_model,
+            workers=settings.embedding_workers,
+            threads_per_worker=settings.embedding_threads_per_worker,
+            backend=LOCAL_BACKENDS[provider],
+            model_file=settings.embedding_model_file,
+            dimensions=settings.embedding_dimensions
+        )
+    elif provider in LOCAL_BACKENDS:
+        return LocalEmbedder(
+            model_name=settings.embedding_model,
+            backend=LOCAL_BACKENDS[provider],
+            model_file=settings.embedding_model_file,
+            dimensions=settings.embedding_dimensions
         )
     else:
-        return LocalEmbedder(model_name=settings.embedding_model)
+        raise EmbeddingError(f"Unknown embedding provider: {provider}")
+
+
+class EmbedderLoader:
+    """
+    Loads the embedder in a background thread so the API can serve requests
+    that do not need it while the model is loading. A failed load is retried
+    with exponential backoff, e.g. until the embedding server is reachable.
+    """
+
+    def __init__(self, factory: Callable[[], BaseEmbedder] = create_embedder):
+        self.factory = factory
+        self.embedder: BaseEmbedder | None = None
+        self.error: Exception | None = None
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        """Schedule loading on the running event loop."""
+        self._task = asyncio.create_task(self._load())
+
+    async def _load(self) -> None:
+        attempt = 0
+        while True:
+            try:
+                self.embedder = await _run_in_daemon_thread(self.factory)
+                self.error = None
+                return
+            except Exception as e:
+                self.error = e
+            await asyncio.sleep(min(EMBEDDER_LOAD_MAX_BACKOFF, 2 ** attempt))
+            attempt += 1
+
+    @property
+    def status(self) -> str:
+        if self.embedder is not None:
+            return "ready"
+        if self.error is not None:
+            return "failed"
+        return "loading"
+
+    async def wait(self, timeout: float | None = None) -> BaseEmbedder:
+        """Return the embedder once loaded, waiting at most timeout seconds."""
+        if self.embedder is not None:
+            return self.embedder
+        if self._task is None:
+            raise EmbedderNotReadyError("Embedding model loading has not started")
+        if self.error is not None:
+            raise EmbedderNotReadyError(f"Embedding model failed to load, retrying: {str(self.error)}")
+
+        try:
+            await asyncio.wait_for(asyncio.shield(self._task), timeout)
+        except asyncio.TimeoutError:
+            if self.error is not None:
+                raise EmbedderNotReadyError(f"Embedding model failed to load, retrying: {str(self.error)}")
+            raise EmbedderNotReadyError("Embedding model is still loading, try again shortly")
+        return self.embedder
+
+    async def close(self) -> None:
+        """Stop loading without waiting for an in-progress attempt, then release the embedder."""
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+        if self.embedder is not None:
+            self.embedder.close()
+
+
+def _run_in_daemon_thread(function: Callable[[], BaseEmbedder]) -> "asyncio.Future[BaseEmbedder]":
+    """
+    Like asyncio.to_thread, but in a daemon thread: asyncio.run joins the default
+    executor on exit, which would hold up shutdown until a model load finished.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+
+    def settle(result: BaseEmbedder | None, error: Exception | None) -> None:
+        if future.done():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+    def run() -> None:
+        result, error = None, None
+        try:
+            result = function()
+        except Exception as e:
+            error = e
+        try:
+            loop.call_soon_threadsafe(settle, result, error)
+        except RuntimeError:
+            # The loop closed during shutdown while the model was loading
+            pass
+
+    threading.Thread(target=run, name="embedder-loader", daemon=True).start()
+    return future
@@ -1,11 +1,15 @@
 import asyncio
 import io
+import time
 import uuid
+from contextlib import ExitStack
 from datetime import datetime, timezone
+from typing import TYPE_CHECKING, AsyncIterator, Awaitable, Callable, Iterator, NoReturn
 
+from pydantic import TypeAdapter
+from pymongo import ReturnDocument
 from pymongo.database import Database
 from pymongo.errors import PyMongoError
-from qdrant_client import QdrantClient
 
 from app.config import settings
 from app.database import get_database
@@ -18,18 +22,59 @@ from app.exceptions import (
     VectorStoreError,
     CourseNotFoundError
 )
+from app.metrics import (
+    INGESTION_DOCUMENTS_PENDING,
+    INGESTION_JOB_SECONDS,
+    INGESTION_JOBS_IN_PROGRESS,
+    track_embedding_batch
+)
 from app.models.document import DocumentStatus
 from app.models.ingestion import (
     IngestionMode,
     IngestionStatus,
     IngestionJobResponse,
-    IngestionJobCreate
+    IngestionJobCreate,
+    IngestionJobStats
 )
 from app.services.s3 import download_file_from_s3
-from app.services.pdf import extract_and_chunk_pdf
+from app.services.pdf import EXTRACTOR_VERSION, extract_pages_from_pdf
+from app.services.chunker import chunk_pages
+from app.services.text_cache import load_cached_pages, store_cached_pages
 from app.services.embedder import BaseEmbedder
 from app.services.qdrant import ensure_collection_exists, store_vectors, delete_document_vectors
+from app.services.ingestion_events import ingestion_events
+from app.services.cancellation import CancellationToken, cancellation_watcher
+from app.services.ingestion_progress import DocumentStats, IngestionProgressReporter
 from app.services.log import log_event
+from app.services.pagination import paginate
+from app.services.profiler import profiler
+from app.tracing import span
+
+if TYPE_CHECKING:
+    from qdrant_client import QdrantClient
+
+
+TERMINAL_STATUSES = {IngestionStatus.COMPLETED, IngestionStatus.FAILED, IngestionStatus.CANCELED}
+
+# Only the fields of IngestionJobResponse; leaves out document_ids, which can hold up to 1000 ids
+JOB_RESPONSE_PROJECTION = {"_id": 0, **{field: 1 for field in IngestionJobResponse.model_fields}}
+
+# Built once; validating a page with it is cheaper than constructing models one by one
+JOB_LIST_ADAPTER = TypeAdapter(list[IngestionJobResponse])
+
+# Fields older job records may lack
+JOB_RESPONSE_DEFAULTS = {
+    "error_message": None,
+    "retry_count": 0,
+    "max_retries": 3,
+    "stats": IngestionJobStats().model_dump()
+}
+
+# Newest first, with job_id as the unique tie-breaker that `after` refers to
+JOB_LIST_SORT = [("created_at", -1), ("job_id", -1)]
+
+# Fields a worker needs once it has claimed a job
+JOB_CLAIM_PROJECTION = {"_id": 0, "course_code": 1, "mode": 1, "document_ids": 1}
 
 
 def create_ingestion_job(
@@ -99,65 +144,120 @@ def create_ingestion_job(
 
 
 def get_ingestion_job(job_id: str, db: Database) -> IngestionJobResponse:
-    job = db.ingestion_jobs.find_one({"job_id": job_id})
+    job = db.ingestion_jobs.find_one({"job_id": job_id}, JOB_RESPONSE_PROJECTION)
     if job is None:
         raise IngestionJobNotFoundError(f"Ingestion job {job_id} not found")
 
-    return IngestionJobResponse(
-        job_id=job["job_id"],
-        course_code=job["course_code"],
-        status=IngestionStatus(job["status"]),
-        mode=IngestionMode(job["mode"]),
-        docs_total=job["docs_total"],
-        docs_done=job["docs_done"],
-        vectors_created=job["vectors_created"],
-        created_at=job["created_at"],
-        updated_at=job["updated_at"],
-        created_by=job["created_by"],
-        error_message=job.get("error_message"),
-        retry_count=job.get("retry_count", 0),
-        max_retries=job.get("max_retries", 3)
+    return _to_job_response(job)
+
+
+def iter_ingestion_jobs(
+    course_code: str,
+    db: Database,
+    limit: int | None = None,
+    after: str | None = None
+) -> Iterator[dict]:
+    """Yield a course's jobs as plain dicts with the IngestionJobResponse fields, newest first."""
+    jobs = paginate(
+        db.ingestion_jobs,
+        {"course_code": course_code},
+        JOB_LIST_SORT,
+        JOB_RESPONSE_PROJECTION,
+        limit,
+        after
     )
+    return (_with_defaults(job) for job in jobs)
 
 
-def list_ingestion_jobs(course_code: str, db: Database) -> list[IngestionJobResponse]:
-    jobs = []
-    for job in db.ingestion_jobs.find({"course_code": course_code}).sort("created_at", -1):
-        jobs.append(IngestionJobResponse(
-            job_id=job["job_id"],
-            course_code=job["course_code"],
-            status=IngestionStatus(job["status"]),
-            mode=IngestionMode(job["mode"]),
-            docs_total=job["docs_total"],
-            docs_done=job["docs_done"],
-            vectors_created=job["vectors_created"],
-            created_at=job["created_at"],
-            updated_at=job["updated_at"],
-            created_by=job["created_by"],
-            error_message=job.get("error_message"),
-            retry_count=job.get("retry_count", 0),
-            max_retries=job.get("max_retries", 3)
-        ))
-    return jobs
+def list_ingestion_jobs(
+    course_code: str,
+    db: Database,
+    limit: int,
+    after: str | None = None
+) -> list[IngestionJobResponse]:
+    return JOB_LIST_ADAPTER.validate_python(list(iter_ingestion_jobs(course_code, db, limit, after)))
+
+
+def _with_defaults(job: dict) -> dict:
+    """Fill in the fields older jobs lack; stats only has the fields that were $inc'd."""
+    return {
+        **JOB_RESPONSE_DEFAULTS,
+        **job,
+        "stats": {**JOB_RESPONSE_DEFAULTS["stats"], **job.get("stats", {})}
+    }
 
 
-def cancel_ingestion_job(job_id: str, user_email: str, db: Database) -> IngestionJobResponse:
-    job = db.ingestion_jobs.find_one({"job_id": job_id})
-    if job is None:
-        raise IngestionJobNotFoundError(f"Ingestion job {job_id} not found")
+def _to_job_response(job: dict) -> IngestionJobResponse:
+    return IngestionJobResponse.model_validate(_with_defaults(job))
 
-    if job["status"] in [IngestionStatus.COMPLETED.value, IngestionStatus.FAILED.value, IngestionStatus.CANCELED.value]:
-        raise IngestionJobError(f"Cannot cancel job with status {job['status']}")
 
-    db.ingestion_jobs.update_one(
-        {"job_id": job_id},
+async def stream_ingestion_job(
+    job: IngestionJobResponse,
+    db: Database,
+    is_disconnected: Callable[[], Awaitable[bool]]
+) -> AsyncIterator[str]:
+    """
+    Yield Server-Sent Events with the job's state: one immediately, then one per
+    change until the job reaches a terminal status or the client disconnects.
+
+    Changes made in this process arrive through ingestion_events; the job is also
+    re-read every ingestion_events_poll_interval seconds to pick up changes made
+    by other workers. Unchanged polls send a keep-alive comment instead.
+    """
+    with ingestion_events.subscribe(job.job_id) as changes:
+        yield _format_job_event(job)
+
+        while job.status not in TERMINAL_STATUSES:
+            try:
+                await asyncio.wait_for(changes.get(), settings.ingestion_events_poll_interval)
+            except asyncio.TimeoutError:
+                pass
+
+            if await is_disconnected():
+                return
+
+            try:
+                current = get_ingestion_job(job.job_id, db)
+            except IngestionJobNotFoundError:
+                return
+
+            if current == job:
+                yield ": keep-alive\n\n"
+                continue
+
+            job = current
+            yield _format_job_event(job)
+
+
+def _format_job_event(job: IngestionJobResponse) -> str:
+    return f"event: status\ndata: {job.model_dump_json()}\n\n"
+
+
+def cancel_ingestion_job(job_id: str, user_email: str, db: Database) -> IngestionJobResponse:
+    # The status check and the update are one atomic operation; the job is only
+    # read again to explain a refusal
+    job = db.ingestion_jobs.find_one_and_update(
+        {
+            "job_id": job_id,
+            "status": {"$nin": [status.value for status in TERMINAL_STATUSES]}
+        },
         {
             "$set": {
                 "status": IngestionStatus.CANCELED.value,
                 "updated_at": datetime.now(timezone.utc)
             }
-        }
+        },
+        projection=JOB_RESPONSE_PROJECTION,
+        return_document=ReturnDocument.AFTER
     )
+    if job is None:
+        current_job = db.ingestion_jobs.find_one({"job_id": job_id}, {"_id": 0, "status": 1})
+        if current_job is None:
+            raise IngestionJobNotFoundError(f"Ingestion job {job_id} not found")
+        raise IngestionJobError(f"Cannot cancel job with status {current_job['status']}")
+
+    cancellation_watcher.cancel(job_id)
+    ingestion_events.publish(job_id)
 
     log_event(
         "ingestion_job_canceled",
@@ -166,70 +266,40 @@ def cancel_ingestion_job(job_id: str, user_email: str, db: Database) -> Ingestio
         details={"job_id": job_id}
     )
 
-    return get_ingestion_job(job_id, db)
+    return _to_job_response(job)
 
 
-async def process_ingestion_job(job_id: str, embedder: BaseEmbedder, qdrant_client: QdrantClient) -> None:
-    db = get_database()
+async def process_ingestion_job(job_id: str, embedder: BaseEmbedder, qdrant_client: "QdrantClient") -> None:
+    with span("ingestion.job", job_id=job_id):
+        await _run_ingestion_job(job_id, embedder, qdrant_client)
 
-    try:
-        # Atomic update to claim the job - prevents race conditions
-        # Only update to RUNNING if status is currently QUEUED
-        result = db.ingestion_jobs.update_one(
-            {
-                "job_id": job_id,
-                "status": IngestionStatus.QUEUED.value
-            },
-            {
-                "$set": {
-                    "status": IngestionStatus.RUNNING.value,
-                    "updated_at": datetime.now(timezone.utc)
-                }
-            }
-        )
-
-        if result.matched_count == 0:
-            job = db.ingestion_jobs.find_one({"job_id": job_id})
-            if job is None:
-                log_event(
-                    "ingestion_job_not_found",
-                    level="warning",
-                    details={"job_id": job_id}
-                )
-                return
-
-            if job["status"] == IngestionStatus.RUNNING.value:
-                log_event(
-                    "ingestion_job_already_running",
-                    level="info",
-                    details={"job_id": job_id, "reason": "Job is already being processed by another worker"}
-                )
-                return
-
-            if job["status"] == IngestionStatus.CANCELED.value:
-                log_event(
-                    "ingestion_job_skipped",
-                    level="info",
-                    details={"job_id": job_id, "reason": "Job was canceled before processing"}
-                )
-                return
 
-            log_event(
-                "ingestion_job_wrong_status",
-                level="warning",
-                details={"job_id": job_id, "status": job["status"], "reason": "Job is not in QUEUED status"}
-            )
-            return
+async def _run_ingestion_job(job_id: str, embedder: BaseEmbedder, qdrant_client: "QdrantClient") -> None:
+    db = get_database()
+    cancellation = cancellation_watcher.register(job_id)
+    progress = IngestionProgressReporter(
+        job_id,
+        db,
+        batch_size=settings.ingestion_progress_batch_size,
+        max_lag=settings.ingestion_progress_max_lag
+    )
+    # Closed last, so that a job profile also covers the final writes
+    profiling = ExitStack()
+    periodic_flush = None
+    started = None
+    # Final status for the duration metric; anything not completed or canceled failed
+    outcome = IngestionStatus.FAILED
+    docs_pending = 0
 
-        # Fetch the updated job with RUNNING status
-        job = db.ingestion_jobs.find_one({"job_id": job_id})
+    try:
+        job = _claim_ingestion_job(job_id, db)
         if job is None:
-            log_event(
-                "ingestion_job_disappeared",
-                level="error",
-                details={"job_id": job_id}
-            )
             return
+        profiling.enter_context(profiler.profile_job(job_id, db))
+        periodic_flush = asyncio.create_task(progress.flush_periodically())
+
+        started = time.perf_counter()
+        INGESTION_JOBS_IN_PROGRESS.inc()
 
         ensure_collection_exists(qdrant_client, embedder.get_dimension())
 
@@ -239,39 +309,31 @@ async def process_ingestion_job(job_id: str, embedder: BaseEmbedder, qdrant_clie
             document_ids=job.get("document_ids"),
             db=db
         )
+        docs_pending = len(documents)
+        INGESTION_DOCUMENTS_PENDING.inc(docs_pending)
 
         for doc in documents:
-            if _is_job_canceled(job_id, db):
+            if cancellation.canceled:
+                outcome = IngestionStatus.CANCELED
                 return
 
+            docs_pending -= 1
+            INGESTION_DOCUMENTS_PENDING.dec()
+            stats = DocumentStats()
             try:
-                num_vectors = await asyncio.to_thread(
-                    _process_document,
-                    document=doc,
-                    embedder=embedder,
-                    qdrant_client=qdrant_client,
-                    job_id=job_id,
-                    db=db
-                )
-
-                db.documents.update_one(
-                    {"document_id": doc["document_id"]},
-                    {"$set": {"status": DocumentStatus.INGESTED.value}}
-                )
-
-                db.ingestion_jobs.update_one(
-                    {"job_id": job_id},
-                    {
-                        "$inc": {"docs_done": 1, "vectors_created": num_vectors},
-                        "$set": {"updated_at": datetime.now(timezone.utc)}
-                    }
-                )
-
-            except (StorageError, PDFExtractionError, EmbeddingError, VectorStoreError, PyMongoError) as e:
-                db.documents.update_one(
-                    {"document_id": doc["document_id"]},
-                    {"$set": {"status": DocumentStatus.FAILED.value}}
-                )
+                with span("ingestion.document", job_id=job_id, document_id=doc["document_id"]):
+                    num_vectors = await asyncio.to_thread(
+                        _process_document,
+                        document=doc,
+                        embedder=embedder,
+                        qdrant_client=qdrant_client,
+                        cancellation=cancellation,
+                        stats=stats
+                    )
+                progress.document_ingested(doc["document_id"], num_vectors, stats)
+
+            except (StorageError, PDFExtractionError, EmbeddingError, VectorStoreError) as e:
+                progress.document_failed(doc["document_id"], stats)
 
                 log_event(
                     "ingestion_document_failed",
@@ -284,33 +346,43 @@ async def process_ingestion_job(job_id: str, embedder: BaseEmbedder, qdrant_clie
                     }
                 )
 
-        db.ingestion_jobs.update_one(
-            {"job_id": job_id},
+        progress.flush()
+
+        # Only a RUNNING job completes; one canceled after its last document keeps CANCELED
+        final_job = db.ingestion_jobs.find_one_and_update(
+            {"job_id": job_id, "status": IngestionStatus.RUNNING.value},
             {
                 "$set": {
                     "status": IngestionStatus.COMPLETED.value,
                     "updated_at": datetime.now(timezone.utc)
                 }
-            }
+            },
+            projection={"_id": 0, "docs_done": 1, "vectors_created": 1},
+            return_document=ReturnDocument.AFTER
         )
+        if final_job is None:
+            outcome = IngestionStatus.CANCELED
+            return
+        outcome = IngestionStatus.COMPLETED
+        ingestion_events.publish(job_id)
 
-        final_job = db.ingestion_jobs.find_one({"job_id": job_id})
         log_event(
             "ingestion_job_completed",
             level="info",
             details={
                 "job_id": job_id,
-                "docs_done": final_job.get("docs_done", 0) if final_job else 0,
-                "vectors_created": final_job.get("vectors_created", 0) if final_job else 0
+                "docs_done": final_job.get("docs_done", 0),
+                "vectors_created": final_job.get("vectors_created", 0)
             }
         )
 
     except (StorageError, PDFExtractionError, EmbeddingError, VectorStoreError, PyMongoError, IngestionJobError) as e:
-        current_job = db.ingestion_jobs.find_one({"job_id": job_id})
-        retry_count = current_job.get("retry_count", 0) if current_job else 0
-        max_retries = current_job.get("max_retries", 3) if current_job else 3
+        # Cancellation interrupts the current document; the job keeps its CANCELED status
+        if cancellation.canceled:
+            outcome = IngestionStatus.CANCELED
+            return
 
-        db.ingestion_jobs.update_one(
+        current_job = db.ingestion_jobs.find_one_and_update(
             {"job_id": job_id},
             {
                 "$set": {
@@ -318,8 +390,14 @@ async def process_ingestion_job(job_id: str, embedder: BaseEmbedder, qdrant_clie
                     "error_message": str(e),
                     "updated_at": datetime.now(timezone.utc)
                 }
-            }
+            },
+            projection={"_id": 0, "retry_count": 1, "max_retries": 1},
+            return_document=ReturnDocument.AFTER
         )
+        ingestion_events.publish(job_id)
+
+        retry_count = current_job.get("retry_count", 0) if current_job else 0
+        max_retries = current_job.get("max_retries", 3) if current_job else 3
 
         log_event(
             "ingestion_job_failed",
@@ -334,16 +412,81 @@ async def process_ingestion_job(job_id: str, embedder: BaseEmbedder, qdrant_clie
             }
         )
 
+    finally:
+        cancellation_watcher.unregister(job_id)
+        if started is not None:
+            INGESTION_DOCUMENTS_PENDING.dec(docs_pending)
+            INGESTION_JOBS_IN_PROGRESS.dec()
+            INGESTION_JOB_SECONDS.labels(outcome.value).observe(time.perf_counter() - started)
+        if periodic_flush is not None:
+            periodic_flush.cancel()
+        # Record the documents finished before a cancellation or failure
+        progress.flush()
+        profiling.close()
+
+
+def _claim_ingestion_job(job_id: str, db: Database) -> dict | None:
+    """
+    Atomically move a QUEUED job to RUNNING and return the fields needed to
+    process it, or None (logging why) if it cannot be claimed. The job is only
+    read again when the claim fails.
+    """
+    job = db.ingestion_jobs.find_one_and_update(
+        {
+            "job_id": job_id,
+            "status": IngestionStatus.QUEUED.value
+        },
+        {
+            "$set": {
+                "status": IngestionStatus.RUNNING.value,
+                "updated_at": datetime.now(timezone.utc)
+            }
+        },
+        projection=JOB_CLAIM_PROJECTION,
+        return_document=ReturnDocument.AFTER
+    )
+    if job is not None:
+        ingestion_events.publish(job_id)
+        return job
+
+    job = db.ingestion_jobs.find_one({"job_id": job_id}, {"_id": 0, "status": 1})
+    if job is None:
+        log_event(
+            "ingestion_job_not_found",
+            level="warning",
+            details={"job_id": job_id}
+        )
+    elif job["status"] == IngestionStatus.RUNNING.value:
+        log_event(
+            "ingestion_job_already_running",
+            level="info",
+            details={"job_id": job_id, "reason": "Job is already being processed by another worker"}
+        )
+    elif job["status"] == IngestionStatus.CANCELED.value:
+        log_event(
+            "ingestion_job_skipped",
+            level="info",
+            details={"job_id": job_id, "reason": "Job was canceled before processing"}
+        )
+    else:
+        log_event(
+            "ingestion_job_wrong_status",
+            level="warning",
+            details={"job_id": job_id, "status": job["status"], "reason": "Job is not in QUEUED status"}
+        )
+    return None
+
 
 def _process_document(
     document: dict,
     embedder: BaseEmbedder,
-    qdrant_client: QdrantClient,
-    job_id: str,
-    db: Database
+    qdrant_client: "QdrantClient",
+    cancellation: CancellationToken,
+    stats: DocumentStats
 ) -> int:
     """
-    Process a document by extracting text, generating embeddings, and storing vectors.
+    Process a document by extracting text, generating embeddings, and storing vectors,
+    recording the duration and size of each stage in stats.
 
     This function ensures proper cleanup on failure:
     - Checks for job cancellation at multiple points
@@ -354,56 +497,121 @@ def _process_document(
     document_id = document["document_id"]
     s3_key = document["s3_key"]
 
-    try:
-        pdf_content = download_file_from_s3(s3_key)
-        pdf_file = io.BytesIO(pdf_content)
+    # Lets a profile armed for the job sample this worker thread
+    with profiler.job_thread(cancellation.job_id):
+        try:
+            with stats.stage("download"):
+                pages = _load_cached_pages(document_id, s3_key)
+                if pages is None:
+                    pdf_content = download_file_from_s3(s3_key)
+                    stats.add("bytes_downloaded", len(pdf_content))
+
+            if pages is None:
+                if cancellation.canceled:
+                    raise IngestionJobError("Job was canceled during document processing")
+
+                with stats.stage("extraction"):
+                    pages = extract_pages_from_pdf(io.BytesIO(pdf_content))
+                _store_cached_pages(document_id, s3_key, pages)
+            stats.add("pages", len(pages))
+
+            with stats.stage("chunking"):
+                chunk_size, chunk_overlap, length_function = _get_chunk_sizing(embedder)
+                chunks = chunk_pages(pages, chunk_size, chunk_overlap, length_function)
+            stats.add("chunks", len(chunks))
+
+            if not chunks:
+                return 0
+
+            if cancellation.canceled:
+                raise IngestionJobError("Job was canceled during document processing")
+
+            with stats.stage("embedding"), track_embedding_batch(len(chunks)):
+                vectors = embedder.embed_batch([chunk.text for chunk in chunks])
+
+            if cancellation.canceled:
+                raise IngestionJobError("Job was canceled during document processing")
+
+            with stats.stage("upsert"):
+                delete_document_vectors(qdrant_client, document_id)
+
+                num_vectors = store_vectors(
+                    client=qdrant_client,
+                    course_code=document["course_code"],
+                    document_id=document_id,
+                    vectors=vectors,
+                    chunks=chunks,
+                    metadata={
+                        "filename": document["filename"],
+                        "uploaded_by": document["uploaded_by"]
+                    }
+                )
 
-        if _is_job_canceled(job_id, db):
-            raise IngestionJobError("Job was canceled during document processing")
+            return num_vectors
 
-        chunks = extract_and_chunk_pdf(pdf_file, settings.chunk_size, settings.chunk_overlap)
+        except (StorageError, PDFExtractionError, EmbeddingError, VectorStoreError) as e:
+            try:
+                delete_document_vectors(qdrant_client, document_id)
+            except VectorStoreError as cleanup_error:
+                log_event(
+                    "vector_cleanup_failed",
+                    level="warning",
+                    details={
+                        "document_id": document_id,
+                        "cleanup_error": str(cleanup_error),
+                        "original_error": str(e)
+                    }
+                )
+            raise
 
-        if not chunks:
-            return 0
 
-        if _is_job_canceled(job_id, db):
-            raise IngestionJobError("Job was canceled during document processing")
+def _load_cached_pages(document_id: str, s3_key: str) -> list[str] | None:
+    """
+    Return previously extracted page text so that re-chunking and re-embedding
+    skip the S3 download and PDF parsing. Cache errors are treated as a miss.
+    """
+    if not settings.text_cache_enabled:
+        return None
 
-        vectors = embedder.embed_batch(chunks)
+    try:
+        return load_cached_pages(s3_key, EXTRACTOR_VERSION)
+    except StorageError as e:
+        log_event(
+            "text_cache_read_failed",
+            level="warning",
+            details={"document_id": document_id, "error": str(e)}
+        )
+        return None
 
-        if _is_job_canceled(job_id, db):
-            raise IngestionJobError("Job was canceled during document processing")
 
-        delete_document_vectors(qdrant_client, document_id)
+def _store_cached_pages(document_id: str, s3_key: str, pages: list[str]) -> None:
+    if not settings.text_cache_enabled:
+        return
 
-        num_vectors = store_vectors(
-            client=qdrant_client,
-            course_code=document["course_code"],
-            document_id=document_id,
-            vectors=vectors,
-            chunks=chunks,
-            metadata={
-                "filename": document["filename"],
-                "uploaded_by": document["uploaded_by"]
-            }
+    try:
+        store_cached_pages(s3_key, EXTRACTOR_VERSION, pages)
+    except StorageError as e:
+        log_event(
+            "text_cache_write_failed",
+            level="warning",
+            details={"document_id": document_id, "error": str(e)}
         )
 
-        return num_vectors
 
-    except (StorageError, PDFExtractionError, EmbeddingError, VectorStoreError) as e:
-        try:
-            delete_document_vectors(qdrant_client, document_id)
-        except VectorStoreError as cleanup_error:
-            log_event(
-                "vector_cleanup_failed",
-                level="warning",
-                details={
-                    "document_id": document_id,
-                    "cleanup_error": str(cleanup_error),
-                    "original_error": str(e)
-                }
-            )
-        raise
+def _get_chunk_sizing(embedder: BaseEmbedder) -> tuple[int, int, Callable[[str], int] | None]:
+    """
+    Size chunks with the embedder's tokenizer when it has one, so that no chunk
+    exceeds the model's max sequence length and gets silently truncated.
+    Falls back to the character-based chunk_size/chunk_overlap settings.
+    """
+    token_counter = embedder.get_token_counter()
+    max_tokens = embedder.get_max_tokens()
+    if token_counter is None or max_tokens is None:
+        return settings.chunk_size, settings.chunk_overlap, None
+
+    chunk_size = min(settings.chunk_max_tokens, max_tokens)
+    chunk_overlap = min(settings.chunk_overlap_tokens, chunk_size // 2)
+    return chunk_size, chunk_overlap, token_counter
 
 
 def _get_documents_for_ingestion(
@@ -437,29 +645,13 @@ def _get_documents_for_ingestion(
     return list(db.documents.find(query))
 
 
-def _is_job_canceled(job_id: str, db: Database) -> bool:
-    job = db.ingestion_jobs.find_one({"job_id": job_id})
-    return job is not None and job["status"] == IngestionStatus.CANCELED.value
-
-
 def retry_ingestion_job(job_id: str, db: Database) -> IngestionJobResponse:
-    job = db.ingestion_jobs.find_one({"job_id": job_id})
-    if job is None:
-        raise IngestionJobNotFoundError(f"Ingestion job {job_id} not found")
-
-    if job["status"] != IngestionStatus.FAILED.value:
-        raise IngestionJobError(f"Can only retry failed jobs. Current status: {job['status']}")
-
-    retry_count = job.get("retry_count", 0)
-    max_retries = job.get("max_retries", 3)
-
-    if retry_count >= max_retries:
-        raise IngestionJobError(
-            f"Job has already been retried {retry_count} times (max: {max_retries})"
-        )
-
-    db.ingestion_jobs.update_one(
-        {"job_id": job_id},
+    job = db.ingestion_jobs.find_one_and_update(
+        {
+            "job_id": job_id,
+            "status": IngestionStatus.FAILED.value,
+            "$expr": {"$lt": [{"$ifNull": ["$retry_count", 0]}, {"$ifNull": ["$max_retries", 3]}]}
+        },
         {
             "$set": {
                 "status": IngestionStatus.QUEUED.value,
@@ -467,17 +659,40 @@ def retry_ingestion_job(job_id: str, db: Database) -> IngestionJobResponse:
                 "updated_at": datetime.now(timezone.utc)
             },
             "$inc": {"retry_count": 1}
-        }
+        },
+        projection=JOB_RESPONSE_PROJECTION,
+        return_document=ReturnDocument.AFTER
     )
+    if job is None:
+        _raise_retry_refused(job_id, db)
+    ingestion_events.publish(job_id)
 
     log_event(
         "ingestion_job_retried",
         level="info",
         details={
             "job_id": job_id,
-            "retry_count": retry_count + 1,
-            "max_retries": max_retries
+            "retry_count": job["retry_count"],
+            "max_retries": job.get("max_retries", 3)
         }
     )
 
-    return get_ingestion_job(job_id, db)
+    return _to_job_response(job)
+
+
+def _raise_retry_refused(job_id: str, db: Database) -> NoReturn:
+    job = db.ingestion_jobs.find_one(
+        {"job_id": job_id},
+        {"_id": 0, "status": 1, "retry_count": 1, "max_retries": 1}
+    )
+    if job is None:
+        raise IngestionJobNotFoundError(f"Ingestion job {job_id} not found")
+
+    if job["status"] != IngestionStatus.FAILED.value:
+        raise IngestionJobError(f"Can only retry failed jobs. Current status: {job['status']}")
+
+    retry_count = job.get("retry_count", 0)
+    max_retries = job.get("max_retries", 3)
+    raise IngestionJobError(
+        f"Job has already been retried {retry_count} times (max: {max_retries})"
+    )
@@ -0,0 +1,54 @@
+import asyncio
+import threading
+from contextlib import contextmanager
+from typing import Iterator
+
+
+class IngestionEventBus:
+    """
+    In-process notifications of ingestion job changes, used to push progress to
+    streaming clients instead of having them poll.
+
+    Events only reach subscribers in the same process; streams combine them with
+    a periodic database read to follow jobs processed by other workers.
+    """
+
+    def __init__(self):
+        self._subscribers: dict[str, set[tuple[asyncio.AbstractEventLoop, asyncio.Queue]]] = {}
+        self._lock = threading.Lock()
+
+    def publish(self, job_id: str) -> None:
+        """Notify subscribers of a job that it changed. Safe to call from any thread."""
+        with self._lock:
+            subscribers = list(self._subscribers.get(job_id, ()))
+        for loop, queue in subscribers:
+            try:
+                loop.call_soon_threadsafe(_notify, queue)
+            except RuntimeError:
+                # Subscriber's event loop already closed
+                pass
+
+    @contextmanager
+    def subscribe(self, job_id: str) -> Iterator[asyncio.Queue]:
+        """Yield a queue that receives an item whenever the job changes."""
+        subscriber = (asyncio.get_running_loop(), asyncio.Queue(maxsize=1))
+        with self._lock:
+            self._subscribers.setdefault(job_id, set()).add(subscriber)
+        try:
+            yield subscriber[1]
+        finally:
+            with self._lock:
+                subscribers = self._subscribers.get(job_id)
+                if subscribers is not None:
+                    subscribers.discard(subscriber)
+                    if not subscribers:
+                        del self._subscribers[job_id]
+
+
+def _notify(queue: asyncio.Queue) -> None:
+    # Notifications carry no data, so one pending item is enough
+    if queue.empty():
+        queue.put_nowait(None)
+
+
+ingestion_events = IngestionEventBus()
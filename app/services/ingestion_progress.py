@@ -0,0 +1,143 @@
+import asyncio
+import logging
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Iterator
+
+from pymongo import UpdateMany
+from pymongo.database import Database
+from pymongo.errors import PyMongoError
+
+from app.models.document import DocumentStatus
+from app.tracing import span
+from app.services.ingestion_events import ingestion_events
+
+logger = logging.getLogger(__name__)
+
+
+class DocumentStats:
+    """
+    Stage durations and sizes of one document, keyed by IngestionJobStats field.
+    Filled in as stages finish, so a document that fails keeps its completed stages.
+    """
+
+    def __init__(self):
+        self.values: dict[str, float] = {}
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            with span(f"ingestion.{name}"):
+                yield
+        finally:
+            self.add(f"{name}_seconds", time.perf_counter() - start)
+
+    def add(self, field: str, amount: float) -> None:
+        self.values[field] = self.values.get(field, 0) + amount
+
+
+class IngestionProgressReporter:
+    """
+    Coalesces the per-document writes of an ingestion job.
+
+    Document status changes and the job's docs_done/vectors_created counters are
+    accumulated in memory and written with one bulk_write and one job update once
+    batch_size documents are pending or max_lag seconds have passed since the
+    last flush. Documents can take minutes each, so flush_periodically must run
+    alongside the job to write changes that become due between two documents;
+    together they keep the job record at most max_lag seconds behind.
+    A flush that fails is logged and its changes are kept for the next one, so
+    a MongoDB error while recording progress never fails the job.
+    Document stats are summed into the job's stats the same way.
+    """
+
+    def __init__(self, job_id: str, db: Database, batch_size: int, max_lag: float):
+        self.job_id = job_id
+        self.db = db
+        self.batch_size = batch_size
+        self.max_lag = max_lag
+        self._statuses: dict[str, DocumentStatus] = {}
+        self._docs_done = 0
+        self._vectors_created = 0
+        self._stats: dict[str, float] = {}
+        self._last_flush = time.monotonic()
+
+    def document_ingested(self, document_id: str, num_vectors: int, stats: DocumentStats) -> None:
+        self._statuses[document_id] = DocumentStatus.INGESTED
+        self._docs_done += 1
+        self._vectors_created += num_vectors
+        self._add_stats(stats)
+        self._flush_if_due()
+
+    def document_failed(self, document_id: str, stats: DocumentStats) -> None:
+        self._statuses[document_id] = DocumentStatus.FAILED
+        self._add_stats(stats)
+        self._flush_if_due()
+
+    @property
+    def pending(self) -> bool:
+        return bool(self._statuses or self._docs_done or self._vectors_created or self._stats)
+
+    async def flush_periodically(self) -> None:
+        """Flush pending changes once they are due, until cancelled. Must run on the loop reporting progress."""
+        if self.max_lag <= 0:
+            # Every finished document is flushed immediately
+            return
+        while True:
+            wait = self._last_flush + self.max_lag - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            elif self.pending:
+                self.flush()
+            else:
+                await asyncio.sleep(self.max_lag)
+
+    def flush(self) -> None:
+        try:
+            self._write_pending()
+        except PyMongoError as e:
+            # Logged locally: the logs collection is likely unreachable as well
+            logger.warning(f"Ingestion progress flush failed for job {self.job_id}: {str(e)}")
+        self._last_flush = time.monotonic()
+
+    def _write_pending(self) -> None:
+        if self._statuses:
+            document_ids: dict[DocumentStatus, list[str]] = {}
+            for document_id, status in self._statuses.items():
+                document_ids.setdefault(status, []).append(document_id)
+            self.db.documents.bulk_write(
+                [
+                    UpdateMany({"document_id": {"$in": ids}}, {"$set": {"status": status.value}})
+                    for status, ids in document_ids.items()
+                ],
+                ordered=False
+            )
+            self._statuses.clear()
+
+        if self._docs_done or self._vectors_created or self._stats:
+            self.db.ingestion_jobs.update_one(
+                {"job_id": self.job_id},
+                {
+                    "$inc": {
+                        "docs_done": self._docs_done,
+                        "vectors_created": self._vectors_created,
+                        **{f"stats.{field}": amount for field, amount in self._stats.items()}
+                    },
+                    "$set": {"updated_at": datetime.now(timezone.utc)}
+                }
+            )
+            self._docs_done = 0
+            self._vectors_created = 0
+            self._stats.clear()
+            ingestion_events.publish(self.job_id)
+
+    def _add_stats(self, stats: DocumentStats) -> None:
+        for field, amount in stats.values.items():
+            self._stats[field] = self._stats.get(field, 0) + amount
+
+    def _flush_if_due(self) -> None:
+        pending = len(self._statuses)
+        if pending >= self.batch_size or time.monotonic() - self._last_flush >= self.max_lag:
+            self.flush()
@@ -0,0 +1,85 @@
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+
+from pymongo import DESCENDING
+from pymongo.database import Database
+from pymongo.errors import PyMongoError
+
+from app.constants import HIGH_VOLUME_LOG_EVENTS
+
+logger = logging.getLogger(__name__)
+
+
+def rollup_logs(db: Database, now: datetime | None = None) -> tuple[datetime, datetime] | None:
+    """
+    Aggregate high-volume log events into hourly counts in log_rollups:
+    {hour, event_type, level, count, users}, where users is the number of
+    distinct user emails.
+
+    Covers every complete hour since the last rolled-up one, so missed runs
+    are caught up. Rollups are merged on (hour, event_type, level), which makes
+    concurrent or repeated runs from several workers harmless. Returns the
+    rolled-up time range, or None when there was nothing to do.
+    """
+    now = now or datetime.now(timezone.utc)
+    until = now.replace(minute=0, second=0, microsecond=0)
+
+    last_rollup = db.log_rollups.find_one({}, {"_id": 0, "hour": 1}, sort=[("hour", DESCENDING)])
+    if last_rollup is not None:
+        since = last_rollup["hour"].replace(tzinfo=timezone.utc) + timedelta(hours=1)
+    else:
+        first_log = db.logs.find_one(
+            {"event_type": {"$in": HIGH_VOLUME_LOG_EVENTS}},
+            {"_id": 0, "timestamp": 1},
+            sort=[("timestamp", 1)]
+        )
+        if first_log is None:
+            return None
+        since = first_log["timestamp"].replace(tzinfo=timezone.utc, minute=0, second=0, microsecond=0)
+
+    if since >= until:
+        return None
+
+    db.logs.aggregate([
+        {"$match": {
+            "event_type": {"$in": HIGH_VOLUME_LOG_EVENTS},
+            "timestamp": {"$gte": since, "$lt": until}
+        }},
+        {"$group": {
+            "_id": {
+                "hour": {"$dateTrunc": {"date": "$timestamp", "unit": "hour"}},
+                "event_type": "$event_type",
+                "level": "$level"
+            },
+            "count": {"$sum": 1},
+            "users": {"$addToSet": "$user_email"}
+        }},
+        {"$project": {
+            "_id": 0,
+            "hour": "$_id.hour",
+            "event_type": "$_id.event_type",
+            "level": "$_id.level",
+            "count": 1,
+            "users": {"$size": {"$setDifference": ["$users", [None]]}}
+        }},
+        {"$merge": {
+            "into": "log_rollups",
+            "on": ["hour", "event_type", "level"],
+            "whenMatched": "replace",
+            "whenNotMatched": "insert"
+        }}
+    ])
+    return since, until
+
+
+async def run_log_rollups(db: Database, interval: float) -> None:
+    """Roll up logs every interval seconds until cancelled."""
+    while True:
+        try:
+            rolled_up = await asyncio.to_thread(rollup_logs, db)
+            if rolled_up is not None:
+                logger.info(f"Rolled up high-volume log events from {rolled_up[0]} to {rolled_up[1]}")
+        except PyMongoError as e:
+            logger.warning(f"Log rollup failed: {str(e)}")
+        await asyncio.sleep(interval)
@@ -0,0 +1,48 @@
+from pymongo import ASCENDING
+from pymongo.collection import Collection
+from pymongo.cursor import Cursor
+
+from app.exceptions import InvalidCursorError
+
+
+def paginate(
+    collection: Collection,
+    query: dict,
+    sort: list[tuple[str, int]],
+    projection: dict,
+    limit: int | None,
+    after: str | None = None
+) -> Cursor:
+    """
+    Return one page of a keyset (cursor) paginated query.
+
+    The last sort field must be unique, and `after` is its value in the last item
+    of the previous page. Any other sort fields are read from that item, so each
+    page is a range scan on the matching compound index instead of a skip over
+    every earlier item, and pages stay stable while items are added. A limit of
+    None returns every item after the cursor.
+    """
+    if after is not None:
+        unique_field = sort[-1][0]
+        if len(sort) == 1:
+            last = {unique_field: after}
+        else:
+            last = collection.find_one(
+                {**query, unique_field: after},
+                {"_id": 0, **{field: 1 for field, _ in sort}}
+            )
+            if last is None:
+                raise InvalidCursorError(f"No item with {unique_field} {after} to continue from")
+        query = {"$and": [query, {"$or": _after_clauses(sort, last)}]}
+
+    cursor = collection.find(query, projection).sort(sort)
+    return cursor if limit is None else cursor.limit(limit)
+
+
+def _after_clauses(sort: list[tuple[str, int]], last: dict) -> list[dict]:
+    clauses = []
+    for position, (field, direction) in enumerate(sort):
+        clause = {previous: last.get(previous) for previous, _ in sort[:position]}
+        clause[field] = {"$gt" if direction == ASCENDING else "$lt": last.get(field)}
+        clauses.append(clause)
+    return clauses
@@ -0,0 +1,275 @@
+"""
+Sampling profiler for finding hot spots in a running deployment.
+
+A daemon thread reads the stack of every thread with sys._current_frames()
+every interval and counts identical stacks, so profiled code runs unmodified
+and the overhead is one stack walk per thread per sample. Profiles are stored
+in the profiles collection in the folded format read by flamegraph.pl and
+speedscope: one "outer;...;inner count" line per distinct stack.
+"""
+import sys
+import threading
+import uuid
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from types import FrameType
+from typing import Callable, Collection, Iterator
+
+from pymongo import ReturnDocument
+from pymongo.database import Database
+from pymongo.errors import PyMongoError
+
+from app.exceptions import (
+    IngestionJobNotFoundError,
+    ProfileJobNotRunnableError,
+    ProfileNotFoundError,
+    ProfilerBusyError
+)
+from app.models.ingestion import IngestionStatus
+from app.models.profile import ProfileKind, ProfileResponse, ProfileStatus
+from app.services.log import log_event
+from app.services.pagination import paginate
+
+
+# Distinct stacks kept per profile, most frequent first; keeps a profile far
+# below MongoDB's 16 MB document limit
+MAX_PROFILE_STACKS = 5000
+
+PROFILE_RESPONSE_PROJECTION = {"_id": 0, **{field: 1 for field in ProfileResponse.model_fields}}
+
+# Newest first, with profile_id as the unique tie-breaker that `after` refers to
+PROFILE_LIST_SORT = [("created_at", -1), ("profile_id", -1)]
+
+
+class StackSampler:
+    """
+    Counts the folded stacks of the sampled threads every interval seconds.
+    thread_filter, if given, returns the ids of the threads to sample at each tick.
+    """
+
+    def __init__(self, interval: float, thread_filter: Callable[[], Collection[int]] | None = None):
+        self.interval = interval
+        self.thread_filter = thread_filter
+        self.stacks: Counter[str] = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def folded(self, max_stacks: int = MAX_PROFILE_STACKS) -> str:
+        return "\n".join(f"{stack} {count}" for stack, count in self.stacks.most_common(max_stacks))
+
+    def _run(self) -> None:
+        sampler_thread = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            threads = None if self.thread_filter is None else self.thread_filter()
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == sampler_thread or (threads is not None and thread_id not in threads):
+                    continue
+                self.stacks[_fold(frame)] += 1
+            self.samples += 1
+
+
+def _can_run_again(job: dict) -> bool:
+    if job["status"] in (IngestionStatus.QUEUED.value, IngestionStatus.RUNNING.value):
+        return True
+    return job["status"] == IngestionStatus.FAILED.value and job.get("retry_count", 0) < job.get("max_retries", 3)
+
+
+def _fold(frame: FrameType | None) -> str:
+    names = []
+    while frame is not None:
+        names.append(f"{frame.f_globals.get('__name__', '?')}.{frame.f_code.co_qualname}")
+        frame = frame.f_back
+    return ";".join(reversed(names))
+
+
+class Profiler:
+    """
+    Runs the profiles of this worker: at most one time window at a time, which
+    samples every thread, and the profiles armed for ingestion jobs, which only
+    sample the threads processing that job's documents.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._window: StackSampler | None = None
+        self._job_threads: dict[int, str] = {}
+
+    def start_window(
+        self,
+        duration_seconds: float,
+        interval_ms: int,
+        requested_by: str,
+        db: Database
+    ) -> ProfileResponse:
+        sampler = StackSampler(interval_ms / 1000)
+        with self._lock:
+            if self._window is not None:
+                raise ProfilerBusyError("A profile window is already running in this worker")
+            self._window = sampler
+
+        now = datetime.now(timezone.utc)
+        profile = {
+            "profile_id": str(uuid.uuid4()),
+            "kind": ProfileKind.WINDOW.value,
+            "status": ProfileStatus.RUNNING.value,
+            "job_id": None,
+            "interval_ms": interval_ms,
+            "duration_seconds": duration_seconds,
+            "requested_by": requested_by,
+            "created_at": now,
+            "started_at": now,
+            "ended_at": None,
+            "samples": 0
+        }
+        try:
+            db.profiles.insert_one(dict(profile))
+        except PyMongoError:
+            with self._lock:
+                self._window = None
+            raise
+
+        sampler.start()
+        timer = threading.Timer(duration_seconds, self._finish_window, args=(profile["profile_id"], sampler, db))
+        timer.daemon = True
+        timer.start()
+        return ProfileResponse.model_validate(profile)
+
+    def arm_job(self, job_id: str, interval_ms: int, requested_by: str, db: Database) -> ProfileResponse:
+        """
+        Profile the next run of an ingestion job, in whichever worker processes it.
+        Runs already in progress are not affected. Refuses jobs that cannot run
+        again, whose profile would stay armed forever.
+        """
+        job = db.ingestion_jobs.find_one(
+            {"job_id": job_id},
+            {"_id": 0, "status": 1, "retry_count": 1, "max_retries": 1}
+        )
+        if job is None:
+            raise IngestionJobNotFoundError(f"Ingestion job {job_id} not found")
+        if not _can_run_again(job):
+            raise ProfileJobNotRunnableError(
+                f"Ingestion job {job_id} will not run again (status {job['status']}); "
+                "only queued, running or retryable failed jobs can be profiled"
+            )
+
+        profile = {
+            "profile_id": str(uuid.uuid4()),
+            "kind": ProfileKind.JOB.value,
+            "status": ProfileStatus.ARMED.value,
+            "job_id": job_id,
+            "interval_ms": interval_ms,
+            "duration_seconds": None,
+            "requested_by": requested_by,
+            "created_at": datetime.now(timezone.utc),
+            "started_at": None,
+            "ended_at": None,
+            "samples": 0
+        }
+        db.profiles.insert_one(dict(profile))
+        return ProfileResponse.model_validate(profile)
+
+    @contextmanager
+    def profile_job(self, job_id: str, db: Database) -> Iterator[None]:
+        """
+        Profile the enclosed run of an ingestion job if a profile is armed for it.
+        Enter it only once the run has claimed the job, so that a run that does
+        nothing leaves the profile armed for the next one.
+        """
+        try:
+            profile = db.profiles.find_one_and_update(
+                {"job_id": job_id, "status": ProfileStatus.ARMED.value},
+                {"$set": {"status": ProfileStatus.RUNNING.value, "started_at": datetime.now(timezone.utc)}},
+                projection={"_id": 0, "profile_id": 1, "interval_ms": 1},
+                return_document=ReturnDocument.AFTER
+            )
+        except PyMongoError as e:
+            log_event("profile_claim_failed", level="warning", details={"job_id": job_id, "error": str(e)})
+            profile = None
+
+        if profile is None:
+            yield
+            return
+
+        sampler = StackSampler(profile["interval_ms"] / 1000, lambda: self._threads_of(job_id))
+        sampler.start()
+        try:
+            yield
+        finally:
+            sampler.stop()
+            self._store(profile["profile_id"], sampler, db)
+
+    @contextmanager
+    def job_thread(self, job_id: str) -> Iterator[None]:
+        """Mark the current thread as working for the job while the block runs."""
+        thread_id = threading.get_ident()
+        self._job_threads[thread_id] = job_id
+        try:
+            yield
+        finally:
+            self._job_threads.pop(thread_id, None)
+
+    def _threads_of(self, job_id: str) -> set[int]:
+        return {thread_id for thread_id, owner in self._job_threads.copy().items() if owner == job_id}
+
+    def _finish_window(self, profile_id: str, sampler: StackSampler, db: Database) -> None:
+        sampler.stop()
+        try:
+            self._store(profile_id, sampler, db)
+        finally:
+            with self._lock:
+                self._window = None
+
+    def _store(self, profile_id: str, sampler: StackSampler, db: Database) -> None:
+        try:
+            db.profiles.update_one(
+                {"profile_id": profile_id},
+                {
+                    "$set": {
+                        "status": ProfileStatus.COMPLETED.value,
+                        "ended_at": datetime.now(timezone.utc),
+                        "samples": sampler.samples,
+                        "folded": sampler.folded()
+                    }
+                }
+            )
+        except PyMongoError as e:
+            log_event("profile_store_failed", level="warning", details={"profile_id": profile_id, "error": str(e)})
+
+
+profiler = Profiler()
+
+
+def list_profiles(
+    db: Database,
+    job_id: str | None = None,
+    limit: int | None = None,
+    after: str | None = None
+) -> list[ProfileResponse]:
+    profiles = paginate(
+        db.profiles,
+        {"job_id": job_id} if job_id else {},
+        PROFILE_LIST_SORT,
+        PROFILE_RESPONSE_PROJECTION,
+        limit,
+        after
+    )
+    return [ProfileResponse.model_validate(profile) for profile in profiles]
+
+
+def get_profile_output(profile_id: str, db: Database) -> str:
+    """Return a completed profile in the folded stack format."""
+    profile = db.profiles.find_one({"profile_id": profile_id}, {"_id": 0, "status": 1, "folded": 1})
+    if profile is None:
+        raise ProfileNotFoundError(f"Profile {profile_id} not found")
+    if profile["status"] != ProfileStatus.COMPLETED.value:
+        raise ProfileNotFoundError(f"Profile {profile_id} has no output yet (status {profile['status']})")
+    return profile.get("folded", "")
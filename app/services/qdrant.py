@@ -1,14 +1,21 @@
 import uuid
-from typing import Any
-
-from qdrant_client import QdrantClient
-from qdrant_client.models import Distance, VectorParams, PointStruct, Filter, FieldCondition, MatchValue
+from typing import TYPE_CHECKING, Any
 
 from app.config import settings
 from app.exceptions import VectorStoreError
+from app.metrics import track_call
+from app.services.chunker import TextChunk
+
+if TYPE_CHECKING:
+    import numpy as np
+    from qdrant_client import QdrantClient
+
+
+# Points sent per request by the batch upload
+UPLOAD_BATCH_SIZE = 256
 
 
-def create_qdrant_client() -> QdrantClient:
+def create_qdrant_client() -> "QdrantClient":
     """
     Factory function to create a Qdrant client instance.
 
@@ -16,6 +23,7 @@ def create_qdrant_client() -> QdrantClient:
     and the instance should be managed via dependency injection.
     """
     try:
+        from qdrant_client import QdrantClient
         return QdrantClient(
             url=settings.qdrant_url,
             api_key=settings.qdrant_api_key
@@ -24,13 +32,27 @@ def create_qdrant_client() -> QdrantClient:
         raise VectorStoreError(f"Failed to connect to Qdrant: {str(e)}")
 
 
-def ensure_collection_exists(client: QdrantClient, dimension: int) -> None:
+def ensure_collection_exists(client: "QdrantClient", dimension: int) -> None:
+    """
+    Create the collection for vectors of the given dimension, or verify that the
+    existing collection matches it. Changing EMBEDDING_DIMENSIONS or the model
+    requires a new QDRANT_COLLECTION_NAME (or dropping the old collection) and
+    re-ingesting.
+    """
+    from qdrant_client.models import Distance, VectorParams
+
+    existing_dimension = None
 
     try:
-        collections = client.get_collections()
+        with track_call("qdrant", "get_collections"):
+            collections = client.get_collections()
         collection_names = [col.name for col in collections.collections]
 
-        if settings.qdrant_collection_name not in collection_names:
+        if settings.qdrant_collection_name in collection_names:
+            existing_dimension = client.get_collection(
+                settings.qdrant_collection_name
+            ).config.params.vectors.size
+        else:
             client.create_collection(
                 collection_name=settings.qdrant_collection_name,
                 vectors_config=VectorParams(size=dimension, distance=Distance.COSINE)
@@ -51,72 +73,88 @@ def ensure_collection_exists(client: QdrantClient, dimension: int) -> None:
     except Exception as e:
         raise VectorStoreError(f"Failed to ensure collection exists: {str(e)}")
 
+    if existing_dimension is not None and existing_dimension != dimension:
+        raise VectorStoreError(
+            f"Collection {settings.qdrant_collection_name} stores {existing_dimension}-dimensional "
+            f"vectors but the embedder produces {dimension}-dimensional vectors"
+        )
+
 
 def store_vectors(
-    client: QdrantClient,
+    client: "QdrantClient",
     course_code: str,
     document_id: str,
-    vectors: list[list[float]],
-    chunks: list[str],
+    vectors: "np.ndarray",
+    chunks: list[TextChunk],
     metadata: dict[str, Any] | None = None
 ) -> int:
+    """
+    Store a document's chunk vectors. vectors is passed to Qdrant's batch upload
+    as a float32 array, so individual floats are never boxed into Python objects.
+    """
 
     if len(vectors) != len(chunks):
         raise VectorStoreError("Number of vectors must match number of chunks")
 
     try:
-        points = []
-        for i, (vector, chunk) in enumerate(zip(vectors, chunks)):
-            point_id = str(uuid.uuid4())
-            payload = {
+        payloads = [
+            {
                 "course_code": course_code,
                 "document_id": document_id,
                 "chunk_index": i,
-                "chunk_text": chunk,
+                "chunk_text": chunk.text,
+                "page_start": chunk.page_start,
+                "page_end": chunk.page_end,
+                "char_start": chunk.char_start,
+                "char_end": chunk.char_end,
                 **(metadata or {})
             }
+            for i, chunk in enumerate(chunks)
+        ]
 
-            points.append(PointStruct(
-                id=point_id,
-                vector=vector,
-                payload=payload
-            ))
-
-        client.upsert(
-            collection_name=settings.qdrant_collection_name,
-            points=points
-        )
+        with track_call("qdrant", "upload_collection"):
+            client.upload_collection(
+                collection_name=settings.qdrant_collection_name,
+                vectors=vectors,
+                payload=payloads,
+                ids=[str(uuid.uuid4()) for _ in chunks],
+                batch_size=UPLOAD_BATCH_SIZE,
+                wait=True
+            )
 
-        return len(points)
+        return len(payloads)
 
     except Exception as e:
         raise VectorStoreError(f"Failed to store vectors: {str(e)}")
 
 
-def delete_document_vectors(client: QdrantClient, document_id: str) -> None:
+def delete_document_vectors(client: "QdrantClient", document_id: str) -> None:
+    from qdrant_client.models import Filter, FieldCondition, MatchValue
 
     try:
-        client.delete(
-            collection_name=settings.qdrant_collection_name,
-            points_selector=Filter(
-                must=[
-                    FieldCondition(
-                        key="document_id",
-                        match=MatchValue(value=document_id)
-                    )
-                ]
+        with track_call("qdrant", "delete"):
+            client.delete(
+                collection_name=settings.qdrant_collection_name,
+                points_selector=Filter(
+                    must=[
+                        FieldCondition(
+                            key="document_id",
+                            match=MatchValue(value=document_id)
+                        )
+                    ]
+                )
             )
-        )
     except Exception as e:
         raise VectorStoreError(f"Failed to delete document vectors: {str(e)}")
 
 
 def search_vectors(
-    client: QdrantClient,
+    client: "QdrantClient",
     query_vector: list[float],
     course_code: str | None = None,
     limit: int = 10
 ) -> list[dict[str, Any]]:
+    from qdrant_client.models import Filter, FieldCondition, MatchValue
 
     try:
         search_filter = None
@@ -130,12 +168,13 @@ def search_vectors(
                 ]
             )
 
-        results = client.search(
-            collection_name=settings.qdrant_collection_name,
-            query_vector=query_vector,
-            query_filter=search_filter,
-            limit=limit
-        )
+        with track_call("qdrant", "search"):
+            results = client.search(
+                collection_name=settings.qdrant_collection_name,
+                query_vector=query_vector,
+                query_filter=search_filter,
+                limit=limit
+            )
 
         return [
             {
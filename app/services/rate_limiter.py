@@ -0,0 +1,50 @@
+import asyncio
+import threading
+import time
+
+
+class RateLimiter:
+    """
+    Token-bucket limiter for requests per minute and tokens per minute.
+
+    State is guarded by a thread lock rather than an asyncio primitive, so one
+    limiter can be shared by calls running on different event loops and threads.
+    """
+
+    def __init__(self, requests_per_minute: int, tokens_per_minute: int):
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self._requests = float(requests_per_minute)
+        self._tokens = float(tokens_per_minute)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    async def acquire(self, tokens: int) -> None:
+        """Wait until one request carrying the given number of tokens is allowed."""
+        # A single request larger than the per-minute budget would wait forever
+        tokens = min(tokens, self.tokens_per_minute)
+        while True:
+            with self._lock:
+                self._refill()
+                if self._requests >= 1 and self._tokens >= tokens:
+                    self._requests -= 1
+                    self._tokens -= tokens
+                    return
+                wait = max(
+                    (1 - self._requests) * 60 / self.requests_per_minute,
+                    (tokens - self._tokens) * 60 / self.tokens_per_minute
+                )
+            await asyncio.sleep(wait)
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._updated
+        self._updated = now
+        self._requests = min(
+            float(self.requests_per_minute),
+            self._requests + elapsed * self.requests_per_minute / 60
+        )
+        self._tokens = min(
+            float(self.tokens_per_minute),
+            self._tokens + elapsed * self.tokens_per_minute / 60
+        )
@@ -1,9 +1,10 @@
 import re
-import boto3
+
 from botocore.exceptions import ClientError
 
 from app.config import settings
 from app.exceptions import StorageUploadError, StorageDownloadError, StorageDeleteError, StorageURLError
+from app.metrics import track_call
 
 
 def validate_s3_config() -> None:
@@ -72,6 +73,8 @@ def validate_expiration(expiration: int) -> None:
 
 
 def get_s3_client():
+    import boto3
+
     validate_s3_config()
     return boto3.client(
         "s3",
@@ -85,12 +88,13 @@ def upload_file_to_s3(file_obj, s3_key: str, content_type: str) -> None:
     validate_s3_key(s3_key)
     s3_client = get_s3_client()
     try:
-        s3_client.put_object(
-            Bucket=settings.s3_bucket_name,
-            Key=s3_key,
-            Body=file_obj,
-            ContentType=content_type,
-        )
+        with track_call("s3", "put_object"):
+            s3_client.put_object(
+                Bucket=settings.s3_bucket_name,
+                Key=s3_key,
+                Body=file_obj,
+                ContentType=content_type,
+            )
     except ClientError as e:
         raise StorageUploadError(f"Failed to upload file to S3: {str(e)}") from e
 
@@ -114,7 +118,8 @@ def delete_file_from_s3(s3_key: str) -> None:
     validate_s3_key(s3_key)
     s3_client = get_s3_client()
     try:
-        s3_client.delete_object(Bucket=settings.s3_bucket_name, Key=s3_key)
+        with track_call("s3", "delete_object"):
+            s3_client.delete_object(Bucket=settings.s3_bucket_name, Key=s3_key)
     except ClientError as e:
         raise StorageDeleteError(f"Failed to delete file from S3: {str(e)}") from e
 
@@ -123,7 +128,45 @@ def download_file_from_s3(s3_key: str) -> bytes:
     validate_s3_key(s3_key)
     s3_client = get_s3_client()
     try:
-        response = s3_client.get_object(Bucket=settings.s3_bucket_name, Key=s3_key)
-        return response["Body"].read()
+        with track_call("s3", "get_object"):
+            response = s3_client.get_object(Bucket=settings.s3_bucket_name, Key=s3_key)
+            return response["Body"].read()
     except ClientError as e:
         raise StorageDownloadError(f"Failed to download file from S3: {str(e)}") from e
+
+
+def download_file_from_s3_if_exists(s3_key: str) -> bytes | None:
+    """Download an object, returning None instead of raising if it does not exist."""
+    validate_s3_key(s3_key)
+    s3_client = get_s3_client()
+    try:
+        # A separate operation label, so that its latency is not mixed with get_object's
+        with track_call("s3", "get_object_if_exists"):
+            try:
+                response = s3_client.get_object(Bucket=settings.s3_bucket_name, Key=s3_key)
+            except ClientError as e:
+                # Handled inside track_call: an expected miss is not a failed call
+                if e.response.get("Error", {}).get("Code") in ("NoSuchKey", "404"):
+                    return None
+                raise
+            return response["Body"].read()
+    except ClientError as e:
+        raise StorageDownloadError(f"Failed to download file from S3: {str(e)}") from e
+
+
+def delete_prefix_from_s3(prefix: str) -> None:
+    """Delete every object whose key starts with the given prefix."""
+    validate_s3_key(prefix)
+    s3_client = get_s3_client()
+    try:
+        with track_call("s3", "delete_prefix"):
+            paginator = s3_client.get_paginator("list_objects_v2")
+            for page in paginator.paginate(Bucket=settings.s3_bucket_name, Prefix=prefix):
+                keys = [{"Key": obj["Key"]} for obj in page.get("Contents", [])]
+                if keys:
+                    s3_client.delete_objects(
+                        Bucket=settings.s3_bucket_name,
+                        Delete={"Objects": keys, "Quiet": True}
+                    )
+    except ClientError as e:
+        raise StorageDeleteError(f"Failed to delete files from S3: {str(e)}") from e
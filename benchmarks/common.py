@@ -0,0 +1,105 @@
+"""
+Shared helpers for the benchmark scripts.
+
+Benchmarks are run from the repository root as modules, e.g.:
+
+    python -m benchmarks.embedding_backends
+"""
+import os
+import textwrap
+import time
+from contextlib import contextmanager
+
+
+# app.config requires these settings at import time; benchmarks that do not talk to
+# the real services only need placeholders. Values from the environment or .env win.
+PLACEHOLDER_ENVIRONMENT = {
+    "MONGODB_URI": "mongodb://localhost:27017",
+    "MONGODB_DATABASE": "cetec_assistant_benchmark",
+    "GOOGLE_CLIENT_ID": "benchmark.apps.googleusercontent.com",
+    "CORS_ORIGINS": "http://localhost:3000",
+    "AWS_ACCESS_KEY_ID": "benchmark",
+    "AWS_SECRET_ACCESS_KEY": "benchmark",
+    "AWS_REGION": "us-east-1",
+    "S3_BUCKET_NAME": "cetec-benchmark",
+}
+
+
+def configure_environment(**overrides: str) -> None:
+    """Must be called before importing anything from the app package."""
+    for name, value in PLACEHOLDER_ENVIRONMENT.items():
+        os.environ.setdefault(name, value)
+    for name, value in overrides.items():
+        os.environ[name.upper()] = value
+
+
+def sample_texts(count: int, words: int = 120) -> list[str]:
+    """Deterministic, prose-like texts of roughly chunk size."""
+    vocabulary = (
+        "the course covers linear algebra calculus probability statistics signal "
+        "processing control systems thermodynamics materials structures circuits "
+        "algorithms data networks students must submit reports before each exam "
+        "lecture notes describe examples proofs exercises and laboratory practice"
+    ).split()
+    texts = []
+    for i in range(count):
+        tokens = [vocabulary[(i * 7 + j * 13) % len(vocabulary)] for j in range(words)]
+        texts.append(" ".join(tokens).capitalize() + ".")
+    return texts
+
+
+def sample_pages(count: int, lines_per_page: int = 50, seed: int = 0) -> list[list[str]]:
+    """Page texts as lines of at most 90 characters; different seeds give different texts."""
+    words_per_page = lines_per_page * 14
+    texts = sample_texts(count * 8 + seed, words=words_per_page // 8)[seed:]
+    pages = []
+    for page in range(count):
+        paragraphs = texts[page * 8:(page + 1) * 8]
+        lines = []
+        for paragraph in paragraphs:
+            lines.extend(textwrap.wrap(paragraph, 90))
+            lines.append("")
+        pages.append(lines[:lines_per_page])
+    return pages
+
+
+def make_pdf(pages: list[list[str]]) -> bytes:
+    """A minimal PDF with one Helvetica text line per entry, extractable by pypdf."""
+    page_numbers = [4 + 2 * index for index in range(len(pages))]
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [%s] /Count %d >>" % (
+            b" ".join(b"%d 0 R" % number for number in page_numbers), len(pages)
+        ),
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    for number, lines in zip(page_numbers, pages):
+        escaped = (line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)") for line in lines)
+        stream = ("BT /F1 10 Tf 12 TL 50 770 Td " + "".join(f"({line}) Tj T* " for line in escaped) + "ET").encode("latin-1")
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % (number + 1)
+        )
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream))
+
+    pdf = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(pdf))
+        pdf += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref = len(pdf)
+    pdf += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    pdf += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    pdf += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    return bytes(pdf)
+
+
+@contextmanager
+def timer():
+    """Yields a dict whose "seconds" key is set when the block exits."""
+    result = {"seconds": 0.0}
+    start = time.perf_counter()
+    try:
+        yield result
+    finally:
+        result["seconds"] = time.perf_counter() - start
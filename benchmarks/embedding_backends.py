@@ -0,0 +1,73 @@
+"""
+Throughput and output-parity benchmark for the LocalEmbedder backends.
+
+Embeds the same texts with the PyTorch reference and each candidate backend,
+reports chunks/second, and fails if any candidate's embeddings drift from the
+reference below the cosine-similarity threshold.
+
+    python -m benchmarks.embedding_backends --backends onnx openvino
+    python -m benchmarks.embedding_backends --backends onnx \\
+        --model-file onnx/model_qint8_avx512_vnni.onnx --min-cosine 0.97
+"""
+import argparse
+import sys
+
+from benchmarks.common import configure_environment, sample_texts, timer
+
+configure_environment()
+
+import numpy as np
+
+from app.config import settings
+from app.services.embedder import LocalEmbedder
+
+
+def measure(embedder: LocalEmbedder, texts: list[str], batch_size: int) -> tuple[np.ndarray, float]:
+    embedder.embed_batch(texts[:batch_size])  # warm-up
+    vectors = []
+    with timer() as elapsed:
+        for start in range(0, len(texts), batch_size):
+            vectors.extend(embedder.embed_batch(texts[start:start + batch_size]))
+    return np.asarray(vectors, dtype=np.float32), len(texts) / elapsed["seconds"]
+
+
+def cosine_similarities(reference: np.ndarray, candidate: np.ndarray) -> np.ndarray:
+    reference = reference / np.linalg.norm(reference, axis=1, keepdims=True)
+    candidate = candidate / np.linalg.norm(candidate, axis=1, keepdims=True)
+    return np.sum(reference * candidate, axis=1)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--model", default=settings.embedding_model)
+    parser.add_argument("--backends", nargs="+", default=["onnx"], choices=["onnx", "openvino"])
+    parser.add_argument("--model-file", default=None, help="Exported model file for the candidate backends")
+    parser.add_argument("--texts", type=int, default=512)
+    parser.add_argument("--batch-size", type=int, default=64)
+    parser.add_argument("--min-cosine", type=float, default=0.99)
+    args = parser.parse_args()
+
+    texts = sample_texts(args.texts)
+
+    reference, reference_rate = measure(LocalEmbedder(args.model), texts, args.batch_size)
+    print(f"{'backend':<12} {'chunks/s':>10} {'speedup':>8} {'min cos':>8} {'mean cos':>9}")
+    print(f"{'torch':<12} {reference_rate:>10.1f} {1.0:>8.2f} {1.0:>8.4f} {1.0:>9.4f}")
+
+    failed = False
+    for backend in args.backends:
+        embedder = LocalEmbedder(args.model, backend=backend, model_file=args.model_file)
+        vectors, rate = measure(embedder, texts, args.batch_size)
+        similarities = cosine_similarities(reference, vectors)
+        print(
+            f"{backend:<12} {rate:>10.1f} {rate / reference_rate:>8.2f} "
+            f"{similarities.min():>8.4f} {similarities.mean():>9.4f}"
+        )
+        if similarities.min() < args.min_cosine:
+            print(f"  parity check failed: min cosine {similarities.min():.4f} < {args.min_cosine}")
+            failed = True
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
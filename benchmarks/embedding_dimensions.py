@@ -0,0 +1,74 @@
+"""
+Recall impact of reduced embedding dimensions for the local model.
+
+Embeds a corpus and a set of queries once at full dimension, truncates and
+renormalizes the vectors to each reduced dimension (as LocalEmbedder does with
+EMBEDDING_DIMENSIONS), then reports recall@k of the reduced-dimension nearest
+neighbors against the full-dimension ones, the nearest-neighbor search time and
+the vector memory per million chunks.
+
+    python -m benchmarks.embedding_dimensions --dimensions 64 128 192
+"""
+import argparse
+import sys
+
+from benchmarks.common import configure_environment, sample_texts, timer
+
+configure_environment()
+
+import numpy as np
+
+from app.config import settings
+from app.services.embedder import LocalEmbedder, _truncate_and_normalize
+
+
+def nearest_neighbors(queries: np.ndarray, corpus: np.ndarray, k: int) -> np.ndarray:
+    queries = queries / np.linalg.norm(queries, axis=1, keepdims=True)
+    corpus = corpus / np.linalg.norm(corpus, axis=1, keepdims=True)
+    return np.argsort(-(queries @ corpus.T), axis=1)[:, :k]
+
+
+def recall_at_k(reference: np.ndarray, candidate: np.ndarray) -> float:
+    hits = sum(len(set(ref) & set(cand)) for ref, cand in zip(reference, candidate))
+    return hits / reference.size
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--model", default=settings.embedding_model)
+    parser.add_argument("--dimensions", type=int, nargs="+", default=[64, 128, 192])
+    parser.add_argument("--corpus", type=int, default=2000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("-k", type=int, default=10)
+    args = parser.parse_args()
+
+    corpus_texts = sample_texts(args.corpus)
+    # Queries are short fragments of corpus texts, as a student question would be
+    query_texts = [" ".join(text.split()[5:17]) for text in sample_texts(args.queries, words=40)]
+
+    embedder = LocalEmbedder(args.model)
+    with timer() as embedding:
+        queries = embedder.embed_batch(query_texts)
+        corpus = embedder.embed_batch(corpus_texts)
+    print(f"embedded {len(query_texts)} queries and {len(corpus_texts)} texts in {embedding['seconds']:.1f} s\n")
+
+    with timer() as search:
+        reference = nearest_neighbors(queries, corpus, args.k)
+
+    print(f"{'dimension':>9} {f'recall@{args.k}':>10} {'search ms':>10} {'MB per 1M vectors':>18}")
+    print(f"{embedder.get_dimension():>9} {1.0:>10.3f} {search['seconds'] * 1000:>10.1f} {embedder.get_dimension() * 4:>18,}")
+    for dimensions in sorted(args.dimensions, reverse=True):
+        reduced_queries = _truncate_and_normalize(queries, dimensions)
+        reduced_corpus = _truncate_and_normalize(corpus, dimensions)
+        with timer() as search:
+            candidate = nearest_neighbors(reduced_queries, reduced_corpus, args.k)
+        print(
+            f"{dimensions:>9} {recall_at_k(reference, candidate):>10.3f} "
+            f"{search['seconds'] * 1000:>10.1f} {dimensions * 4:>18,}"
+        )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
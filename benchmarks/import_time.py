@@ -0,0 +1,115 @@
+"""
+Import-time check for the app package.
+
+Imports each module in a fresh interpreter with `-X importtime` and fails if it
+pulls in a heavy dependency that should only be imported on use. It also reports
+the module's cumulative import time and slowest dependencies. Times are compared
+with a baseline import of the frameworks every module needs (fastapi, pymongo,
+pydantic_settings), measured the same way, so budgets are ratios to the baseline
+and hold on slow or loaded machines:
+
+    python -m benchmarks.import_time
+    python -m benchmarks.import_time --budget app.main=1.5 --top 15
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+from benchmarks.common import PLACEHOLDER_ENVIRONMENT
+
+
+# Third-party imports every app module pays for anyway
+BASELINE_MODULES = ["fastapi", "pymongo", "pydantic_settings"]
+
+# Cumulative import time budgets as multiples of the baseline import time
+DEFAULT_BUDGETS = {
+    "app.config": 0.6,
+    "app.services.ingestion": 1.0,
+    "app.main": 1.75,
+}
+
+# Heavy dependencies that must stay lazy: imported inside the functions using them
+LAZY_MODULES = [
+    "qdrant_client",
+    "boto3",
+    "pypdf",
+    "google.oauth2",
+    "openai",
+    "sentence_transformers",
+    "torch",
+    "numpy",
+    "opentelemetry.sdk",
+]
+
+
+def measure(module: str, runs: int) -> tuple[float, list[tuple[float, str]], set[str]]:
+    """
+    Return the best cumulative import time in ms, the slowest modules and the
+    lazy modules loaded. module may be a comma-separated list of modules, whose
+    times are added up.
+    """
+    environment = {**PLACEHOLDER_ENVIRONMENT, **os.environ}
+    names = [name.strip() for name in module.split(",")]
+    check = f"import sys, {module}; print(','.join(m for m in {LAZY_MODULES!r} if m in sys.modules))"
+    best = None
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", check],
+            capture_output=True,
+            text=True,
+            env=environment,
+            check=True
+        )
+        timings = []
+        for line in result.stderr.splitlines():
+            if not line.startswith("import time:") or "cumulative" in line:
+                continue
+            _, cumulative, name = line.replace("import time:", "").split("|")
+            timings.append((int(cumulative) / 1000, name.strip()))
+        total = sum(next(ms for ms, timed in reversed(timings) if timed == name) for name in names)
+        if best is None or total < best[0]:
+            best = (total, timings, set(filter(None, result.stdout.strip().split(","))))
+    total, timings, loaded = best
+    slowest = sorted(((ms, name) for ms, name in timings if name not in names), reverse=True)
+    return total, slowest, loaded
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        "--budget",
+        action="append",
+        default=[],
+        metavar="MODULE=RATIO",
+        help="Override or add a module budget as a multiple of the baseline import time"
+    )
+    parser.add_argument("--runs", type=int, default=3, help="Best of N fresh interpreters")
+    parser.add_argument("--top", type=int, default=5, help="Slowest dependencies to list per module")
+    args = parser.parse_args()
+
+    budgets = dict(DEFAULT_BUDGETS)
+    for item in args.budget:
+        module, _, ratio = item.partition("=")
+        budgets[module] = float(ratio)
+
+    baseline, _, _ = measure(", ".join(BASELINE_MODULES), args.runs)
+    print(f"{'baseline':<28} {baseline:>8.1f} ms  ({', '.join(BASELINE_MODULES)})")
+
+    failed = False
+    for module, budget in budgets.items():
+        total, slowest, loaded = measure(module, args.runs)
+        ratio = total / baseline
+        verdict = "ok" if ratio <= budget and not loaded else "FAIL"
+        failed = failed or verdict == "FAIL"
+        print(f"{module:<28} {total:>8.1f} ms  {ratio:>5.2f}x baseline (budget {budget:.2f}x)  {verdict}")
+        for ms, name in slowest[:args.top]:
+            print(f"    {ms:>8.1f} ms  {name}")
+        if loaded:
+            print(f"    eagerly imports: {', '.join(sorted(loaded))}")
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,196 @@
+"""
+End-to-end ingestion benchmark with local stand-ins.
+
+Generates a PDF corpus, uploads it to an in-process S3 (moto), and runs the
+real process_ingestion_job pipeline against mongomock (or a MongoDB server
+with --mongodb), an in-memory Qdrant and a local embedding model. Reports
+docs/sec, chunks/sec, pages/sec, peak RSS and the per-stage times recorded
+on the job, and fails when a regression threshold is not met:
+
+    python -m benchmarks.ingestion --documents 20 --pages 10
+    python -m benchmarks.ingestion --embedder hash  # pipeline overhead without the model
+    python -m benchmarks.ingestion --passes 2 --text-cache  # second pass re-ingests from the text cache
+    python -m benchmarks.ingestion --min-docs-per-second 5 --max-peak-rss-mb 1500
+
+Needs moto and mongomock from requirements-dev.txt, plus sentence-transformers
+for the local model providers.
+"""
+import argparse
+import asyncio
+import resource
+import sys
+import uuid
+import warnings
+from datetime import datetime, timezone
+
+from benchmarks.common import configure_environment, make_pdf, sample_pages, timer
+
+configure_environment(mongodb_database=f"cetec_benchmark_{uuid.uuid4().hex[:8]}")
+
+import mongomock
+from moto import mock_aws
+from pymongo.database import Database
+from qdrant_client import QdrantClient
+
+import app.database
+from app.config import settings
+from app.database import get_database
+from app.models.ingestion import IngestionJobCreate, IngestionMode, IngestionStatus, IngestionJobStats
+from app.services.embedder import BaseEmbedder, create_embedder
+from app.services.ingestion import create_ingestion_job, process_ingestion_job
+from app.services.s3 import get_s3_client, upload_file_to_s3
+from benchmarks.stubs import HashEmbedder
+
+COURSE_CODE = "BENCH-101"
+
+STAGES = ["download", "extraction", "chunking", "embedding", "upsert"]
+
+# ensure_collection_exists creates payload indexes, which the in-memory Qdrant ignores
+warnings.filterwarnings("ignore", message="Payload indexes have no effect")
+
+
+def use_mongomock() -> None:
+    """
+    Point app.database at mongomock. mongomock's find_one_and_update re-applies
+    the filter to the updated document when a projection is given, so updates
+    that change a filtered field (every job transition) return None; run it
+    unprojected and project the result instead.
+    """
+    app.database._client = mongomock.MongoClient()
+    find_one_and_update = mongomock.collection.Collection.find_one_and_update
+
+    def projected_find_one_and_update(self, filter, update, projection=None, **kwargs):
+        document = find_one_and_update(self, filter, update, **kwargs)
+        if document is None or not projection:
+            return document
+        fields = {field for field, included in projection.items() if included and field != "_id"}
+        result = {field: value for field, value in document.items() if field in fields}
+        if projection.get("_id", 1):
+            result["_id"] = document["_id"]
+        return result
+
+    mongomock.collection.Collection.find_one_and_update = projected_find_one_and_update
+
+
+def seed_corpus(db: Database, documents: int, pages: int) -> tuple[int, int]:
+    """Upload the generated PDFs and register them as course documents. Returns pages and bytes."""
+    get_s3_client().create_bucket(Bucket=settings.s3_bucket_name)
+    db.courses.insert_one({"code": COURSE_CODE, "name": "Benchmark", "description": ""})
+
+    total_bytes = 0
+    for index in range(documents):
+        document_id = str(uuid.uuid4())
+        s3_key = f"documents/{COURSE_CODE}/{document_id}/document-{index}.pdf"
+        pdf = make_pdf(sample_pages(pages, seed=index))
+        upload_file_to_s3(pdf, s3_key, "application/pdf")
+        total_bytes += len(pdf)
+        db.documents.insert_one({
+            "document_id": document_id,
+            "course_code": COURSE_CODE,
+            "filename": f"document-{index}.pdf",
+            "s3_key": s3_key,
+            "upload_timestamp": datetime.now(timezone.utc),
+            "uploaded_by": "benchmark@example.com",
+            "file_size": len(pdf),
+            "content_type": "application/pdf",
+            "status": "UPLOADED"
+        })
+    return documents * pages, total_bytes
+
+
+def run_pass(db: Database, mode: IngestionMode, embedder: BaseEmbedder, qdrant_client) -> tuple[dict, float]:
+    job = create_ingestion_job(
+        COURSE_CODE,
+        IngestionJobCreate(course_code=COURSE_CODE, mode=mode),
+        "benchmark@example.com",
+        db
+    )
+    with timer() as elapsed:
+        asyncio.run(process_ingestion_job(job.job_id, embedder, qdrant_client))
+    return db.ingestion_jobs.find_one({"job_id": job.job_id}, {"_id": 0}), elapsed["seconds"]
+
+
+def peak_rss_mb() -> float:
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--documents", type=int, default=20)
+    parser.add_argument("--pages", type=int, default=10, help="Pages per document")
+    parser.add_argument("--embedder", default="local", choices=["local", "onnx", "openvino", "hash"])
+    parser.add_argument("--model", default=settings.embedding_model)
+    parser.add_argument("--passes", type=int, default=1, help="Passes after the first re-ingest the corpus")
+    parser.add_argument("--text-cache", action="store_true", help="Cache extracted text between passes")
+    parser.add_argument("--mongodb", action="store_true", help="Use the MONGODB_URI server instead of mongomock")
+    parser.add_argument("--min-docs-per-second", type=float, default=None)
+    parser.add_argument("--min-chunks-per-second", type=float, default=None)
+    parser.add_argument("--max-peak-rss-mb", type=float, default=None)
+    args = parser.parse_args()
+
+    if not args.mongodb:
+        use_mongomock()
+    settings.text_cache_enabled = args.text_cache
+    settings.embedding_model = args.model
+    db = get_database()
+
+    with mock_aws():
+        total_pages, total_bytes = seed_corpus(db, args.documents, args.pages)
+
+        with timer() as load:
+            embedder = HashEmbedder() if args.embedder == "hash" else create_embedder(provider=args.embedder)
+            embedder.embed_batch(["warm-up"])
+        print(
+            f"corpus: {args.documents} documents, {total_pages} pages, {total_bytes / 1e6:.1f} MB; "
+            f"embedder: {args.embedder} (dimension {embedder.get_dimension()}, loaded in {load['seconds']:.1f} s)"
+        )
+
+        failed = False
+        qdrant_client = QdrantClient(":memory:")
+        try:
+            for number in range(1, args.passes + 1):
+                mode = IngestionMode.NEW if number == 1 else IngestionMode.REINGEST
+                job, seconds = run_pass(db, mode, embedder, qdrant_client)
+                stats = IngestionJobStats.model_validate(job.get("stats", {}))
+                docs_per_second = job["docs_done"] / seconds
+                chunks_per_second = stats.chunks / seconds
+
+                print(
+                    f"\npass {number} ({mode.value}): {job['status']}, {job['docs_done']}/{job['docs_total']} documents, "
+                    f"{stats.chunks} chunks in {seconds:.2f} s"
+                )
+                print(
+                    f"  {docs_per_second:.2f} docs/s  {chunks_per_second:.1f} chunks/s  "
+                    f"{stats.pages / seconds:.1f} pages/s"
+                )
+                for stage in STAGES:
+                    stage_seconds = getattr(stats, f"{stage}_seconds")
+                    print(f"  {stage:<12} {stage_seconds:>8.2f} s  {stage_seconds / seconds:>6.1%}")
+
+                if job["status"] != IngestionStatus.COMPLETED.value or job["docs_done"] != job["docs_total"]:
+                    print(f"  FAIL: job ended {job['status']} with error {job.get('error_message')!r}")
+                    failed = True
+                if args.min_docs_per_second is not None and docs_per_second < args.min_docs_per_second:
+                    print(f"  FAIL: {docs_per_second:.2f} docs/s < {args.min_docs_per_second}")
+                    failed = True
+                if args.min_chunks_per_second is not None and chunks_per_second < args.min_chunks_per_second:
+                    print(f"  FAIL: {chunks_per_second:.1f} chunks/s < {args.min_chunks_per_second}")
+                    failed = True
+        finally:
+            embedder.close()
+            if args.mongodb:
+                app.database._client.drop_database(settings.mongodb_database)
+
+    peak = peak_rss_mb()
+    print(f"\npeak RSS: {peak:.0f} MB")
+    if args.max_peak_rss_mb is not None and peak > args.max_peak_rss_mb:
+        print(f"FAIL: peak RSS {peak:.0f} MB > {args.max_peak_rss_mb}")
+        failed = True
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,159 @@
+"""
+Round trips and latency of ingestion job state transitions.
+
+Runs each transition against a real MongoDB server, both as implemented in
+app.services.ingestion (find_one_and_update with projections) and as the
+previous read-modify-read sequence, counting the commands sent to the
+ingestion_jobs collection with a pymongo command listener:
+
+    python -m benchmarks.job_transitions --iterations 500
+
+MONGODB_URI selects the server; a throwaway database is created and dropped.
+"""
+import argparse
+import statistics
+import sys
+import time
+import uuid
+from datetime import datetime, timezone
+
+from pymongo import monitoring
+
+from benchmarks.common import configure_environment
+
+
+class CommandCounter(monitoring.CommandListener):
+    def __init__(self):
+        self.count = 0
+
+    def started(self, event: monitoring.CommandStartedEvent) -> None:
+        if event.command.get(event.command_name) == "ingestion_jobs":
+            self.count += 1
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent) -> None:
+        pass
+
+    def failed(self, event: monitoring.CommandFailedEvent) -> None:
+        pass
+
+
+# Registered before app.database creates its client, so every command is seen
+counter = CommandCounter()
+monitoring.register(counter)
+
+configure_environment(mongodb_database=f"cetec_benchmark_{uuid.uuid4().hex[:8]}")
+
+from pymongo.database import Database
+
+from app.database import get_database
+from app.models.ingestion import IngestionStatus
+from app.services import ingestion
+
+
+def make_job(db: Database, status: IngestionStatus, document_ids: int) -> str:
+    job_id = str(uuid.uuid4())
+    now = datetime.now(timezone.utc)
+    db.ingestion_jobs.insert_one({
+        "job_id": job_id,
+        "course_code": "BENCH-101",
+        "status": status.value,
+        "mode": "SELECTED",
+        "document_ids": [str(uuid.uuid4()) for _ in range(document_ids)],
+        "docs_total": document_ids,
+        "docs_done": 0,
+        "vectors_created": 0,
+        "created_at": now,
+        "updated_at": now,
+        "created_by": "benchmark@example.com",
+        "error_message": "benchmark" if status == IngestionStatus.FAILED else None,
+        "retry_count": 0,
+        "max_retries": 3
+    })
+    return job_id
+
+
+def legacy_claim(job_id: str, db: Database) -> None:
+    db.ingestion_jobs.update_one(
+        {"job_id": job_id, "status": IngestionStatus.QUEUED.value},
+        {"$set": {"status": IngestionStatus.RUNNING.value, "updated_at": datetime.now(timezone.utc)}}
+    )
+    db.ingestion_jobs.find_one({"job_id": job_id})
+
+
+def legacy_cancel(job_id: str, db: Database) -> None:
+    db.ingestion_jobs.find_one({"job_id": job_id})
+    db.ingestion_jobs.update_one(
+        {"job_id": job_id},
+        {"$set": {"status": IngestionStatus.CANCELED.value, "updated_at": datetime.now(timezone.utc)}}
+    )
+    db.ingestion_jobs.find_one({"job_id": job_id})
+
+
+def legacy_retry(job_id: str, db: Database) -> None:
+    db.ingestion_jobs.find_one({"job_id": job_id})
+    db.ingestion_jobs.update_one(
+        {"job_id": job_id},
+        {
+            "$set": {"status": IngestionStatus.QUEUED.value, "error_message": None, "updated_at": datetime.now(timezone.utc)},
+            "$inc": {"retry_count": 1}
+        }
+    )
+    db.ingestion_jobs.find_one({"job_id": job_id})
+
+
+def legacy_get(job_id: str, db: Database) -> None:
+    db.ingestion_jobs.find_one({"job_id": job_id})
+
+
+# transition -> (starting status, current implementation, previous implementation)
+TRANSITIONS = {
+    "claim": (IngestionStatus.QUEUED, ingestion._claim_ingestion_job, legacy_claim),
+    "cancel": (
+        IngestionStatus.RUNNING,
+        lambda job_id, db: ingestion.cancel_ingestion_job(job_id, "benchmark@example.com", db),
+        legacy_cancel
+    ),
+    "retry": (IngestionStatus.FAILED, ingestion.retry_ingestion_job, legacy_retry),
+    "get": (IngestionStatus.RUNNING, ingestion.get_ingestion_job, legacy_get),
+}
+
+
+def run(db: Database, status: IngestionStatus, transition, iterations: int, document_ids: int) -> tuple[float, float, float]:
+    """Return round trips per call and mean/p95 latency in ms."""
+    job_ids = [make_job(db, status, document_ids) for _ in range(iterations)]
+    latencies = []
+    round_trips = 0
+    for job_id in job_ids:
+        before = counter.count
+        start = time.perf_counter()
+        transition(job_id, db)
+        latencies.append((time.perf_counter() - start) * 1000)
+        round_trips += counter.count - before
+    latencies.sort()
+    return round_trips / iterations, statistics.fmean(latencies), latencies[int(len(latencies) * 0.95) - 1]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--document-ids", type=int, default=200, help="document_ids stored on each job")
+    parser.add_argument("--transitions", nargs="+", choices=list(TRANSITIONS), default=list(TRANSITIONS))
+    args = parser.parse_args()
+
+    db = get_database()
+    db.ingestion_jobs.create_index("job_id", unique=True)
+    try:
+        print(f"{'transition':<10} {'version':<9} {'round trips':>11} {'mean ms':>8} {'p95 ms':>8}")
+        for name in args.transitions:
+            status, current, previous = TRANSITIONS[name]
+            for version, transition in (("previous", previous), ("current", current)):
+                round_trips, mean, p95 = run(db, status, transition, args.iterations, args.document_ids)
+                print(f"{name:<10} {version:<9} {round_trips:>11.1f} {mean:>8.2f} {p95:>8.2f}")
+    finally:
+        db.client.drop_database(db.name)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,258 @@
+"""
+HTTP load test of the main API endpoints with Google sign-in stubbed.
+
+Seeds a throwaway MongoDB database with a professor, a course, its documents and
+an ingestion job, starts uvicorn on benchmarks.load_test_app with each worker
+count in turn, and drives every endpoint with an asyncio client for a fixed
+time. Reports requests/sec and p50/p95/p99 latency per endpoint and worker count,
+and fails on error responses or when a p95 exceeds --max-p95-ms:
+
+    python -m benchmarks.load_test --workers 1 2 4 --concurrency 32 --duration 20
+    python -m benchmarks.load_test --endpoints users-me courses --max-p95-ms 50
+    python -m benchmarks.load_test --token-verifier mypackage.auth:verify --token <token>
+
+Bearer tokens go through --token-verifier (module:function, default: the token
+is the email address) instead of verify_google_token. MONGODB_URI selects the
+server; each worker has an in-process moto S3 bucket, an in-memory Qdrant and
+a hash embedder instead of the model, and must report healthy before the
+endpoints are measured. Needs requirements-dev.txt. The client is a single process, so at high worker counts check
+that it is not the bottleneck (its CPU use should stay below one core).
+"""
+import argparse
+import asyncio
+import os
+import signal
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import uuid
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Awaitable, Callable
+
+from benchmarks.common import configure_environment, make_pdf, sample_pages
+
+configure_environment(mongodb_database=f"cetec_benchmark_{uuid.uuid4().hex[:8]}")
+
+import httpx
+from pymongo.database import Database
+
+import app.database
+from app.config import settings
+from app.database import get_database
+from app.models.ingestion import IngestionJobCreate, IngestionMode
+from app.services.course import create_course
+from app.services.ingestion import create_ingestion_job
+from app.services.user import create_user
+
+COURSE_CODE = "LOAD-101"
+USER_EMAIL = "load-test@example.com"
+
+ENDPOINTS = ["users-me", "courses", "documents", "ingestion-status", "upload"]
+
+# Settings for the server processes: no background rollups, so that every
+# worker only serves the requests of the load test
+SERVER_ENVIRONMENT = {
+    "LOG_ROLLUP_ENABLED": "false",
+    "QUERY_PLAN_CHECK_ENABLED": "false",
+}
+
+Send = Callable[[httpx.AsyncClient], Awaitable[httpx.Response]]
+
+
+def seed(db: Database, documents: int) -> str:
+    """Create the user, course, documents and ingestion job requested by the load test. Returns the job id."""
+    create_user(USER_EMAIL, "Load Test", ["professor", "admin"], db)
+    create_course(COURSE_CODE, "Load Test", None, db)
+    db.documents.insert_many([
+        {
+            "document_id": str(uuid.uuid4()),
+            "course_code": COURSE_CODE,
+            "filename": f"document-{index}.pdf",
+            "s3_key": f"documents/{COURSE_CODE}/document-{index}.pdf",
+            "upload_timestamp": datetime.now(timezone.utc),
+            "uploaded_by": USER_EMAIL,
+            "file_size": 100_000,
+            "content_type": "application/pdf",
+            "status": "UPLOADED"
+        }
+        for index in range(documents)
+    ])
+    job = create_ingestion_job(COURSE_CODE, IngestionJobCreate(course_code=COURSE_CODE, mode=IngestionMode.NEW), USER_EMAIL, db)
+    return job.job_id
+
+
+def endpoint_requests(job_id: str, pdf: bytes) -> dict[str, Send]:
+    return {
+        "users-me": lambda client: client.get("/users/me"),
+        "courses": lambda client: client.get("/courses"),
+        "documents": lambda client: client.get("/documents/course", params={"course_code": COURSE_CODE}),
+        "ingestion-status": lambda client: client.get("/ingestions/status", params={"job_id": job_id}),
+        "upload": lambda client: client.post(
+            "/documents",
+            data={"course_code": COURSE_CODE},
+            files={"file": ("load-test.pdf", pdf, "application/pdf")}
+        ),
+    }
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(workers: int, port: int, token_verifier: str | None) -> subprocess.Popen:
+    environment = {**os.environ, **SERVER_ENVIRONMENT}
+    if token_verifier:
+        environment["LOAD_TEST_TOKEN_VERIFIER"] = token_verifier
+    return subprocess.Popen(
+        [
+            sys.executable, "-m", "uvicorn", "benchmarks.load_test_app:app",
+            "--host", "127.0.0.1",
+            "--port", str(port),
+            "--workers", str(workers),
+            "--log-level", "warning",
+            "--no-access-log"
+        ],
+        env=environment
+    )
+
+
+def wait_until_healthy(server: subprocess.Popen, base_url: str, timeout: float = 60.0) -> None:
+    deadline = time.monotonic() + timeout
+    health = "no response"
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            raise RuntimeError(f"uvicorn exited with status {server.returncode}")
+        try:
+            response = httpx.get(f"{base_url}/health", timeout=1.0)
+            if response.status_code == 200:
+                return
+            health = response.text
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError(f"the app did not report healthy within {timeout:.0f} s: {health}")
+
+
+def stop_server(server: subprocess.Popen) -> None:
+    server.send_signal(signal.SIGINT)
+    try:
+        server.wait(timeout=15)
+    except subprocess.TimeoutExpired:
+        server.kill()
+        server.wait()
+
+
+async def drive(client: httpx.AsyncClient, send: Send, concurrency: int, seconds: float) -> tuple[list[float], Counter, float]:
+    """Send requests from concurrency loops for the given time. Returns latencies, error statuses and elapsed time."""
+    latencies: list[float] = []
+    errors: Counter = Counter()
+    start = time.perf_counter()
+    deadline = start + seconds
+
+    async def loop() -> None:
+        while time.perf_counter() < deadline:
+            sent = time.perf_counter()
+            try:
+                response = await send(client)
+                if response.status_code >= 400:
+                    errors[str(response.status_code)] += 1
+            except httpx.HTTPError as e:
+                errors[type(e).__name__] += 1
+            latencies.append(time.perf_counter() - sent)
+
+    await asyncio.gather(*(loop() for _ in range(concurrency)))
+    return latencies, errors, time.perf_counter() - start
+
+
+async def measure(base_url: str, token: str, send: Send, concurrency: int, duration: float, warmup: float) -> dict:
+    async with httpx.AsyncClient(
+        base_url=base_url,
+        headers={"Authorization": f"Bearer {token}"},
+        limits=httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency),
+        timeout=60.0
+    ) as client:
+        await drive(client, send, concurrency, warmup)
+        latencies, errors, elapsed = await drive(client, send, concurrency, duration)
+
+    percentiles = statistics.quantiles(latencies, n=100, method="inclusive") if len(latencies) > 1 else latencies * 99
+    return {
+        "requests": len(latencies),
+        "throughput": len(latencies) / elapsed,
+        "p50": percentiles[49] * 1000,
+        "p95": percentiles[94] * 1000,
+        "p99": percentiles[98] * 1000,
+        "errors": errors,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4], help="uvicorn worker counts to compare")
+    parser.add_argument("--endpoints", nargs="+", default=ENDPOINTS, choices=ENDPOINTS)
+    parser.add_argument("--concurrency", type=int, default=32, help="Requests in flight")
+    parser.add_argument("--duration", type=float, default=15.0, help="Measured seconds per endpoint")
+    parser.add_argument("--warmup", type=float, default=3.0, help="Unmeasured seconds per endpoint")
+    parser.add_argument("--documents", type=int, default=100, help="Seeded documents in the course")
+    parser.add_argument("--upload-pages", type=int, default=5, help="Pages of the uploaded PDF")
+    parser.add_argument("--token-verifier", default=None, metavar="MODULE:FUNCTION")
+    parser.add_argument("--token", default=USER_EMAIL, help="Bearer token sent with every request")
+    parser.add_argument("--max-p95-ms", type=float, default=None)
+    args = parser.parse_args()
+
+    pdf = make_pdf(sample_pages(args.upload_pages))
+    db = get_database()
+    job_id = seed(db, args.documents)
+    requests = endpoint_requests(job_id, pdf)
+    endpoints = args.endpoints
+
+    print(
+        f"{len(endpoints)} endpoints, {args.concurrency} concurrent requests, "
+        f"{args.duration:.0f} s each after {args.warmup:.0f} s warm-up; upload of {len(pdf) / 1000:.0f} kB"
+    )
+
+    failed = False
+    throughput: dict[str, dict[int, float]] = {name: {} for name in endpoints}
+    try:
+        for workers in args.workers:
+            port = free_port()
+            base_url = f"http://127.0.0.1:{port}"
+            server = start_server(workers, port, args.token_verifier)
+            try:
+                wait_until_healthy(server, base_url)
+                print(f"\n{workers} worker{'s' if workers > 1 else ''}")
+                print(f"  {'endpoint':<18} {'requests':>9} {'req/s':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}  errors")
+                for name in endpoints:
+                    result = asyncio.run(measure(base_url, args.token, requests[name], args.concurrency, args.duration, args.warmup))
+                    throughput[name][workers] = result["throughput"]
+                    errors = ", ".join(f"{status} x{count}" for status, count in result["errors"].most_common()) or "-"
+                    print(
+                        f"  {name:<18} {result['requests']:>9} {result['throughput']:>9.1f} "
+                        f"{result['p50']:>9.1f} {result['p95']:>9.1f} {result['p99']:>9.1f}  {errors}"
+                    )
+                    if result["errors"]:
+                        print(f"  FAIL: {name} returned errors")
+                        failed = True
+                    if args.max_p95_ms is not None and result["p95"] > args.max_p95_ms:
+                        print(f"  FAIL: {name} p95 {result['p95']:.1f} ms > {args.max_p95_ms}")
+                        failed = True
+            finally:
+                stop_server(server)
+    finally:
+        app.database._client.drop_database(settings.mongodb_database)
+
+    if len(args.workers) > 1:
+        print("\nreq/s by worker count")
+        print(f"  {'endpoint':<18}" + "".join(f"{workers:>9}" for workers in args.workers))
+        for name in endpoints:
+            print(f"  {name:<18}" + "".join(f"{throughput[name].get(workers, 0):>9.1f}" for workers in args.workers))
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
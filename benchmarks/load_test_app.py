@@ -0,0 +1,64 @@
+"""
+The API as served to benchmarks.load_test, with Google sign-in replaced.
+
+uvicorn imports this module in every worker:
+
+    uvicorn benchmarks.load_test_app:app --workers 4
+
+LOAD_TEST_TOKEN_VERIFIER names the function, as module:attribute, that turns a
+bearer token into an email address in place of verify_google_token (default:
+accept_email_token below). Each worker gets an in-memory Qdrant and a hash
+embedder, so the app starts healthy without a model or a vector store, and
+unless LOAD_TEST_REAL_S3 is set, S3 is replaced by an in-process moto bucket.
+"""
+import importlib
+import os
+import warnings
+
+from benchmarks.common import configure_environment
+
+configure_environment()
+
+from qdrant_client import QdrantClient
+
+from app import dependencies
+from app.config import settings
+from app.exceptions import AuthenticationError
+
+
+def accept_email_token(token: str) -> str:
+    """Treat the bearer token as the signed-in email address."""
+    if "@" not in token:
+        raise AuthenticationError("Token verification failed: load test tokens are email addresses")
+    return token
+
+
+def load_token_verifier(path: str):
+    module, _, attribute = path.partition(":")
+    return getattr(importlib.import_module(module), attribute)
+
+
+# get_current_user looks verify_google_token up in app.dependencies at call time
+dependencies.verify_google_token = load_token_verifier(
+    os.environ.get("LOAD_TEST_TOKEN_VERIFIER", f"{__name__}:accept_email_token")
+)
+
+if not os.environ.get("LOAD_TEST_REAL_S3"):
+    from moto import mock_aws
+
+    from app.services.s3 import get_s3_client
+
+    mock_aws().start()
+    get_s3_client().create_bucket(Bucket=settings.s3_bucket_name)
+
+from app import main
+from benchmarks.stubs import HashEmbedder
+
+# Looked up in app.main when the lifespan starts; load_embedder still creates the collection
+main.create_qdrant_client = lambda: QdrantClient(":memory:")
+main.create_embedder = HashEmbedder
+
+# ensure_collection_exists creates payload indexes, which the in-memory Qdrant ignores
+warnings.filterwarnings("ignore", message="Payload indexes have no effect")
+
+app = main.app
@@ -0,0 +1,124 @@
+"""
+Per-row cost of turning MongoDB rows into a JSON list response.
+
+Builds synthetic rows as returned by the list queries and times each way of
+producing the response body. Every approach ends the way FastAPI handles a
+route with a response model: validate the returned value against the route's
+TypeAdapter, which accepts model instances as they are, then dump JSON bytes
+with Pydantic.
+
+    init            Model(field=...) per row (previous services)
+    construct       Model.model_construct(...) per row, skipping validation
+    list adapter    one pre-built TypeAdapter(list[Model]) call per page
+    orjson response the list adapter's models returned through ORJSONResponse,
+                    which makes FastAPI fall back to jsonable_encoder + orjson
+    ndjson          orjson.dumps per raw row, as the NDJSON streaming mode does
+
+Documents use the list adapter and users use construct: validating EmailStr
+dominates the cost of a user row.
+
+    python -m benchmarks.serialization --rows 1000 10000
+"""
+import argparse
+import sys
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Callable
+
+from benchmarks.common import configure_environment, timer
+
+configure_environment()
+
+import orjson
+from fastapi.encoders import jsonable_encoder
+from pydantic import BaseModel, TypeAdapter
+
+from app.models.document import DocumentResponse, DocumentStatus
+from app.models.user import UserResponse
+
+
+def document_rows(count: int) -> list[dict]:
+    start = datetime(2024, 3, 1, tzinfo=timezone.utc)
+    return [
+        {
+            "document_id": str(uuid.uuid4()),
+            "course_code": "CS101",
+            "filename": f"lecture_{i:05d}.pdf",
+            "s3_key": f"documents/CS101/{uuid.uuid4()}/lecture_{i:05d}.pdf",
+            "upload_timestamp": start + timedelta(minutes=i),
+            "uploaded_by": "professor@example.com",
+            "file_size": 250_000 + i,
+            "content_type": "application/pdf",
+            "status": DocumentStatus.INGESTED.value
+        }
+        for i in range(count)
+    ]
+
+
+def user_rows(count: int) -> list[dict]:
+    return [
+        {"email": f"student{i:05d}@example.com", "name": f"Student {i}", "roles": ["student"]}
+        for i in range(count)
+    ]
+
+
+def construct_document(row: dict) -> DocumentResponse:
+    # Enum fields have to be converted by hand, or serialization warns about plain strings
+    return DocumentResponse.model_construct(**{**row, "status": DocumentStatus(row["status"])})
+
+
+# dataset -> (row factory, response model, model_construct per row)
+DATASETS: dict[str, tuple[Callable[[int], list[dict]], type[BaseModel], Callable[[dict], BaseModel]]] = {
+    "documents": (document_rows, DocumentResponse, construct_document),
+    "users": (user_rows, UserResponse, lambda row: UserResponse.model_construct(**row)),
+}
+
+
+def approaches(model: type[BaseModel], construct: Callable[[dict], BaseModel]) -> dict[str, Callable[[list[dict]], bytes]]:
+    # FastAPI builds the equivalent adapter for a route returning list[model]
+    response = TypeAdapter(list[model])
+    page = TypeAdapter(list[model])
+
+    def respond(models: list) -> bytes:
+        return response.dump_json(response.validate_python(models))
+
+    return {
+        "init": lambda rows: respond([model(**row) for row in rows]),
+        "construct": lambda rows: respond([construct(row) for row in rows]),
+        "list adapter": lambda rows: respond(page.validate_python(rows)),
+        "orjson response": lambda rows: orjson.dumps(jsonable_encoder(
+            response.validate_python(page.validate_python(rows))
+        )),
+        "ndjson": lambda rows: b"\n".join(orjson.dumps(row) for row in rows) + b"\n",
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--datasets", nargs="+", choices=list(DATASETS), default=list(DATASETS))
+    parser.add_argument("--repeat", type=int, default=5, help="Best of N runs")
+    args = parser.parse_args()
+
+    for name in args.datasets:
+        make_rows, model, construct = DATASETS[name]
+        candidates = approaches(model, construct)
+        print(f"\n{name} (µs per row)")
+        print(f"{'rows':>7} " + " ".join(f"{approach:>16}" for approach in candidates))
+        for count in args.rows:
+            rows = make_rows(count)
+            results = []
+            for approach in candidates.values():
+                best = float("inf")
+                for _ in range(args.repeat):
+                    with timer() as elapsed:
+                        approach(rows)
+                    best = min(best, elapsed["seconds"])
+                results.append(best / count * 1_000_000)
+            print(f"{count:>7} " + " ".join(f"{value:>16.2f}" for value in results))
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
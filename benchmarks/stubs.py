@@ -0,0 +1,29 @@
+"""
+Stand-ins shared by the benchmarks. Import this module after
+configure_environment(), like anything from the app package.
+"""
+import hashlib
+
+import numpy as np
+
+from app.services.embedder import BaseEmbedder
+
+
+class HashEmbedder(BaseEmbedder):
+    """Deterministic random unit vectors; isolates the pipeline from model cost."""
+
+    def __init__(self, dimension: int = 384):
+        self.dimension = dimension
+
+    def embed_text(self, text: str) -> list[float]:
+        return self.embed_batch([text])[0].tolist()
+
+    def embed_batch(self, texts: list[str]) -> np.ndarray:
+        vectors = np.empty((len(texts), self.dimension), dtype=np.float32)
+        for row, text in enumerate(texts):
+            seed = int.from_bytes(hashlib.blake2b(text.encode("utf-8"), digest_size=8).digest(), "little")
+            vectors[row] = np.random.default_rng(seed).standard_normal(self.dimension)
+        return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+    def get_dimension(self) -> int:
+        return self.dimension
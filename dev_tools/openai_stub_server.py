@@ -0,0 +1,122 @@
+"""
+Local stand-in for the OpenAI embeddings endpoint.
+
+Returns deterministic unit vectors derived from each input, optionally adding
+latency and injecting 429 responses, so OpenAIEmbedder batching, concurrency
+and retry behavior can be exercised without an API key:
+
+    python dev_tools/openai_stub_server.py --port 8100 --rate-limit-probability 0.2
+
+and in .env:
+
+    EMBEDDING_PROVIDER=openai
+    OPENAI_API_KEY=stub
+    OPENAI_BASE_URL=http://localhost:8100/v1
+"""
+import argparse
+import hashlib
+import json
+import math
+import random
+import struct
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+MAX_BATCH_INPUTS = 2048
+
+
+def embed(text: str, dimension: int) -> list[float]:
+    values = []
+    counter = 0
+    while len(values) < dimension:
+        digest = hashlib.sha256(f"{counter}:{text}".encode("utf-8")).digest()
+        values.extend(value / 2**31 - 1 for value in struct.unpack("<8I", digest))
+        counter += 1
+    values = values[:dimension]
+    norm = math.sqrt(sum(value * value for value in values)) or 1.0
+    return [value / norm for value in values]
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    options: argparse.Namespace
+    stats = {"requests": 0, "inputs": 0, "rate_limited": 0, "in_flight": 0, "max_in_flight": 0}
+    stats_lock = threading.Lock()
+
+    def do_POST(self) -> None:
+        if not self.path.rstrip("/").endswith("/embeddings"):
+            self._send(404, {"error": {"message": "Not found"}})
+            return
+
+        body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+        inputs = body["input"] if isinstance(body["input"], list) else [body["input"]]
+
+        with self.stats_lock:
+            self.stats["requests"] += 1
+            self.stats["in_flight"] += 1
+            self.stats["max_in_flight"] = max(self.stats["max_in_flight"], self.stats["in_flight"])
+        try:
+            if len(inputs) > MAX_BATCH_INPUTS:
+                self._send(400, {"error": {"message": f"Too many inputs: {len(inputs)}"}})
+                return
+
+            if random.random() < self.options.rate_limit_probability:
+                with self.stats_lock:
+                    self.stats["rate_limited"] += 1
+                self._send(429, {"error": {"message": "Rate limit reached", "type": "requests"}})
+                return
+
+            time.sleep(self.options.latency)
+            with self.stats_lock:
+                self.stats["inputs"] += len(inputs)
+
+            dimension = body.get("dimensions") or self.options.dimension
+            self._send(200, {
+                "object": "list",
+                "model": body.get("model", "stub"),
+                "data": [
+                    {"object": "embedding", "index": index, "embedding": embed(text, dimension)}
+                    for index, text in enumerate(inputs)
+                ],
+                "usage": {"prompt_tokens": 0, "total_tokens": 0}
+            })
+        finally:
+            with self.stats_lock:
+                self.stats["in_flight"] -= 1
+
+    def do_GET(self) -> None:
+        if self.path == "/stats":
+            with self.stats_lock:
+                self._send(200, dict(self.stats))
+        else:
+            self._send(404, {"error": {"message": "Not found"}})
+
+    def _send(self, status: int, payload: dict) -> None:
+        data = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8100)
+    parser.add_argument("--dimension", type=int, default=1536)
+    parser.add_argument("--latency", type=float, default=0.05, help="Seconds added to each successful request")
+    parser.add_argument("--rate-limit-probability", type=float, default=0.0)
+    StubHandler.options = parser.parse_args()
+
+    server = ThreadingHTTPServer((StubHandler.options.host, StubHandler.options.port), StubHandler)
+    print(f"OpenAI stub listening on http://{StubHandler.options.host}:{StubHandler.options.port}/v1 (stats at /stats)")
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()